@@ -0,0 +1,152 @@
+import os
+import sys
+import time
+import numpy as np
+from wordstore import WordStore, word_mask
+
+SCORE_VERSION = 1
+TIERS = ("Easy", "Medium", "Hardest")  # engine.DIFFICULTY_KEYS values, easiest first
+MAX_WRONG = 6
+LETTER_SHIFTS = np.arange(26, dtype=np.uint32)
+
+
+# ---------------------------------------------------
+# COLUMNS (straight from the store's mmap, no per-word Python)
+# ---------------------------------------------------
+def word_columns(bank, key):
+    n = bank.count(key)
+    if isinstance(bank, WordStore):
+        col = bank.banks[key]["words"]
+        offsets = np.frombuffer(bank.mm, dtype="<u4", count=n + 1, offset=col.offsets_at).astype(np.int64)
+        blob = np.frombuffer(bank.mm, dtype=np.uint8, count=int(offsets[-1]), offset=col.blob_at).copy()
+        masks = np.frombuffer(bank.mm, dtype="<u4", count=n, offset=bank.banks[key]["masks"]).copy()
+        return offsets, blob, masks
+    words = [bank.word(key, i) for i in range(n)]
+    blob = np.frombuffer("".join(words).encode("utf-8"), dtype=np.uint8)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(w.encode("utf-8")) for w in words])
+    masks = np.array([word_mask(w) for w in words], dtype=np.uint32)
+    return offsets, blob, masks
+
+
+# =============================================================================
+# ANALYZER (Per-word difficulty features over the whole bank)
+# =============================================================================
+# Features, all vectorised over every word at once:
+#   length    letters in the word
+#   distinct  distinct letters (popcount of the letter mask)
+#   rarity    mean -log(frequency) of the word's letters across the bank
+#   wrong     wrong guesses a guesser makes calling letters in bank
+#             frequency order until the word is solved (capped at 6)
+# score = wrong + rarity scaled to [0, 1]; higher is harder.
+def analyze(bank):
+    keys = list(bank.keys())
+    cols = {key: word_columns(bank, key) for key in keys}
+
+    counts = np.zeros(26, dtype=np.int64)
+    for offsets, blob, masks in cols.values():
+        letters = blob[(blob >= 65) & (blob <= 90)]
+        counts += np.bincount(letters - 65, minlength=26)
+    freq = (counts + 1) / (counts.sum() + 26)
+    letter_cost = -np.log(freq)
+    rank = np.empty(26, dtype=np.int64)
+    rank[np.argsort(-counts, kind="stable")] = np.arange(26)
+
+    features = {}
+    for key, (offsets, blob, masks) in cols.items():
+        bits = ((masks[:, None] >> LETTER_SHIFTS) & 1).astype(np.uint8)
+        distinct = bits.sum(axis=1, dtype=np.int64)
+        rarity = (bits @ letter_cost) / np.maximum(distinct, 1)
+        last = (bits * (rank + 1)).max(axis=1, initial=0)
+        wrong = np.minimum(last - distinct, MAX_WRONG)
+        features[key] = {"length": np.diff(offsets), "distinct": distinct, "rarity": rarity, "wrong": wrong}
+
+    all_rarity = np.concatenate([f["rarity"] for f in features.values()]) if features else np.zeros(0)
+    lo, hi = (all_rarity.min(), all_rarity.max()) if len(all_rarity) else (0.0, 1.0)
+    for f in features.values():
+        f["score"] = f["wrong"] + (f["rarity"] - lo) / max(hi - lo, 1e-9)
+    return features
+
+
+# Splits the whole bank into equal thirds by score; returns
+# {tier: (source key ids, source indices)} ordered easiest first.
+def bucket(keys, features):
+    if not keys: return {tier: (np.zeros(0, np.uint8), np.zeros(0, np.uint32)) for tier in TIERS}
+    score = np.concatenate([features[k]["score"] for k in keys])
+    length = np.concatenate([features[k]["length"] for k in keys])
+    key_ids = np.concatenate([np.full(len(features[k]["score"]), i, dtype=np.uint8) for i, k in enumerate(keys)])
+    local = np.concatenate([np.arange(len(features[k]["score"]), dtype=np.uint32) for k in keys])
+    order = np.lexsort((length, score))
+    return {tier: (key_ids[part], local[part]) for tier, part in zip(TIERS, np.array_split(order, len(TIERS)))}
+
+
+# =============================================================================
+# CLASS: SCORED BANK (Store re-bucketed into tiers by score)
+# =============================================================================
+# Same interface as WordStore, but its keys are the scored tiers, so
+# HangmanEngine and WordScheduler use it unchanged. Features and buckets are
+# saved next to the compiled store (cache/words.scores.npz) and recomputed
+# when the store's source changes. open() raises ValueError when the store
+# can't be scored; failing to write the cache only costs the next start.
+class ScoredBank:
+    def __init__(self, store, keys, buckets):
+        self.store = store
+        self.source = list(store.source) + ["scored", SCORE_VERSION]
+        self.src_keys = keys
+        self.buckets = buckets
+
+    @classmethod
+    def open(cls, store, path):
+        source = np.array(list(store.source) + [SCORE_VERSION], dtype=np.int64)
+        try:
+            with np.load(path) as data:
+                if np.array_equal(data["source"], source):
+                    keys = [str(k) for k in data["keys"]]
+                    return cls(store, keys, {t: (data[f"{t}_keys"], data[f"{t}_index"]) for t in TIERS})
+        except (OSError, KeyError, ValueError):
+            pass
+        keys = store.keys()
+        try:
+            features = analyze(store)
+            buckets = bucket(keys, features)
+        except (ValueError, IndexError, TypeError, OverflowError) as e:
+            raise ValueError(f"can't score word store: {e}") from e
+        arrays = {"source": source, "keys": np.array(keys)}
+        for t, (key_ids, local) in buckets.items():
+            arrays[f"{t}_keys"] = key_ids
+            arrays[f"{t}_index"] = local
+        for k, f in features.items():
+            for name, values in f.items(): arrays[f"{k}_{name}"] = values
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp.npz"
+            np.savez(tmp, **arrays)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+        return cls(store, keys, buckets)
+
+    def locate(self, key, i):
+        key_ids, local = self.buckets[key]
+        return self.src_keys[key_ids[i]], int(local[i])
+
+    def keys(self): return list(TIERS)
+    def count(self, key): return len(self.buckets[key][0]) if key in self.buckets else 0
+    def word(self, key, i): return self.store.word(*self.locate(key, i))
+    def mask(self, key, i): return self.store.mask(*self.locate(key, i))
+    def meaning(self, key, i): return self.store.meaning(*self.locate(key, i))
+    def hint(self, key, i): return self.store.hint(*self.locate(key, i))
+
+
+if __name__ == "__main__":
+    # python analyzer.py [words.json]: time a full scoring pass and show the tiers
+    base = os.path.dirname(os.path.abspath(__file__))
+    source = sys.argv[1] if len(sys.argv) > 1 else os.path.join(base, "words.json")
+    store = WordStore.open(source, os.path.join(base, "cache", os.path.splitext(os.path.basename(source))[0] + ".bin"))
+    start = time.perf_counter()
+    features = analyze(store)
+    buckets = bucket(store.keys(), features)
+    print(f"Scored {sum(store.count(k) for k in store.keys())} words in {(time.perf_counter() - start) * 1000:.0f} ms")
+    for tier, (key_ids, local) in buckets.items():
+        sample = [store.word(store.keys()[k], int(i)) for k, i in list(zip(key_ids, local))[:5]]
+        print(f"{tier}: {len(local)} words, e.g. {', '.join(sample)}")
@@ -0,0 +1,480 @@
+import os
+import json
+import hashlib
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageEnhance, ImageTk
+
+CACHE_VERSION = 2
+CACHE_MAGIC = b"HGAC"
+
+# =============================================================================
+# CLASS: ASSET CACHE (Pre-scaled pixels on disk)
+# =============================================================================
+# Every resized variant is stored as raw pixels under cache/assets/<W>x<H>/,
+# keyed by source path, source mtime/size, target size, resample filter and
+# variant name. A warm start reads the bytes straight back with frombytes()
+# instead of decoding the PNG and running LANCZOS again.
+class AssetCache:
+    def __init__(self, root_dir, screen_size):
+        self.screen_size = tuple(screen_size)
+        self.root_dir = root_dir
+        self.dir = os.path.join(root_dir, f"{self.screen_size[0]}x{self.screen_size[1]}")
+        self.hits = 0
+        self.misses = 0
+        self.enabled = True
+        try:
+            os.makedirs(self.dir, exist_ok=True)
+        except OSError:
+            self.enabled = False
+
+    # ---------------------------------------------------
+    # KEYS
+    # ---------------------------------------------------
+    def make_key(self, src_path, size, resample, variant=""):
+        st = os.stat(src_path)
+        raw = "|".join([
+            str(CACHE_VERSION), os.path.abspath(src_path), str(st.st_mtime_ns), str(st.st_size),
+            f"{size[0]}x{size[1]}", str(int(resample)), variant
+        ])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def entry_path(self, key): return os.path.join(self.dir, key + ".raw")
+
+    # ---------------------------------------------------
+    # GET (returns a PIL image of the requested size, or None)
+    # ---------------------------------------------------
+    # `size` may be a (w, h) tuple or a callable taking the source (w, h),
+    # for assets whose target size follows the source aspect ratio.
+    def get(self, src_path, size, resample=Image.Resampling.LANCZOS, variant=""):
+        if not os.path.exists(src_path): return None
+        src_img = None
+        if callable(size):
+            src_img = Image.open(src_path)  # header only, pixels stay undecoded
+            size = size(src_img.size)
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+
+        key = self.make_key(src_path, size, resample, variant) if self.enabled else None
+        if key:
+            img = self.read_entry(key)
+            if img is not None:
+                self.hits += 1
+                return img
+
+        self.misses += 1
+        if src_img is None: src_img = Image.open(src_path)
+        img = src_img.resize(size, resample)
+        img = apply_variant(img, variant)
+        if key: self.write_entry(key, img, src_path)
+        return img
+
+    def read_entry(self, key):
+        path = self.entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                if f.read(4) != CACHE_MAGIC: return None
+                meta = json.loads(f.readline().decode("utf-8"))
+                data = f.read()
+            return Image.frombytes(meta["mode"], tuple(meta["size"]), data)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def write_entry(self, key, img, src_paths):
+        if isinstance(src_paths, str): src_paths = [src_paths]
+        if img.mode not in ("RGBA", "RGB", "L", "LA"):
+            img = img.convert("RGBA")
+        meta = {"mode": img.mode, "size": list(img.size),
+                "sources": [[os.path.abspath(p), os.stat(p).st_mtime_ns] for p in src_paths]}
+        path = self.entry_path(key)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(CACHE_MAGIC)
+                f.write((json.dumps(meta) + "\n").encode("utf-8"))
+                f.write(img.tobytes())
+            os.replace(tmp, path)
+        except OSError:
+            try: os.remove(tmp)
+            except OSError: pass
+
+    # ---------------------------------------------------
+    # COMPOSITES (images drawn from several sources)
+    # ---------------------------------------------------
+    # `params` must capture everything else the factory depends on (layout
+    # numbers, colours); the key also covers every source's mtime/size.
+    def get_composite(self, name, src_paths, params, factory):
+        src_paths = [p for p in src_paths if os.path.exists(p)]
+        key = None
+        if self.enabled:
+            parts = [str(CACHE_VERSION), name, json.dumps(params, sort_keys=True)]
+            for p in src_paths:
+                st = os.stat(p)
+                parts.append(f"{os.path.abspath(p)}:{st.st_mtime_ns}:{st.st_size}")
+            key = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+            img = self.read_entry(key)
+            if img is not None:
+                self.hits += 1
+                return img
+        self.misses += 1
+        img = factory()
+        if key and src_paths: self.write_entry(key, img, src_paths)
+        return img
+
+    # ---------------------------------------------------
+    # INVALIDATION
+    # ---------------------------------------------------
+    # Drops cache folders for other resolutions and entries whose source
+    # file changed or disappeared since they were written.
+    def prune(self):
+        if not self.enabled: return
+        own = os.path.basename(self.dir)
+        try:
+            for name in os.listdir(self.root_dir):
+                if name != own:
+                    shutil.rmtree(os.path.join(self.root_dir, name), ignore_errors=True)
+            for name in os.listdir(self.dir):
+                path = os.path.join(self.dir, name)
+                if not name.endswith(".raw") or self.is_stale(path):
+                    os.remove(path)
+        except OSError: pass
+
+    def is_stale(self, path):
+        try:
+            with open(path, "rb") as f:
+                if f.read(4) != CACHE_MAGIC: return True
+                meta = json.loads(f.readline().decode("utf-8"))
+            return any(os.stat(p).st_mtime_ns != mtime for p, mtime in meta["sources"])
+        except (OSError, ValueError, KeyError):
+            return True
+
+
+def apply_variant(img, variant):
+    if variant == "grey":
+        return ImageEnhance.Color(img).enhance(0.0)
+    return img
+
+
+# =============================================================================
+# CLASS: ASSET REGISTRY (App-lifetime PhotoImages, LRU under a memory budget)
+# =============================================================================
+# One registry lives on HangmanUI for the whole process. Each named variant is
+# built once per resolution and handed back on every later request, so a new
+# GameScreen per round costs a handful of dict lookups instead of image work.
+#
+# With a budget set, images are tracked at w*h*4 bytes and the least recently
+# used ones that the current screen has not pinned are dropped once the total
+# goes over. Only names with a recipe (a source file spec or a factory) can be
+# evicted; they are rebuilt from the disk cache the next time they are needed.
+class AssetRegistry:
+    def __init__(self, cache, budget_bytes=None):
+        self.cache = cache
+        self.resolution = cache.screen_size
+        self.images = OrderedDict()
+        self.sizes = {}
+        self.recipes = {}
+        self.pinned = set()
+        self.budget_bytes = budget_bytes
+        self.current_bytes = 0
+        self.peak_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.on_evict = None
+
+    def load(self, name, src_path, size, resample=Image.Resampling.LANCZOS, variant=""):
+        self.recipes[name] = ("file", (src_path, size, resample, variant))
+        if name in self.images:
+            self.hits += 1
+            self.images.move_to_end(name)
+            return self.images[name]
+        img = self.cache.get(src_path, size, resample, variant)
+        if img is None: return None
+        return self.store(name, img)
+
+    def generate(self, name, factory):
+        self.recipes[name] = ("gen", factory)
+        if name in self.images:
+            self.hits += 1
+            self.images.move_to_end(name)
+            return self.images[name]
+        return self.store(name, factory())
+
+    def rebuild(self, name):
+        kind, recipe = self.recipes[name]
+        if kind == "file": return self.load(name, *recipe)
+        return self.generate(name, recipe)
+
+    def store(self, name, img):
+        self.misses += 1
+        photo = ImageTk.PhotoImage(img)
+        if name in self.images: self.current_bytes -= self.sizes[name]
+        self.images[name] = photo
+        self.sizes[name] = img.width * img.height * 4
+        self.current_bytes += self.sizes[name]
+        self.peak_bytes = max(self.peak_bytes, self.current_bytes)
+        self.enforce_budget()
+        return photo
+
+    # ---------------------------------------------------
+    # BUDGET
+    # ---------------------------------------------------
+    def pin(self, names):
+        self.pinned = set(names)
+        for name in self.pinned:
+            if name in self.images: self.images.move_to_end(name)
+        self.enforce_budget()
+
+    def enforce_budget(self):
+        if self.budget_bytes is None: return
+        for name in list(self.images)[:-1]:
+            if self.current_bytes <= self.budget_bytes: break
+            if name in self.pinned or name not in self.recipes: continue
+            self.evict(name)
+
+    def evict(self, name):
+        self.images.pop(name)
+        self.current_bytes -= self.sizes.pop(name)
+        self.evictions += 1
+        if self.on_evict: self.on_evict(name)
+
+    def reset(self, cache):
+        self.cache = cache
+        self.resolution = cache.screen_size
+        self.images.clear()
+        self.sizes.clear()
+        self.recipes.clear()
+        self.current_bytes = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.images),
+                "evictions": self.evictions, "current_bytes": self.current_bytes,
+                "peak_bytes": self.peak_bytes, "budget_bytes": self.budget_bytes}
+
+
+# =============================================================================
+# CLASS: ASSET LOADER (Background decode, Tk-thread conversion)
+# =============================================================================
+# Decoding and resizing run on a small thread pool (PIL releases the GIL for
+# both). Tk is not thread-safe, so finished PIL images are picked up by an
+# `after` poll on the Tk thread and only turned into PhotoImages there.
+# Screens call require() for the names they are about to draw; anything
+# still in flight is waited on, everything else keeps loading in the back.
+class AssetLoader:
+    def __init__(self, root, registry, on_ready, workers=None, poll_ms=15, budget_ms=8, meter=None):
+        self.root = root
+        self.meter = meter
+        self.registry = registry
+        self.on_ready = on_ready
+        self.pool = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1), thread_name_prefix="assets")
+        self.pending = {}
+        self.groups = set()
+        self.idle_callbacks = []
+        self.poll_ms = poll_ms
+        self.budget = budget_ms / 1000.0
+        self.pump_id = None
+
+    def submit(self, name, src_path, size, resample=Image.Resampling.LANCZOS, variant=""):
+        self.registry.recipes[name] = ("file", (src_path, size, resample, variant))
+        if name in self.registry.images:
+            self.registry.hits += 1
+            return
+        if name in self.pending: return
+        self.pending[name] = self.pool.submit(self.registry.cache.get, src_path, size, resample, variant)
+        self.schedule_pump()
+
+    # Pass evictable=False for images that cannot be rebuilt cheaply (atlas crops).
+    def submit_generated(self, name, factory, evictable=True):
+        if evictable: self.registry.recipes[name] = ("gen", factory)
+        if name in self.registry.images:
+            self.registry.hits += 1
+            return
+        if name in self.pending: return
+        self.pending[name] = self.pool.submit(factory)
+        self.schedule_pump()
+
+    # One job producing several images, e.g. the whole sprite atlas. The
+    # factory returns {name: image}; each name is finished on its own.
+    def submit_many(self, names, factory):
+        names = [n for n in names if n not in self.registry.images and n not in self.pending]
+        if not names: return
+        fut = self.pool.submit(factory)
+        for name in names:
+            self.pending[name] = fut
+            self.groups.add(name)
+        self.schedule_pump()
+
+    # Runs callback on the Tk thread once nothing is left in flight.
+    def when_idle(self, callback):
+        self.idle_callbacks.append(callback)
+        self.schedule_pump()
+
+    def schedule_pump(self):
+        if self.pump_id is None:
+            self.pump_id = self.root.after(self.poll_ms, self.pump)
+
+    def pump(self):
+        self.pump_id = None
+        if self.meter: self.meter.hit("assets")
+        start = time.perf_counter()
+        for name, fut in list(self.pending.items()):
+            if fut.done(): self.finish(name)
+            if time.perf_counter() - start > self.budget: break
+        if self.pending: self.schedule_pump()
+        elif self.idle_callbacks:
+            callbacks, self.idle_callbacks = self.idle_callbacks, []
+            for callback in callbacks: callback()
+
+    def finish(self, name):
+        fut = self.pending.pop(name)
+        try: img = fut.result()
+        except Exception: img = None
+        if name in self.groups:
+            self.groups.discard(name)
+            img = img.get(name) if img else None
+        if img is None: return None
+        photo = self.registry.store(name, img)
+        self.on_ready(name, photo)
+        return photo
+
+    def require(self, names):
+        for name in names:
+            if name in self.pending:
+                self.finish(name)
+            elif name not in self.registry.images and name in self.registry.recipes:
+                photo = self.registry.rebuild(name)
+                if photo: self.on_ready(name, photo)
+
+    def is_ready(self, name): return name in self.registry.images
+
+    # Drops everything in flight, e.g. when a resize makes it the wrong size
+    def reset(self):
+        for fut in self.pending.values(): fut.cancel()
+        self.pending.clear()
+        self.groups.clear()
+        self.idle_callbacks = []
+
+    def shutdown(self):
+        if self.pump_id is not None:
+            self.root.after_cancel(self.pump_id)
+            self.pump_id = None
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.pending.clear()
+
+
+# =============================================================================
+# CLASS: SPRITE ATLAS (Buttons, hearts and powerup icons in one image)
+# =============================================================================
+# All small variants (norm/hover buttons, std/hover/grey icons) for the
+# current scale are packed into one raw image plus a JSON index of rects.
+# A warm start is one read and a crop per sprite. The index carries a
+# signature of every source file's mtime/size and the scale, so changing any
+# art (or the resolution) rebuilds the whole atlas the next time it loads.
+class SpriteAtlas:
+    def __init__(self, root_dir, max_width=2048, padding=2):
+        self.root_dir = root_dir
+        self.image_path = os.path.join(root_dir, "sprites.raw")
+        self.index_path = os.path.join(root_dir, "sprites.json")
+        self.max_width = max_width
+        self.padding = padding
+
+    def signature(self, specs, scale, screen_size):
+        sources = {}
+        for spec in specs:
+            path = spec[1]
+            if path in sources: continue
+            try:
+                st = os.stat(path)
+                sources[path] = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                sources[path] = None
+        return {"version": CACHE_VERSION, "scale": round(scale, 6), "screen": list(screen_size),
+                "names": sorted(spec[0] for spec in specs), "sources": sources}
+
+    # ---------------------------------------------------
+    # LOAD (rebuilds when the signature no longer matches)
+    # ---------------------------------------------------
+    def load(self, specs, scale, screen_size):
+        sig = self.signature(specs, scale, screen_size)
+        sprites = self.read(sig)
+        if sprites is None:
+            sprites = self.build(specs, sig)
+        return sprites
+
+    # Warm atlas only (None when it has to be rebuilt)
+    def cached(self, specs, scale, screen_size):
+        return self.read(self.signature(specs, scale, screen_size))
+
+    def read(self, sig):
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+            if index.get("signature") != sig: return None
+            with open(self.image_path, "rb") as f:
+                sheet = Image.frombytes("RGBA", tuple(index["size"]), f.read())
+        except (OSError, ValueError, KeyError):
+            return None
+        return {name: sheet.crop((x, y, x + w, y + h)) for name, (x, y, w, h) in index["rects"].items()}
+
+    # ---------------------------------------------------
+    # BUILD (decode each source once, render every variant)
+    # ---------------------------------------------------
+    def build(self, specs, sig):
+        by_source = {}
+        for spec in specs:
+            by_source.setdefault(spec[1], []).append(spec)
+
+        rendered = {}
+        for path, group in by_source.items():
+            if not os.path.exists(path): continue
+            try:
+                src = Image.open(path)
+                src.load()
+            except OSError:
+                continue
+            if src.mode != "RGBA": src = src.convert("RGBA")
+            for spec in group:
+                name, _, size = spec[:3]
+                resample = spec[3] if len(spec) > 3 else Image.Resampling.LANCZOS
+                variant = spec[4] if len(spec) > 4 else ""
+                if callable(size): size = size(src.size)
+                size = (max(1, int(size[0])), max(1, int(size[1])))
+                rendered[name] = apply_variant(src.resize(size, resample), variant)
+
+        rects, sheet_size = self.pack({name: img.size for name, img in rendered.items()})
+        sheet = Image.new("RGBA", sheet_size, (0, 0, 0, 0))
+        for name, img in rendered.items():
+            x, y, _, _ = rects[name]
+            sheet.paste(img, (x, y))
+        self.write(sheet, rects, sig)
+        return rendered
+
+    # Shelf packer: tallest first, left to right, new row when the width runs out.
+    def pack(self, sizes):
+        pad = self.padding
+        width = max([self.max_width] + [w + pad for w, _ in sizes.values()])
+        rects = {}
+        x = y = row_h = 0
+        for name in sorted(sizes, key=lambda n: sizes[n][1], reverse=True):
+            w, h = sizes[name]
+            if x + w > width:
+                x = 0; y += row_h + pad; row_h = 0
+            rects[name] = (x, y, w, h)
+            x += w + pad
+            row_h = max(row_h, h)
+        return rects, (width, max(1, y + row_h))
+
+    def write(self, sheet, rects, sig):
+        try:
+            os.makedirs(self.root_dir, exist_ok=True)
+            tmp = self.image_path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(sheet.tobytes())
+            os.replace(tmp, self.image_path)
+            tmp = self.index_path + ".tmp"
+            with open(tmp, "w") as f:
+                json.dump({"signature": sig, "size": list(sheet.size), "rects": rects}, f)
+            os.replace(tmp, self.index_path)
+        except OSError: pass
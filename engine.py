@@ -0,0 +1,297 @@
+import random
+import time
+from wordstore import WordBank, word_mask
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+MAX_WRONG = 6
+POWERUP_NAMES = ("roulette", "freeze", "duality", "reveal", "filter", "oracle")
+TIME_LIMITS = {"Hardest": 30}
+FREEZE_SECONDS = 5
+REFILL_STREAK = 5     # wins in a row that refill every powerup by one
+ROULETTE_STAKE = 1    # powerups won / lost on each roulette gamble
+DIFFICULTY_KEYS = {"Easiest": "Easy", "Medium": "Medium", "Hardest": "Hardest"}
+ALL_LETTERS = (1 << 26) - 1
+
+
+# ---------------------------------------------------
+# LETTER MASKS (bit i = ALPHABET[i])
+# ---------------------------------------------------
+def letter_bit(char): return 1 << (ord(char) - 65)
+
+def mask_letters(mask):
+    letters = []
+    while mask:
+        low = mask & -mask
+        letters.append(ALPHABET[low.bit_length() - 1])
+        mask ^= low
+    return letters
+
+def random_letter(mask, rng):
+    for _ in range(rng.randrange(mask.bit_count())): mask &= mask - 1
+    return ALPHABET[(mask & -mask).bit_length() - 1]
+
+
+# =============================================================================
+# CLASS: HANGMAN ENGINE (Game rules, no Tk)
+# =============================================================================
+# Owns the word, guesses, lives, powerups, streak and score. Guessed,
+# disabled and word letters are 26-bit masks (the word store keeps each
+# word's mask precomputed), so win checks, reveal/filter candidates and key
+# states are bit operations. Randomness comes from `rng` and round timing
+# from `clock`, so tools can run seeded games headless. Every state change
+# is announced through emit(event, data);
+# GameScreen subscribes and re-syncs only the affected items. Scheduling
+# (the Hardest countdown, the freeze duration, overlay timing) stays with the
+# caller, which reports back through tick(), time_up(), unfreeze() and
+# arm_roulette(). The oracle powerup asks `solver` (a solver.SolverSession
+# following this engine) for the best letter to guess next.
+#
+# Events: round_started, letter, keys, word, lives, score, powerups,
+# powerup_used, status, shield_used, roulette_started, roulette_resolved,
+# freeze, oracle, time, round_over
+class HangmanEngine:
+    def __init__(self, words=None, rng=None, clock=None):
+        self.load_words(words or {})
+        self.rng = rng or random.Random()
+        self.clock = clock or time.monotonic
+        self.listeners = []
+        self.scheduler = None
+        self.player = ""
+        self.solver = None
+        # Balance knobs (simulate.py varies these)
+        self.time_limits = dict(TIME_LIMITS)
+        self.refill_streak = REFILL_STREAK
+        self.roulette_stake = ROULETTE_STAKE
+
+        self.score = 0
+        self.streak = 0
+        self.streak_counter = 0
+        self.powerups = {name: 1 for name in POWERUP_NAMES}
+        self.game_mode = "Easy"
+        self.current_word = ""
+        self.entry = None
+        self.meaning = ""
+        self.current_hint = ""
+        self.word_mask = 0
+        self.reset_round()
+
+    def reset_round(self):
+        self.guessed_mask = 0
+        self.disabled_mask = 0
+        self.wrong_guesses = 0
+        self.freeze_active = False
+        self.duality_active = False
+        self.roulette_step = "idle"
+        self.hint = None
+        self.time_left = 0
+        self.over = False
+        self.started_at = self.clock()
+
+    # ---------------------------------------------------
+    # EVENTS
+    # ---------------------------------------------------
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.listeners: self.listeners.remove(callback)
+
+    def emit(self, event, **data):
+        for callback in list(self.listeners): callback(event, data)
+
+    # ---------------------------------------------------
+    # ROUND
+    # ---------------------------------------------------
+    # Takes a wordstore.WordStore, or a plain {difficulty: [entries]} dict.
+    # `scheduler` (wordbag.WordScheduler) replaces independent draws with
+    # non-repeating bags and skips words `player` already solved.
+    def load_words(self, words, scheduler=None):
+        self.bank = WordBank(words) if isinstance(words, dict) else words
+        self.scheduler = scheduler
+
+    def pick_word(self, mode):
+        key = DIFFICULTY_KEYS.get(mode, "Easy")
+        n = self.bank.count(key)
+        if not n: return None
+        if self.scheduler: return (key, self.scheduler.draw(key, self.rng, self.player))
+        return (key, self.rng.randrange(n))
+
+    # `word` = (word, meaning, hint) plays a fixed word instead of drawing one
+    def start_round(self, mode, word=None):
+        self.game_mode = mode
+        self.entry = None if word else self.pick_word(mode)
+        if self.entry:
+            key, i = self.entry
+            self.current_word = self.bank.word(key, i)
+            self.word_mask = self.bank.mask(key, i)
+            self.current_hint = self.bank.hint(key, i)
+            self.meaning = None
+        else:
+            self.current_word, self.meaning, self.current_hint = word or ("ERROR", "Missing Data", "No Hint")
+            self.current_word = self.current_word.upper()
+            self.word_mask = word_mask(self.current_word)
+        self.reset_round()
+        self.time_left = self.time_limits.get(mode, 0)
+        self.emit("round_started", mode=mode)
+
+    # Only read from the store when something actually shows it
+    @property
+    def current_meaning(self):
+        if self.meaning is None: self.meaning = self.bank.meaning(*self.entry)
+        return self.meaning
+
+    def is_solved(self): return self.word_mask & ~self.guessed_mask == 0
+
+    def is_guessed(self, char): return bool(self.guessed_mask & letter_bit(char))
+    def is_disabled(self, char): return bool(self.disabled_mask & letter_bit(char))
+    def in_word(self, char): return bool(self.word_mask & letter_bit(char))
+
+    def masked_word(self): return " ".join([l if self.guessed_mask & word_mask(l) or not word_mask(l) else "_" for l in self.current_word])
+
+    def check_game_over(self):
+        if self.over: return
+        if self.is_solved():
+            self.win()
+        elif self.wrong_guesses >= MAX_WRONG:
+            self.lose("Ran out of lives!")
+
+    def win(self):
+        self.over = True
+        if self.scheduler and self.entry: self.scheduler.solved(self.player, *self.entry)
+        self.score += 100
+        self.streak += 1
+        self.streak_counter += 1
+        if self.streak_counter >= self.refill_streak:
+            self.streak_counter = 0
+            for k in self.powerups: self.powerups[k] += 1
+            self.emit("powerups")
+        self.emit("score")
+        self.emit("round_over", won=True, reason="YOU WON!", score=self.score, duration=self.clock() - self.started_at)
+
+    def lose(self, reason):
+        self.over = True
+        final_score = self.score
+        self.streak = 0
+        self.streak_counter = 0
+        self.score = 0
+        self.emit("round_over", won=False, reason=reason, score=final_score, duration=self.clock() - self.started_at)
+
+    # Leaving a run from the menu drops the banked score
+    def reset_score(self):
+        self.score = 0
+
+    # ---------------------------------------------------
+    # GUESSES
+    # ---------------------------------------------------
+    def guess(self, char):
+        if self.over or self.roulette_step == "intro": return None
+        bit = letter_bit(char)
+        if (self.guessed_mask | self.disabled_mask) & bit: return None
+        self.guessed_mask |= bit
+        is_correct = bool(self.word_mask & bit)
+        self.emit("letter", char=char, correct=is_correct)
+
+        if self.roulette_step == "waiting_for_guess":
+            self.resolve_roulette(is_correct)
+
+        if not is_correct:
+            if self.duality_active:
+                self.duality_active = False
+                self.emit("shield_used")
+            else:
+                self.wrong_guesses += 1
+                self.emit("lives")
+        else:
+            self.emit("word")
+
+        self.check_game_over()
+        return is_correct
+
+    # ---------------------------------------------------
+    # POWERUPS
+    # ---------------------------------------------------
+    def use_powerup(self, name):
+        if self.over or self.powerups.get(name, 0) <= 0: return False
+        if self.roulette_step != "idle": return False
+
+        if name == "roulette":
+            self.powerups[name] -= 1
+            self.roulette_step = "intro"
+            self.emit("powerups")
+            self.emit("powerup_used", name=name)
+            self.emit("roulette_started")
+            return True
+
+        used = False
+        if name == "freeze":
+            if self.game_mode == "Hardest" and not self.freeze_active:
+                self.freeze_active = True
+                used = True
+                self.emit("freeze", active=True, seconds=FREEZE_SECONDS)
+        elif name == "duality":
+            if not self.duality_active:
+                self.duality_active = True
+                used = True
+                self.emit("status")
+        elif name == "reveal":
+            unguessed_correct = self.word_mask & ~self.guessed_mask
+            if unguessed_correct:
+                char = random_letter(unguessed_correct, self.rng)
+                self.guessed_mask |= letter_bit(char)
+                used = True
+                self.emit("letter", char=char, correct=True, revealed=True)
+                self.emit("word")
+        elif name == "filter":
+            candidates = ALL_LETTERS & ~(self.word_mask | self.guessed_mask | self.disabled_mask)
+            if candidates:
+                to_disable = self.rng.sample(mask_letters(candidates), k=min(3, candidates.bit_count()))
+                self.disabled_mask |= word_mask(to_disable)
+                used = True
+                self.emit("keys", chars=to_disable)
+        elif name == "oracle":
+            char = self.solver.best_letter() if self.solver else None
+            if char:
+                self.hint = char
+                used = True
+                self.emit("oracle", char=char)
+
+        if used:
+            self.powerups[name] -= 1
+            self.emit("powerups")
+            self.emit("powerup_used", name=name)
+            # A reveal can finish the word; the charge is spent before round_over
+            if name == "reveal": self.check_game_over()
+        return used
+
+    def arm_roulette(self):
+        if self.roulette_step != "intro": return
+        self.roulette_step = "waiting_for_guess"
+        self.emit("status")
+
+    def resolve_roulette(self, won):
+        if won:
+            for k in self.powerups: self.powerups[k] += self.roulette_stake
+        else:
+            for k in self.powerups: self.powerups[k] = max(0, self.powerups[k] - self.roulette_stake)
+        self.roulette_step = "idle"
+        self.emit("powerups")
+        self.emit("status")
+        self.emit("roulette_resolved", won=won)
+
+    def unfreeze(self):
+        if not self.freeze_active: return
+        self.freeze_active = False
+        self.emit("freeze", active=False, seconds=0)
+
+    # ---------------------------------------------------
+    # TIMER (Hardest)
+    # ---------------------------------------------------
+    def tick(self, seconds_left):
+        if self.over: return
+        self.time_left = seconds_left
+        self.emit("time")
+
+    def time_up(self):
+        if self.over: return
+        self.tick(0)
+        self.lose("Time's Up!")
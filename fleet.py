@@ -0,0 +1,288 @@
+import os
+import sys
+import re
+import json
+import heapq
+import sqlite3
+import argparse
+import tempfile
+from itertools import islice
+from leaderboard import LeaderboardStore, normalise_record
+
+RUN_ROWS = 200000
+READ_CHUNK = 1 << 20
+MAX_VALUE = 1 << 16    # a value that still fails with this much text after it is malformed
+RECORD_START = re.compile(r"[\n,\[]\s*\{")
+BOARD_EXTENSIONS = (".json", ".jsonl", ".db", ".sqlite")
+
+
+# Merge order: mode, then best score first, then name and date so that
+# duplicates (same name, score, mode, date) always end up next to each other
+def sort_key(r): return (r["mode"], -r["score"], r["name"], r["date"])
+def dedupe_key(r): return (r["name"], r["score"], r["mode"], r["date"])
+
+
+# ---------------------------------------------------
+# READERS (records one at a time)
+# ---------------------------------------------------
+# Handles a JSON array (leaderboard.json) and JSON lines alike without
+# loading the file: values are decoded straight out of a rolling buffer.
+# A value that can't be decoded (once MAX_VALUE of text follows it, or at
+# the end of the file) is passed to `reject` and skipped up to the next
+# record: a "{" after a newline, "," or "[" (a nested one follows a ":"),
+# so one bad record costs one record rather than the whole merge.
+def iter_json_values(f, reject=None):
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+    while True:
+        while pos < len(buf) and buf[pos] in " \t\r\n,[]": pos += 1
+        if pos >= len(buf):
+            if eof: return
+            buf, pos = f.read(READ_CHUNK), 0
+            eof = not buf
+            continue
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if not eof and len(buf) - pos < MAX_VALUE:
+                more = f.read(READ_CHUNK)
+                eof = not more
+                buf, pos = buf[pos:] + more, 0
+                continue
+            if reject: reject(buf[pos:pos + 80])
+            m = RECORD_START.search(buf, pos + 1)
+            while not m and not eof:
+                more = f.read(READ_CHUNK)
+                eof = not more
+                buf = buf[-80:] + more
+                m = RECORD_START.search(buf)
+            buf, pos = (buf, m.end() - 1) if m else ("", 0)
+            continue
+        if end == len(buf) and not eof:
+            # A number may continue in the next chunk
+            more = f.read(READ_CHUNK)
+            if more:
+                buf, pos = buf[pos:] + more, 0
+                continue
+        yield value
+        pos = end
+
+# `reject(reason, raw)` hears about every value that isn't a result
+def read_json_board(path, reject=None):
+    with open(path, "r", encoding="utf-8") as f:
+        for value in iter_json_values(f, reject and (lambda raw: reject("bad json", raw))):
+            record = normalise_record(value) if isinstance(value, dict) else None
+            if record: yield record
+            elif reject: reject("not a result", value)
+
+# Rows of a LeaderboardStore database, already in merge order; with `top`
+# only the first `top` distinct records of each mode are read.
+def read_db_board(path, top=0):
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    db.row_factory = sqlite3.Row
+    try:
+        modes = [row[0] for row in db.execute("SELECT DISTINCT mode FROM results ORDER BY mode")]
+        for mode in modes:
+            rows = db.execute("SELECT name, score, mode, date, lifelines_left FROM results WHERE mode = ? "
+                              "ORDER BY score DESC, name, date", (mode,))
+            last, kept = None, 0
+            for row in rows:
+                record = dict(row)
+                key = dedupe_key(record)
+                if key == last: continue
+                last = key
+                yield record
+                kept += 1
+                if top and kept >= top: break
+    finally:
+        db.close()
+
+def expand_inputs(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for folder, _, names in os.walk(path):
+                for name in sorted(names):
+                    if name.lower().endswith(BOARD_EXTENSIONS): yield os.path.join(folder, name)
+        else:
+            yield path
+
+
+# Rank(r) < Rank(s) when r is the worse result, so the heap root is the
+# record to evict next
+class Rank:
+    __slots__ = ("r",)
+
+    def __init__(self, r): self.r = r
+    def __lt__(self, other): return sort_key(self.r) > sort_key(other.r)
+    def __eq__(self, other): return sort_key(self.r) == sort_key(other.r)
+
+
+# =============================================================================
+# CLASS: BOARD MERGER (Many kiosk boards -> one global board)
+# =============================================================================
+# JSON boards are cut into runs of RUN_ROWS records, each sorted and spilled
+# to a temp file; database boards are read already sorted. All runs then go
+# through one k-way merge (heapq.merge), where duplicates arrive side by
+# side and are dropped by comparing with the previous record. With `top`,
+# each run only keeps its best `top` distinct records per mode (a bounded
+# heap per mode), which is enough for the global top-k because every
+# record in it must also be in the top-k of the run it came from.
+# Memory is one run, however many records go in.
+class BoardMerger:
+    def __init__(self, top=10, run_rows=RUN_ROWS):
+        self.top = top
+        self.run_rows = run_rows
+        self.spool_dir = tempfile.mkdtemp(prefix="fleet-")
+        self.runs = []
+        self.streams = []
+        self.read = 0
+        self.duplicates = 0
+        self.rejected = {}
+
+    def counted(self, records):
+        for r in records:
+            self.read += 1
+            yield r
+
+    def reject(self, path, reason, raw):
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        print(f"{path}: {reason}: {json.dumps(raw, ensure_ascii=False)[:80]}", file=sys.stderr)
+
+    def add_path(self, path):
+        if path.lower().endswith((".db", ".sqlite")):
+            self.streams.append(self.counted(read_db_board(path, self.top)))
+        else:
+            records = self.counted(read_json_board(path, lambda reason, raw: self.reject(path, reason, raw)))
+            while True:
+                chunk = list(islice(records, self.run_rows))
+                if not chunk: break
+                self.spill(chunk)
+
+    # Best `top` distinct records per mode: a min-heap of size `top` per mode
+    # plus the set of keys currently in it
+    def best(self, chunk):
+        heaps = {}
+        for r in chunk:
+            heap, keys = heaps.setdefault(r["mode"], ([], set()))
+            key = dedupe_key(r)
+            if key in keys:
+                self.duplicates += 1
+                continue
+            item = Rank(r)
+            if len(heap) < self.top:
+                heapq.heappush(heap, item)
+                keys.add(key)
+            elif heap[0] < item:
+                keys.discard(dedupe_key(heapq.heapreplace(heap, item).r))
+                keys.add(key)
+        return [item.r for heap, _ in heaps.values() for item in heap]
+
+    def spill(self, chunk):
+        if self.top: chunk = self.best(chunk)
+        chunk.sort(key=sort_key)
+        path = os.path.join(self.spool_dir, f"run{len(self.runs)}.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for r in chunk: f.write(json.dumps(r) + "\n")
+        self.runs.append(path)
+
+    def read_run(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f: yield json.loads(line)
+
+    # Merged, de-duplicated records in (mode, score desc) order
+    def merged(self):
+        streams = self.streams + [self.read_run(p) for p in self.runs]
+        last, mode, kept = None, None, 0
+        for r in heapq.merge(*streams, key=sort_key):
+            key = dedupe_key(r)
+            if key == last:
+                self.duplicates += 1
+                continue
+            last = key
+            if r["mode"] != mode: mode, kept = r["mode"], 0
+            if self.top and kept >= self.top: continue
+            kept += 1
+            yield r
+
+    def close(self):
+        for path in self.runs:
+            try: os.remove(path)
+            except OSError: pass
+        try: os.rmdir(self.spool_dir)
+        except OSError: pass
+
+
+# ---------------------------------------------------
+# WRITERS
+# ---------------------------------------------------
+# A failed write leaves the old output as it was and no temp files behind
+def discard(tmp):
+    for path in (tmp, tmp + "-wal", tmp + "-shm"):
+        try: os.remove(path)
+        except OSError: pass
+
+def write_json_board(path, records):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    n = 0
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write("[")
+            for r in records:
+                if r.get("lifelines_left") is None: r = {k: v for k, v in r.items() if k != "lifelines_left"}
+                f.write((",\n" if n else "\n") + json.dumps(r))
+                n += 1
+            f.write("\n]\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        discard(tmp)
+        raise
+    return n
+
+def write_db_board(path, records):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    n = 0
+    try:
+        store = LeaderboardStore(tmp)
+        try:
+            while True:
+                batch = list(islice(records, 10000))
+                if not batch: break
+                with store.db:
+                    store.insert(batch)
+                n += len(batch)
+            store.db.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            store.close()
+        os.replace(tmp, path)
+    except BaseException:
+        discard(tmp)
+        raise
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge leaderboards from many installs into one global board.")
+    parser.add_argument("inputs", nargs="+", help="leaderboard.json / JSON lines files, leaderboard.db files, or folders of them")
+    parser.add_argument("-o", "--output", required=True, help="board to write (.json, or .db for a leaderboard database)")
+    parser.add_argument("-k", "--top", type=int, default=10, help="results kept per mode (0 keeps every distinct result)")
+    args = parser.parse_args(argv)
+
+    merger = BoardMerger(max(args.top, 0))
+    try:
+        for path in expand_inputs(args.inputs):
+            merger.add_path(path)
+        writer = write_db_board if args.output.lower().endswith((".db", ".sqlite")) else write_json_board
+        written = writer(args.output, merger.merged())
+    finally:
+        merger.close()
+    print(f"Merged {merger.read} records from {len(merger.runs) + len(merger.streams)} runs: "
+          f"{merger.duplicates} duplicates dropped, {written} written to {args.output}")
+    for reason, n in sorted(merger.rejected.items(), key=lambda kv: -kv[1]):
+        print(f"  rejected {n}: {reason}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
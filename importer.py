@@ -0,0 +1,243 @@
+import os
+import io
+import sys
+import csv
+import json
+import time
+import hashlib
+import argparse
+import unicodedata
+from itertools import islice
+from wordstore import WordStoreWriter
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+DIFFICULTY_KEYS = {"Easiest": "Easy", "Easy": "Easy", "Medium": "Medium", "Hardest": "Hardest"}
+MIN_LEN = 2
+MAX_LEN = 20
+CHUNK_ROWS = 10000
+RECENT_HASHES = 1 << 16   # hashes kept in a set before they move to the sorted array
+
+
+# ---------------------------------------------------
+# READERS (one dict per row, never the whole file)
+# ---------------------------------------------------
+def detect_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson"): return "jsonl"
+    if ext in (".csv", ".tsv"): return "csv"
+    return "txt"
+
+def read_jsonl(f):
+    for line in f:
+        line = line.strip()
+        if not line: continue
+        try: row = json.loads(line)
+        except ValueError:
+            yield {"_error": "bad json", "_raw": line}
+            continue
+        yield row if isinstance(row, dict) else {"word": row}
+
+def read_csv(f, delimiter=","):
+    reader = csv.reader(f, delimiter=delimiter)
+    first = next(reader, None)
+    if first is None: return
+    columns = [c.strip().lower() for c in first]
+    if "word" not in columns:
+        columns = ["word", "meaning", "hint", "difficulty"]
+        yield dict(zip(columns, first))
+    for fields in reader:
+        if fields: yield dict(zip(columns, fields))
+
+# One word per line; optional meaning and hint after tabs
+def read_txt(f):
+    for line in f:
+        line = line.rstrip("\r\n")
+        if not line.strip() or line.startswith("#"): continue
+        yield dict(zip(("word", "meaning", "hint"), line.split("\t")))
+
+def read_rows(path, fmt):
+    f = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace") if path == "-" else \
+        open(path, "r", encoding="utf-8", errors="replace", newline="")
+    try:
+        if fmt == "jsonl": yield from read_jsonl(f)
+        elif fmt == "csv": yield from read_csv(f, "\t" if path.lower().endswith(".tsv") else ",")
+        else: yield from read_txt(f)
+    finally:
+        if path != "-": f.close()
+
+
+# ---------------------------------------------------
+# NORMALISATION
+# ---------------------------------------------------
+# "Café" -> "CAFE"; anything that is not A-Z after folding accents is rejected
+def normalise_word(raw):
+    text = unicodedata.normalize("NFKD", str(raw).strip())
+    text = "".join(c for c in text if not unicodedata.combining(c)).upper()
+    if not text: return None, "empty"
+    if not all("A" <= c <= "Z" for c in text): return None, "not A-Z"
+    if len(text) < MIN_LEN: return None, "too short"
+    if len(text) > MAX_LEN: return None, "too long"
+    return text, None
+
+def clean_text(value, default=""):
+    value = " ".join(str(value or "").split())
+    return value or default
+
+
+# =============================================================================
+# CLASS: SEEN HASHES (Which words are already in the store)
+# =============================================================================
+# A Python set costs ~70 bytes per int, so between chunks the hashes
+# collected in `recent` are merged into a sorted uint64 array once there are
+# RECENT_HASHES of them: 8 bytes a word plus the bounded set (and a second
+# copy of the array while a merge runs). A chunk's hashes are looked up in
+# the array with one searchsorted (prefetch); the per-row checks then only
+# touch sets. Without numpy it's just the set.
+class SeenHashes:
+    def __init__(self):
+        self.recent = set()
+        self.sorted = np.zeros(0, dtype=np.uint64) if np else None
+        self.batch = set()
+        self.known = set()
+
+    def __len__(self): return len(self.recent) + (len(self.sorted) if np else 0)
+
+    def __contains__(self, h):
+        if h in self.recent or h in self.known: return True
+        if h in self.batch or not np or not len(self.sorted): return False
+        return h in self.lookup([h])
+
+    # The given hashes that are in the sorted array
+    def lookup(self, hashes):
+        keys = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        i = np.minimum(self.sorted.searchsorted(keys), len(self.sorted) - 1)
+        return set(keys[self.sorted[i] == keys].tolist())
+
+    def prefetch(self, hashes):
+        if not np or not len(self.sorted): return
+        self.batch = set(hashes)
+        self.known = self.lookup(list(self.batch))
+
+    def add(self, h): self.recent.add(h)
+
+    def flush(self):
+        self.batch, self.known = set(), set()
+        if np and len(self.recent) >= RECENT_HASHES:
+            new = np.fromiter(self.recent, dtype=np.uint64, count=len(self.recent))
+            new.sort()
+            self.sorted = np.insert(self.sorted, self.sorted.searchsorted(new), new)
+            self.recent = set()
+
+
+# =============================================================================
+# CLASS: WORD IMPORTER (Stream rows into a compiled word store)
+# =============================================================================
+# Rows are read lazily and processed CHUNK_ROWS at a time straight into a
+# WordStoreWriter, so memory holds one chunk plus the 64-bit hash of every
+# accepted word (SeenHashes: ~8 bytes a word with numpy, ~70 without).
+# Rejected rows go to the report file as they happen, with the reason;
+# counts are summarised at the end.
+class WordImporter:
+    def __init__(self, output, default_difficulty="Medium", report=None):
+        self.output = output
+        self.default_key = DIFFICULTY_KEYS[default_difficulty]
+        self.seen = SeenHashes()
+        self.accepted = 0
+        self.rejected = {}
+        self.report = open(report, "w", encoding="utf-8") if report else None
+        self.writer = WordStoreWriter(output, [time.time_ns(), 0])
+
+    def word_hash(self, word):
+        return int.from_bytes(hashlib.blake2b(word.encode("ascii"), digest_size=8).digest(), "little")
+
+    def reject(self, where, reason, raw):
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        if self.report: self.report.write(f"{where}\t{reason}\t{json.dumps(raw, ensure_ascii=False)}\n")
+
+    # (word, hash, None) for a usable row, else (None, None, reason)
+    def parse(self, row):
+        if "_error" in row: return None, None, row["_error"]
+        word, reason = normalise_word(row.get("word", ""))
+        if reason: return None, None, reason
+        return word, self.word_hash(word), None
+
+    def add_row(self, where, row, parsed=None):
+        word, h, reason = parsed or self.parse(row)
+        if "_error" in row: return self.reject(where, reason, row.get("_raw"))
+        if reason: return self.reject(where, reason, row)
+        key = DIFFICULTY_KEYS.get(clean_text(row.get("difficulty")).capitalize(), self.default_key)
+        if h in self.seen: return self.reject(where, "duplicate", row)
+        self.seen.add(h)
+        self.writer.add(key, word, clean_text(row.get("meaning")), clean_text(row.get("hint"), "No hint available."))
+        self.accepted += 1
+
+    def add_file(self, path, fmt=None, progress=None):
+        rows = read_rows(path, fmt or detect_format(path))
+        line = 0
+        while True:
+            chunk = list(islice(rows, CHUNK_ROWS))
+            if not chunk: break
+            parsed = [self.parse(row) for row in chunk]
+            self.seen.prefetch([h for _, h, _ in parsed if h is not None])
+            for row, p in zip(chunk, parsed):
+                line += 1
+                self.add_row(f"{path}:{line}", row, p)
+            self.seen.flush()
+            if progress: progress(path, line, self.accepted)
+
+    # words.json style {difficulty: [entries]} (e.g. the curated bank)
+    def add_bank(self, path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for key, entries in data.items():
+            for i, e in enumerate(entries):
+                self.add_row(f"{path}:{key}[{i}]", dict(e, difficulty=key))
+        self.seen.flush()
+
+    def finish(self):
+        self.writer.source = [self.writer.source[0], self.accepted]
+        try: self.writer.finish()
+        finally:
+            if self.report: self.report.close()
+
+    def abort(self):
+        self.writer.abort()
+        if self.report: self.report.close()
+
+
+def main(argv=None):
+    base = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Import word lists into a compiled Hangman word bank.")
+    parser.add_argument("inputs", nargs="+", help="JSONL, CSV/TSV or plain text files ('-' reads stdin)")
+    parser.add_argument("-o", "--output", default=os.path.join(base, "data", "words.bin"),
+                        help="compiled store to write (the game uses data/words.bin when present)")
+    parser.add_argument("-d", "--difficulty", default="Medium", choices=sorted(DIFFICULTY_KEYS),
+                        help="difficulty for rows without a difficulty column")
+    parser.add_argument("-f", "--format", choices=("jsonl", "csv", "txt"), help="override format detection")
+    parser.add_argument("--no-base", action="store_true", help="don't include the curated words.json")
+    parser.add_argument("--report", default=None, help="write rejected rows here (TSV)")
+    args = parser.parse_args(argv)
+
+    importer = WordImporter(args.output, args.difficulty, args.report)
+    progress = lambda path, rows, accepted: print(f"\r{path}: {rows} rows, {accepted} words", end="", file=sys.stderr)
+    try:
+        if not args.no_base: importer.add_bank(os.path.join(base, "words.json"))
+        for path in args.inputs:
+            importer.add_file(path, args.format, progress)
+            print(file=sys.stderr)
+        importer.finish()
+    except:
+        importer.abort()
+        raise
+
+    print(f"Imported {importer.accepted} words into {args.output}")
+    for reason, n in sorted(importer.rejected.items(), key=lambda kv: -kv[1]):
+        print(f"  rejected {n}: {reason}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
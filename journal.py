@@ -0,0 +1,92 @@
+import sys
+import time
+import threading
+from leaderboard import LeaderboardStore
+
+FLUSH_DELAY = 0.25
+
+
+# =============================================================================
+# CLASS: WRITE-BEHIND JOURNAL (Disk writes off the Tk thread)
+# =============================================================================
+# The UI only appends to in-memory queues; a daemon thread does the I/O.
+# After the first queued item it waits FLUSH_DELAY for more, then commits
+# every queued result in one SQLite transaction (its own connection to the
+# leaderboard database), so a burst of results costs one commit and a crash
+# leaves the database as it was before or after it. A failed flush keeps
+# its results for the next pass.
+# close() flushes whatever is still queued before returning.
+class WriteBehindJournal:
+    def __init__(self, db_path, delay=FLUSH_DELAY):
+        self.db_path = db_path
+        self.delay = delay
+        self.results = []
+        self.busy = False
+        self.urgent = False
+        self.closing = False
+        self.cond = threading.Condition()
+        self.thread = threading.Thread(target=self.run, name="write-behind", daemon=True)
+        self.thread.start()
+
+    # ---------------------------------------------------
+    # UI SIDE (never touches the disk)
+    # ---------------------------------------------------
+    def add_result(self, name, score, mode, date):
+        with self.cond:
+            self.results.append({"name": name or "Unknown", "score": int(score), "mode": mode, "date": date})
+            self.cond.notify()
+
+    def pending(self):
+        with self.cond:
+            return len(self.results) + self.busy
+
+    # Blocks until everything queued so far is on disk (or `timeout` passes)
+    def flush(self, timeout=None):
+        with self.cond:
+            if self.results: self.urgent = True
+            self.cond.notify_all()
+            return self.cond.wait_for(lambda: not (self.results or self.busy), timeout)
+
+    def close(self, timeout=5):
+        with self.cond:
+            self.closing = True
+            self.cond.notify_all()
+        self.thread.join(timeout)
+
+    # ---------------------------------------------------
+    # WORKER
+    # ---------------------------------------------------
+    def run(self):
+        store = None
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self.results or self.closing)
+                deadline = time.monotonic() + self.delay
+                while not (self.urgent or self.closing):
+                    left = deadline - time.monotonic()
+                    if left <= 0: break
+                    self.cond.wait(left)
+                self.urgent = False
+                results = self.results
+                self.results = []
+                self.busy = bool(results)
+                stop = self.closing
+
+            try:
+                if results:
+                    if store is None: store = LeaderboardStore(self.db_path)
+                    with store.db:
+                        store.insert(results)
+                    results = []
+            except Exception as e:
+                print(f"write-behind: {e}", file=sys.stderr)
+
+            with self.cond:
+                # Anything that failed goes back in front of newer items
+                self.results[:0] = results
+                self.busy = False
+                self.cond.notify_all()
+                if stop:
+                    if store: store.close()
+                    return
+                if results: self.cond.wait(self.delay)
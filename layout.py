@@ -0,0 +1,125 @@
+# =============================================================================
+# LAYOUT ENGINE
+# =============================================================================
+# Every screen position and size used by the UI, computed once per window size
+# and cached. Screens read from a Layout instead of re-deriving geometry from
+# screen_width/screen_height, so a resize is one compute plus coords() calls.
+
+REF_WIDTH = 900
+REF_HEIGHT = 650
+KEY_ROWS = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
+
+
+class Layout:
+    def __init__(self, width, height):
+        w, h = width, height
+        s = min(w / REF_WIDTH, h / REF_HEIGHT)
+        self.width = w
+        self.height = h
+        self.scale = s
+
+        # Popups (difficulty details, end of round)
+        self.popup_w = int(w * 0.7)
+        self.popup_h = int(h * 0.7)
+
+        # Game columns: hangman | paper | powerup strip
+        self.split_x = int(w * 0.38)
+        self.btn_strip_x = int(w * 0.85)
+        self.paper_cx = self.split_x + (self.btn_strip_x - self.split_x) // 2
+        self.left_cx = self.split_x // 2 + 25
+        self.text_w = int((self.btn_strip_x - self.split_x) * 0.9)
+
+        self.hangman_pos = (self.left_cx, int(h * 0.55))
+        self.hangman_h = int(h * 0.80)
+        self.score_pos = (self.left_cx, h * 0.88)
+        margin = int(25 * s)
+        self.exit_pos = (w - margin, margin)
+        self.exit_size = int(50 * s)
+
+        self.word_y = int(h * 0.18)
+        self.hint_y = self.word_y + int(60 * s)
+        self.status_y = self.hint_y + int(60 * s)
+        self.ai_pos = (self.left_cx, int(h * 0.07))
+        self.timer_pos = (self.paper_cx, int(h * 0.90))
+
+        # Keyboard
+        self.keyboard_y = int(h * 0.55)
+        self.max_kb_width = (self.btn_strip_x - self.split_x) * 0.85
+        self.key_rects = self.keyboard_rects(self.paper_cx, self.keyboard_y, self.max_kb_width)
+
+        # Hearts
+        hearts_y = int(h * 0.80)
+        gap = int(45 * s)
+        start_hearts_x = self.paper_cx - (6 * gap) // 2 + (gap // 2)
+        self.heart_positions = [(start_hearts_x + (i * gap), hearts_y) for i in range(6)]
+        self.heart_size = int(32 * s)
+
+        # Powerup strip
+        self.btn_cx = self.btn_strip_x + (w - self.btn_strip_x) // 2
+        self.btn_start_y = int(h * 0.30)
+        self.powerup_gap = int(75 * s)
+        self.powerup_size = (int(130 * s), int(110 * s))
+        self.powerup_hover_size = (int(self.powerup_size[0] * 1.15), int(self.powerup_size[1] * 1.15))
+        self.badge_r = 11 * s
+        self.badge_offset = (35 * s, -20 * s)
+
+        self.fonts = {
+            "score": ("Ubuntu", int(28 * s), "bold"),
+            "hint": ("Ubuntu", int(15 * s), "italic"),
+            "status": int(14 * s),
+            "key": ("Ubuntu", int(18 * s), "bold"),
+            "timer": ("Ubuntu", int(24 * s), "bold"),
+            "badge": ("Ubuntu", int(11 * s), "bold"),
+            "ai": ("Ubuntu", int(16 * s), "bold"),
+        }
+
+    def keyboard_rects(self, cx, cy, max_width):
+        base_key_size = 45 * self.scale
+        key_w = int(base_key_size); key_h = int(base_key_size); gap = int(10 * self.scale)
+
+        row_max_chars = 10
+        total_w_needed = row_max_chars * (key_w + gap)
+        if total_w_needed > max_width:
+            ratio = max_width / total_w_needed
+            key_w = int(key_w * ratio); key_h = int(key_h * ratio); gap = int(gap * ratio)
+
+        total_h = 3 * (key_h + gap)
+        start_y = cy - total_h // 2
+
+        rects = {}
+        for r_i, row_str in enumerate(KEY_ROWS):
+            row_width = len(row_str) * (key_w + gap) - gap
+            row_start_x = cx - row_width // 2
+            for k_i, char in enumerate(row_str):
+                rects[char] = (row_start_x + k_i * (key_w + gap), start_y + r_i * (key_h + gap), key_w, key_h)
+        return rects
+
+    def word_font(self, word_len):
+        base_size = 55
+        font_size = int(base_size * (10 / word_len)) if word_len > 10 else base_size
+        return ("Ubuntu", max(int(font_size * self.scale), 20), "bold")
+
+    def key_at(self, x, y):
+        for char, (kx, ky, key_w, key_h) in self.key_rects.items():
+            if kx <= x <= kx + key_w and ky <= y <= ky + key_h: return char
+        return None
+
+
+class LayoutEngine:
+    def __init__(self, max_entries=8):
+        self.layouts = {}
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, width, height):
+        key = (int(width), int(height))
+        layout = self.layouts.get(key)
+        if layout is not None:
+            self.hits += 1
+            return layout
+        self.misses += 1
+        if len(self.layouts) >= self.max_entries:
+            self.layouts.pop(next(iter(self.layouts)))
+        layout = self.layouts[key] = Layout(*key)
+        return layout
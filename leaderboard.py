@@ -0,0 +1,184 @@
+import os
+import json
+import sqlite3
+from datetime import datetime
+
+SCHEMA_VERSION = 2
+DATE_FORMAT = "%Y-%m-%d %H:%M"
+# Mode names older builds wrote that no leaderboard tab matches
+LEGACY_MODES = {"Easy": "Easiest"}
+INT64_MIN, INT64_MAX = -1 << 63, (1 << 63) - 1    # what a SQLite INTEGER holds
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    mode TEXT NOT NULL,
+    date TEXT NOT NULL,
+    lifelines_left INTEGER
+);
+CREATE INDEX IF NOT EXISTS results_score ON results (score DESC, id);
+CREATE INDEX IF NOT EXISTS results_mode ON results (mode, score DESC, id);
+CREATE INDEX IF NOT EXISTS results_player ON results (player, score DESC, id);
+CREATE INDEX IF NOT EXISTS results_date_score ON results (date, score DESC, id);
+CREATE INDEX IF NOT EXISTS results_mode_date_score ON results (mode, date, score DESC, id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Version 1 databases: date-only indexes (no score order) and legacy modes
+UPGRADE_V2 = """
+DROP INDEX IF EXISTS results_date;
+DROP INDEX IF EXISTS results_mode_date;
+UPDATE results SET mode = 'Easiest' WHERE mode = 'Easy';
+"""
+ORDER = "score DESC, id"
+REVERSED = "score, id DESC"
+
+
+def player_key(name): return str(name or "").strip().casefold()
+
+def normalise_mode(mode):
+    mode = str(mode or "Easiest")
+    return LEGACY_MODES.get(mode, mode)
+
+# leaderboard.json has two record shapes:
+#   {"name", "score", "difficulty", "lifelines_left"}   (older builds)
+#   {"name", "score", "mode", "date"}
+# Both become {"name", "score", "mode", "date", "lifelines_left"}; records
+# without a date get "" so they sort before any dated result, records
+# without a mode count as Easiest. A score that isn't a finite number in
+# the signed 64-bit range makes the record invalid (None).
+def normalise_record(entry):
+    try: score = int(entry.get("score", 0))
+    except (TypeError, ValueError, OverflowError): return None
+    if not INT64_MIN <= score <= INT64_MAX: return None
+    lifelines = entry.get("lifelines_left")
+    if not isinstance(lifelines, int) or not INT64_MIN <= lifelines <= INT64_MAX: lifelines = None
+    return {
+        "name": str(entry.get("name") or "Unknown"),
+        "score": score,
+        "mode": normalise_mode(entry.get("mode") or entry.get("difficulty")),
+        "date": str(entry.get("date") or ""),
+        "lifelines_left": lifelines,
+    }
+
+
+# =============================================================================
+# CLASS: LEADERBOARD STORE (Every result, indexed)
+# =============================================================================
+# SQLite in WAL mode, one row per finished run. Index order matches the
+# queries (score desc within mode / player, then insertion order), so a
+# top-k is an index range walk of k rows rather than a sort of the table.
+# Pages are keyset based: the next page starts after the (score, id) of
+# the last row shown, the previous one before the first, so scrolling is
+# O(log n + k) however deep. Only a jump to an unseen page (`offset`)
+# walks the index keys up to it, once.
+# Date ranges are the exception: a B-tree can't be ordered by date and
+# score at once, so a date-filtered top-k reads the range's (date, score,
+# id) index entries, without touching the table, and keeps the best k:
+# O(m log k) for m results in the range.
+# The old leaderboard.json is imported once, on the first open.
+class LeaderboardStore:
+    def __init__(self, path, legacy_json=None):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder: os.makedirs(folder, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            self.db.executescript(SCHEMA)
+            row = self.db.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+            if row and int(row[0]) < 2: self.db.executescript(UPGRADE_V2)
+            self.db.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (str(SCHEMA_VERSION),))
+        if legacy_json: self.migrate_json(legacy_json)
+
+    def migrate_json(self, path):
+        if self.db.execute("SELECT 1 FROM meta WHERE key = 'migrated_json'").fetchone(): return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = []
+        if not isinstance(entries, list): entries = []
+        records = [r for r in (normalise_record(e) for e in entries if isinstance(e, dict)) if r]
+        with self.db:
+            self.insert(records)
+            self.db.execute("INSERT INTO meta VALUES ('migrated_json', ?)", (os.path.abspath(path),))
+        return len(records)
+
+    # ---------------------------------------------------
+    # WRITES
+    # ---------------------------------------------------
+    def insert(self, records):
+        self.db.executemany(
+            "INSERT INTO results (name, player, score, mode, date, lifelines_left) VALUES (?, ?, ?, ?, ?, ?)",
+            [(r["name"], player_key(r["name"]), r["score"], r["mode"], r["date"], r.get("lifelines_left")) for r in records])
+
+    def add(self, name, score, mode, date=None):
+        record = {"name": name or "Unknown", "score": int(score), "mode": normalise_mode(mode), "date": date or datetime.now().strftime(DATE_FORMAT)}
+        with self.db:
+            self.insert([record])
+        return record
+
+    # ---------------------------------------------------
+    # QUERIES
+    # ---------------------------------------------------
+    def filters(self, mode=None, player=None, since=None, until=None):
+        clauses, args = [], []
+        if mode: clauses.append("mode = ?"); args.append(mode)
+        if player: clauses.append("player = ?"); args.append(player_key(player))
+        if since: clauses.append("date >= ?"); args.append(since)
+        if until: clauses.append("date < ?"); args.append(until)
+        return clauses, args
+
+    def where(self, clauses): return " WHERE " + " AND ".join(clauses) if clauses else ""
+
+    # Up to k rows in `order`; the ids are picked from the index alone and
+    # only those k rows are read from the table
+    def select(self, clauses, args, order, k):
+        rows = self.db.execute(f"SELECT id, name, score, mode, date, lifelines_left FROM results WHERE id IN "
+                               f"(SELECT id FROM results{self.where(clauses)} ORDER BY {order} LIMIT ?) ORDER BY {order}",
+                               args + [k])
+        return [dict(row) for row in rows]
+
+    # Best `k` results, optionally for one mode, one player and/or a
+    # [since, until) date range ("YYYY-MM-DD[ HH:MM]" strings). `after` /
+    # `before` are the (score, id) of a row already shown: the k rows
+    # right after / before it. Rows carry their id for that.
+    def top(self, k=10, offset=0, mode=None, player=None, since=None, until=None, after=None, before=None):
+        clauses, args = self.filters(mode, player, since, until)
+        if before is not None:
+            # Ties with the first row come first, then everything scored higher
+            score, row_id = before
+            rows = self.select(clauses + ["score = ?", "id < ?"], args + [score, row_id], REVERSED, k)
+            if len(rows) < k: rows += self.select(clauses + ["score > ?"], args + [score], REVERSED, k - len(rows))
+            return rows[::-1]
+        if after is None and offset > 0:
+            after = self.key_at(offset - 1, clauses, args)
+            if after is None: return []
+        if after is None: return self.select(clauses, args, ORDER, k)
+        score, row_id = after
+        rows = self.select(clauses + ["score = ?", "id > ?"], args + [score, row_id], ORDER, k)
+        if len(rows) < k: rows += self.select(clauses + ["score < ?"], args + [score], ORDER, k - len(rows))
+        return rows
+
+    # (score, id) of the row at position n, from the index keys alone
+    def key_at(self, n, clauses, args):
+        row = self.db.execute(f"SELECT score, id FROM results{self.where(clauses)} ORDER BY {ORDER} LIMIT 1 OFFSET ?",
+                              args + [n]).fetchone()
+        return tuple(row) if row else None
+
+    def count(self, mode=None, player=None, since=None, until=None):
+        clauses, args = self.filters(mode, player, since, until)
+        return self.db.execute(f"SELECT COUNT(*) FROM results{self.where(clauses)}", args).fetchone()[0]
+
+    def modes(self):
+        return [row[0] for row in self.db.execute("SELECT DISTINCT mode FROM results ORDER BY mode")]
+
+    def close(self):
+        try: self.db.close()
+        except: pass
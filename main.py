@@ -1,10 +1,53 @@
 import tkinter as tk
 from tkinter import Entry
-from PIL import Image, ImageTk, ImageEnhance, ImageDraw
+from PIL import Image, ImageDraw
 import os
-import random
-import json
+import sys
+import time
+import sqlite3
+import atexit
 from datetime import datetime
+from collections import OrderedDict
+from assets import AssetCache, AssetRegistry, AssetLoader, SpriteAtlas
+from scheduler import FrameScheduler, TimerService, WakeupMeter
+from layout import LayoutEngine
+from engine import HangmanEngine
+from wordstore import WordStore
+from wordbag import WordScheduler
+from leaderboard import LeaderboardStore, DATE_FORMAT
+from journal import WriteBehindJournal
+from stats import PlayerStats, StatsRecorder, POWERUPS
+try:
+    from analyzer import ScoredBank
+except ImportError:
+    ScoredBank = None
+try:
+    from solver import Solver, SolverSession, AIOpponent
+except ImportError:
+    Solver = None
+
+FIRST_FRAME_ASSETS = ("bg", "title", "start_norm", "start_hover", "rank_norm", "rank_hover", "info_norm", "info_hover")
+
+# Large images each screen keeps pinned; anything else may be evicted when
+# HANGMAN_ASSET_BUDGET_MB is set (atlas sprites are never evicted).
+SCREEN_ASSETS = {
+    "menu": ("bg", "title"),
+    "difficulty": ("bg", "details_Easiest", "details_Medium", "details_Hardest"),
+    "game": ("bg", "game_bg", "game_static", "overlay_red", "overlay_green") + tuple(f"hang_{i}" for i in range(7)),
+    "leaderboard": ("bg",),
+    "stats": ("bg",),
+}
+ASSET_BUDGET_MB = int(os.environ.get("HANGMAN_ASSET_BUDGET_MB", "0") or 0)
+# Bake background, key shadows/faces and the heart frame into one image
+COMPOSITE_STATIC = os.environ.get("HANGMAN_COMPOSITE_STATIC", "1") != "0"
+# Quiet period after the last <Configure> before re-laying out the window
+RESIZE_DEBOUNCE_MS = 150
+# "scored": Easiest/Medium/Hardest are thirds of the whole bank ranked by
+# analyzer.py (needs numpy), falling back to the curated keys if the bank
+# can't be scored; "curated": always the hand-picked keys in words.json
+WORD_DIFFICULTY = os.environ.get("HANGMAN_WORD_DIFFICULTY", "scored")
+# Seconds without input before power saving kicks in (0 turns it off)
+IDLE_SECONDS = float(os.environ.get("HANGMAN_IDLE_SECONDS", "120") or 0)
 
 # =============================================================================
 # CLASS: GAME SCREEN (UI Rendering)
@@ -14,569 +57,1069 @@ class GameScreen:
         self.app = app
         self.canvas = app.canvas
         self.assets = app.assets
-        self.scale = app.scale
-        
+        self.game = app.engine
+        self.L = app.layout
+
         self.active_tooltip = None
+        self.composite = COMPOSITE_STATIC
+        self.hover_key = None
         self.load_game_assets()
+        self.build()
+        self.game.subscribe(self.on_event)
 
     # ---------------------------------------------------
     # LOAD ASSETS
     # ---------------------------------------------------
-    def load_game_assets(self):
+    def load_game_assets(self, block=True):
+        loader = self.app.loader
+        specs = GameScreen.image_specs(self.app) + GameScreen.sprite_specs(self.app)
+        overlays = GameScreen.overlay_factories(self.app)
+        for spec in specs: loader.submit(*spec)
+        for name, factory in overlays.items(): loader.submit_generated(name, factory)
+        names = [spec[0] for spec in specs] + list(overlays)
+        if self.composite:
+            loader.submit_generated("game_static", self.compose_static_layer)
+            names.append("game_static")
+        if block: loader.require(names)
+
+    # ---------------------------------------------------
+    # STATIC LAYER (background + key shadows/faces + heart frame)
+    # ---------------------------------------------------
+    # Rendered with PIL off the Tk thread and cached on disk per resolution.
+    # Only keys that leave the plain paper state get a live face item.
+    def compose_static_layer(self):
         base = getattr(self.app, "base_path", os.path.dirname(os.path.abspath(__file__)))
+        cache = self.app.asset_cache
+        L = self.L
+        w, h = L.width, L.height
+        bg_path = os.path.join(base, "background2.png")
+        heart_path = os.path.join(base, "heart_empty.png")
+        heart_size = L.heart_size
+        params = {"size": [w, h], "keys": L.key_rects, "hearts": L.heart_positions, "heart": heart_size,
+                  "colors": [self.C_SHADOW, self.C_PAPER, self.C_OUTLINE]}
+
+        def render():
+            bg = cache.get(bg_path, (w, h))
+            layer = bg.convert("RGBA") if bg else Image.new("RGBA", (w, h), "#1a1a1a")
+            draw = ImageDraw.Draw(layer)
+            for x, y, key_w, key_h in L.key_rects.values():
+                draw.rectangle([x+3, y+3, x+key_w+3, y+key_h+3], fill=self.C_SHADOW)
+                draw.rectangle([x, y, x+key_w, y+key_h], fill=self.C_PAPER, outline=self.C_OUTLINE, width=1)
+            heart = cache.get(heart_path, (heart_size, heart_size), Image.Resampling.NEAREST)
+            if heart:
+                heart = heart.convert("RGBA")
+                for hx, hy in L.heart_positions:
+                    layer.alpha_composite(heart, (hx - heart_size // 2, hy - heart_size // 2))
+            return layer
+
+        return cache.get_composite("game_static", [bg_path, heart_path], params, render)
+
+    @staticmethod
+    def image_specs(app):
+        base = getattr(app, "base_path", os.path.dirname(os.path.abspath(__file__)))
+        L = app.layout
+        specs = []
 
         # 1. Background
-        bg_path = os.path.join(base, "background2.png")
-        if os.path.exists(bg_path):
-            img = Image.open(bg_path).resize((self.app.screen_width, self.app.screen_height), Image.Resampling.LANCZOS)
-            self.assets["game_bg"] = ImageTk.PhotoImage(img)
+        specs.append(("game_bg", os.path.join(base, "background2.png"), (L.width, L.height)))
 
         # 2. Hangman Stages
-        h_h = int(self.app.screen_height * 0.80) 
+        h_h = L.hangman_h
         for i in range(1, 8):
-            path = os.path.join(base, f"{i}.png")
-            if os.path.exists(path):
-                img = Image.open(path)
-                ratio = img.width / img.height
-                new_w = int(h_h * ratio)
-                img = img.resize((new_w, h_h), Image.Resampling.LANCZOS)
-                self.assets[f"hang_{i-1}"] = ImageTk.PhotoImage(img)
+            specs.append((f"hang_{i-1}", os.path.join(base, f"{i}.png"), lambda s: (int(h_h * s[0] / s[1]), h_h)))
+        return specs
+
+    # Small images, packed into the sprite atlas
+    @staticmethod
+    def sprite_specs(app):
+        base = getattr(app, "base_path", os.path.dirname(os.path.abspath(__file__)))
+        L = app.layout
+        specs = []
 
         # 3. Hearts
+        size = L.heart_size
         for name in ["heart_filled", "heart_empty"]:
-            path = os.path.join(base, f"{name}.png")
-            if os.path.exists(path):
-                size = int(32 * self.scale) 
-                img = Image.open(path).resize((size, size), Image.Resampling.NEAREST)
-                self.assets[name] = ImageTk.PhotoImage(img)
+            specs.append((name, os.path.join(base, f"{name}.png"), (size, size), Image.Resampling.NEAREST))
 
         # 4. Powerup Buttons
-        btn_w = int(130 * self.scale)
-        btn_h = int(110 * self.scale)
-        boost_w = int(btn_w * 1.15)
-        boost_h = int(btn_h * 1.15)
-
-        for name in ["roulette", "freeze", "duality", "reveal", "filter"]:
+        for name in ["roulette", "freeze", "duality", "reveal", "filter", "oracle"]:
             path = os.path.join(base, f"{name}_btn.png")
-            if os.path.exists(path):
-                raw_img = Image.open(path)
-                img_std = raw_img.resize((btn_w, btn_h), Image.Resampling.LANCZOS)
-                self.assets[f"icon_{name}_std"] = ImageTk.PhotoImage(img_std)
-                img_hover = raw_img.resize((boost_w, boost_h), Image.Resampling.LANCZOS)
-                self.assets[f"icon_{name}_hover"] = ImageTk.PhotoImage(img_hover)
-                desaturator = ImageEnhance.Color(img_std)
-                img_grey = desaturator.enhance(0.0)
-                self.assets[f"icon_{name}_grey"] = ImageTk.PhotoImage(img_grey)
+            specs.append((f"icon_{name}_std", path, L.powerup_size))
+            specs.append((f"icon_{name}_hover", path, L.powerup_hover_size))
+            specs.append((f"icon_{name}_grey", path, L.powerup_size, Image.Resampling.LANCZOS, "grey"))
 
         # 5. Exit Button
-        path = os.path.join(base, "exit_game_btn.png")
-        if os.path.exists(path):
-            size = int(50 * self.scale)
-            img = Image.open(path).resize((size, size), Image.Resampling.LANCZOS)
-            self.assets["exit_btn"] = ImageTk.PhotoImage(img)
-
-        # 6. Generate Overlays
-        self.generate_overlays()
-
-    def generate_overlays(self):
-        w, h = self.app.screen_width, self.app.screen_height
-        
-        red_ov = Image.new("RGBA", (w, h), (200, 0, 0, 0)) 
-        draw_r = ImageDraw.Draw(red_ov)
-        draw_r.rectangle([0, 0, w, h], fill=(139, 0, 0, 100))
-        self.assets["overlay_red"] = ImageTk.PhotoImage(red_ov)
-
-        green_ov = Image.new("RGBA", (w, h), (0, 200, 0, 0))
-        draw_g = ImageDraw.Draw(green_ov)
-        draw_g.rectangle([0, 0, w, h], fill=(0, 100, 0, 100)) 
-        self.assets["overlay_green"] = ImageTk.PhotoImage(green_ov)
+        specs.append(("exit_btn", os.path.join(base, "exit_game_btn.png"), (L.exit_size, L.exit_size)))
+        return specs
+
+    @staticmethod
+    def overlay_factories(app):
+        w, h = app.layout.width, app.layout.height
+        return {
+            "overlay_red": lambda: Image.new("RGBA", (w, h), (139, 0, 0, 100)),
+            "overlay_green": lambda: Image.new("RGBA", (w, h), (0, 100, 0, 100)),
+        }
 
     # ---------------------------------------------------
-    # DRAW FULL SCENE
+    # RETAINED SCENE
     # ---------------------------------------------------
-    def draw(self):
-        self.app.clear_screen()
-        self.app.current_state = "GAME"
-        w, h = self.app.screen_width, self.app.screen_height
-
-        if "game_bg" in self.assets:
-            self.canvas.create_image(0, 0, image=self.assets["game_bg"], anchor="nw")
-
-        split_x = int(w * 0.38)
-        btn_strip_x = int(w * 0.85)
-        self.paper_cx = split_x + (btn_strip_x - split_x) // 2
-        left_cx = split_x // 2 + 25 
-        
-        # --- ADDED TAG 'main_hangman' FOR OPTIMIZED UPDATES ---
-        hang_y = int(h * 0.55) 
-        hang_key = f"hang_{self.app.wrong_guesses}"
-        if hang_key in self.assets:
-            self.canvas.create_image(left_cx, hang_y, image=self.assets[hang_key], tags="main_hangman")
-
-        self.canvas.create_text(
-            left_cx, h * 0.88,
-            text=f"Score: {self.app.score}",
-            fill="black", 
-            font=("Ubuntu", int(28 * self.scale), "bold"),
-            tags="score_text"  # Added tag
-        )
-
-        margin = int(25 * self.scale)
-        if "exit_btn" in self.assets:
-            img_id = self.canvas.create_image(w - margin, margin, image=self.assets["exit_btn"], anchor="ne", tags="exit_btn")
-            self.canvas.tag_bind("exit_btn", "<Button-1>", lambda e: self.app.draw_main_menu())
-
-        # 1. WORD
-        word_y = int(h * 0.18)
-        self.draw_responsive_word(self.paper_cx, word_y, btn_strip_x - split_x)
-        
-        # 2. HINT
-        hint_y = word_y + int(60 * self.scale)
-        self.canvas.create_text(
-            self.paper_cx, hint_y,
-            text=f"Hint: {self.app.current_hint}",
-            fill="#555",
-            font=("Ubuntu", int(15 * self.scale), "italic"),
-            width=int((btn_strip_x - split_x) * 0.9),
-            justify="center"
-        )
-
-        # 3. STATUS / HELP
-        status_y = hint_y + int(60 * self.scale)
-        status_text = ""
-        status_color = "#333333"
-        status_font_w = "normal"
-        
-        if self.app.roulette_step == "waiting_for_guess":
-             status_text = "GAMBLE ACTIVE: Correct = +1 Lifelines | Wrong = -1 Lifelines"
-             status_color = "#c0392b"
-             status_font_w = "bold"
-        elif self.app.duality_active:
-             status_text = "SHIELD ACTIVE: Next wrong guess ignored!"
-             status_color = "#27ae60"
-             status_font_w = "bold"
-        elif self.active_tooltip: 
-             status_text = self.active_tooltip
-             status_color = "#2980b9"
-        
-        self.canvas.create_text(
-            self.paper_cx, status_y,
-            text=status_text,
-            fill=status_color,
-            font=("Ubuntu", int(14 * self.scale), status_font_w),
-            width=int((btn_strip_x - split_x) * 0.9),
-            justify="center",
-            tags="status_area"
-        )
+    # Every game item is created once (build) and kept for the whole session
+    # under the "game_scene" tag. Rounds, powerups and roulette only push
+    # changed options through itemconfig/coords; leaving the screen hides the
+    # items instead of deleting them. place() positions everything from the
+    # current Layout, so a window resize is coords() calls, not a rebuild.
+    def item(self, name, kind, tags=(), **kw):
+        coords = (0, 0, 0, 0) if kind in ("rectangle", "oval") else (0, 0)
+        iid = getattr(self.canvas, f"create_{kind}")(*coords, tags=("game_scene",) + tuple(tags), **kw)
+        self.items[name] = iid
+        self.applied[iid] = dict(kw)
+        self.applied[iid]["_coords"] = coords
+        return iid
+
+    def set(self, name, **kw):
+        iid = self.items[name]
+        cur = self.applied[iid]
+        diff = {k: v for k, v in kw.items() if cur.get(k) != v}
+        if diff:
+            self.canvas.itemconfig(iid, **diff)
+            cur.update(diff)
+
+    def move(self, name, *coords):
+        iid = self.items[name]
+        if self.applied[iid]["_coords"] != coords:
+            self.canvas.coords(iid, *coords)
+            self.applied[iid]["_coords"] = coords
+
+    def visible(self, name, flag):
+        self.set(name, state="normal" if flag else "hidden")
+
+    def build(self):
+        self.items = {}
+        self.applied = {}
+
+        self.item("bg", "image", image="", anchor="nw")
+        self.item("hangman", "image", tags=("main_hangman",), image="")
+        self.item("score", "text", tags=("score_text",), text="", fill="black")
+
+        self.item("exit", "image", tags=("exit_btn",), image="", anchor="ne")
+        self.canvas.tag_bind("exit_btn", "<Button-1>", lambda e: self.app.draw_main_menu())
+
+        # 1. WORD / 2. HINT / 3. STATUS
+        self.item("word", "text", tags=("word_layer",), text="", fill="black")
+        self.item("hint", "text", text="", fill="#555", justify="center")
+        self.item("status", "text", tags=("status_area",), text="", fill="#333333", justify="center")
+        self.item("ai", "text", text="", fill="#6c5ce7", justify="center", state="hidden")
 
         # 4. KEYBOARD
-        self.keyboard_y = int(h * 0.55)
-        self.max_kb_width = (btn_strip_x - split_x) * 0.85 
-        self.draw_themed_keyboard(self.paper_cx, self.keyboard_y, self.max_kb_width)
-
-        # 5. HEARTS - ADDED TAGS FOR OPTIMIZATION
-        hearts_y = int(h * 0.80)
-        gap = int(45 * self.scale)
-        start_hearts_x = self.paper_cx - (6 * gap) // 2 + (gap // 2)
-        
-        hp = 6 - self.app.wrong_guesses
+        self.build_keyboard()
+
+        # 5. HEARTS (with the composite layer only filled hearts are live)
         for i in range(6):
-            key = "heart_filled" if i < hp else "heart_empty"
-            if key in self.assets:
-                self.canvas.create_image(
-                    start_hearts_x + (i * gap), hearts_y, 
-                    image=self.assets[key],
-                    tags=f"heart_{i}" # Tag added for updating
-                )
+            self.item(f"heart_{i}", "image", tags=(f"heart_{i}",), image="")
 
         # 6. TIMER
-        if self.app.game_mode == "Hardest":
-            timer_y = int(h * 0.90)
-            t_color = "#c0392b" if self.app.time_left <= 5 else "black"
-            timer_text = f"Time: {self.app.time_left}s"
-            if self.app.freeze_active:
-                 timer_text += " (FROZEN)"
-                 t_color = "#2980b9"
-            self.canvas.create_text(
-                self.paper_cx, timer_y,
-                text=timer_text, fill=t_color,
-                font=("Ubuntu", int(24 * self.scale), "bold")
-            )
-
-        # 3. Powerups
-        btn_cx = btn_strip_x + (w - btn_strip_x) // 2
-        btn_start_y = int(h * 0.35) 
-        self.draw_powerups_vertical(btn_cx, btn_start_y)
-
-    def draw_responsive_word(self, cx, y, container_width):
-        self.canvas.delete("word_layer")
-        word_len = len(self.app.current_word)
-        base_size = 55 
-        
-        if word_len > 10:
-            font_size = int(base_size * (10 / word_len))
-        else:
-            font_size = base_size
-            
-        font_size = max(int(font_size * self.scale), 20)
-        
-        display_text = " ".join([l if l in self.app.guessed_letters else "_" for l in self.app.current_word])
-        
-        self.canvas.create_text(
-            cx, y,
-            text=display_text,
-            fill="black",
-            font=("Ubuntu", font_size, "bold"),
-            tags="word_layer"
-        )
+        self.item("timer", "text", tags=("timer_text",), text="", fill="black", state="hidden")
+
+        # 7. POWERUPS
+        self.build_powerups()
+
+        # 8. ROULETTE OVERLAY (raised above everything while shown)
+        self.item("overlay_fade", "rectangle", tags=("roulette_fx",), fill="#8B0000", outline="",
+                  stipple="gray12", state="hidden")
+        self.item("overlay", "image", tags=("roulette_fx",), image="", anchor="nw", state="hidden")
+        self.item("overlay_text", "text", tags=("roulette_fx",), text="", fill="#8B0000", state="hidden")
+        self.place()
+
+    def place(self):
+        L = self.L
+        self.move("bg", 0, 0)
+        self.move("hangman", *L.hangman_pos)
+        self.move("score", *L.score_pos)
+        self.set("score", font=L.fonts["score"])
+        self.move("exit", *L.exit_pos)
+
+        self.move("word", L.paper_cx, L.word_y)
+        self.move("hint", L.paper_cx, L.hint_y)
+        self.set("hint", font=L.fonts["hint"], width=L.text_w)
+        self.move("status", L.paper_cx, L.status_y)
+        self.set("status", width=L.text_w)
+        self.move("ai", *L.ai_pos)
+        self.set("ai", font=L.fonts["ai"], width=L.split_x * 0.9)
+
+        for char, (x, y, key_w, key_h) in L.key_rects.items():
+            if not self.composite:
+                self.move(f"key_shadow_{char}", x+3, y+3, x+key_w+3, y+key_h+3)
+            self.move(f"key_face_{char}", x, y, x+key_w, y+key_h)
+            self.move(f"key_label_{char}", x+key_w/2, y+key_h/2)
+            self.set(f"key_label_{char}", font=L.fonts["key"])
+
+        for i, pos in enumerate(L.heart_positions):
+            self.move(f"heart_{i}", *pos)
+        self.move("timer", *L.timer_pos)
+        self.set("timer", font=L.fonts["timer"])
+        for name in self.POWERUPS:
+            self.set(f"pu_{name}_count", font=L.fonts["badge"])
+
+        self.move("overlay_fade", 0, 0, L.width, L.height)
+        self.move("overlay", 0, 0)
+        self.move("overlay_text", L.width // 2, L.height // 2)
+
+    # Called by HangmanUI after a window resize: move items in place; the
+    # images are swapped by draw() once the rescaled assets arrive.
+    def relayout(self):
+        self.L = self.app.layout
+        self.place()
+        self.draw()
+        self.load_game_assets(block=False)
+
+    # Leaving the game hides the scene (HangmanUI.clear_screen); coming back
+    # re-shows it on top of the menu background and restores hidden items.
+    def show(self):
+        self.canvas.itemconfig("game_scene", state="normal")
+        self.canvas.tag_raise("game_scene")
+        for iid, cur in self.applied.items():
+            if cur.get("state") == "hidden": self.canvas.itemconfig(iid, state="hidden")
+
+    def enter(self):
+        self.app.clear_screen()
+        self.app.current_state = "GAME"
+        self.load_game_assets()
+        self.active_tooltip = None
+        self.hover_key = None
+        self.show()
+        self.hide_overlays()
+        self.draw()
 
     # ---------------------------------------------------
-    # INITIAL KEYBOARD DRAWING (Only called once per game load)
+    # SYNC FULL SCENE (no items are created here)
     # ---------------------------------------------------
-    def draw_themed_keyboard(self, cx, cy, max_width):
-        self.canvas.delete("keyboard_layer")
-        rows = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
-        base_key_size = 45 * self.scale 
-        key_w = int(base_key_size); key_h = int(base_key_size); gap = int(10 * self.scale)
-        
-        row_max_chars = 10
-        total_w_needed = row_max_chars * (key_w + gap)
-        if total_w_needed > max_width:
-            ratio = max_width / total_w_needed
-            key_w = int(key_w * ratio); key_h = int(key_h * ratio); gap = int(gap * ratio)
-
-        c_paper = "#f7f1e3"; c_ink = "#2f3542"; c_hover = "#ffeaa7"
-        c_correct = "#55efc4"; c_wrong = "#ff7675"; c_used = "#dfe6e9"
-        c_outline = "#a4b0be"; c_shadow = "#b2bec3"
-
-        total_h = 3 * (key_h + gap)
-        start_y = cy - total_h // 2
-
-        for r_i, row_str in enumerate(rows):
-            row_width = len(row_str) * (key_w + gap) - gap
-            row_start_x = cx - row_width // 2
-            
-            for k_i, char in enumerate(row_str):
-                x = row_start_x + k_i * (key_w + gap)
-                y = start_y + r_i * (key_h + gap)
-                
-                group_tag = f"key_{char}"
-                bg_tag = f"key_bg_{char}"
-                
-                bg_color = c_paper; fg_color = c_ink; outline_color = c_outline
-                if char in self.app.guessed_letters:
-                    outline_color = bg_color 
-                    if char in self.app.current_word: bg_color = c_correct; fg_color = "white"
-                    else: bg_color = c_wrong; fg_color = "white"
-                elif char in self.app.disabled_keys:
-                    bg_color = c_used; fg_color = "#b2bec3"
-
-                self.canvas.create_rectangle(x+3, y+3, x+key_w+3, y+key_h+3, fill=c_shadow, outline="", tags=(group_tag, "keyboard_layer"))
-                self.canvas.create_rectangle(x, y, x+key_w, y+key_h, fill=bg_color, outline=outline_color, width=1, tags=(group_tag, bg_tag, "keyboard_layer"))
-                self.canvas.create_text(x+key_w/2, y+key_h/2, text=char, fill=fg_color, font=("Ubuntu", int(18 * self.scale), "bold"), tags=(group_tag, "keyboard_layer"))
-                
-                if char not in self.app.guessed_letters and char not in self.app.disabled_keys:
-                    if hasattr(self.app, "handle_guess"):
-                        self.canvas.tag_bind(group_tag, "<Button-1>", lambda e, c=char: self.app.handle_guess(c))
-                    
-                    def enter(e, t=bg_tag, b=bg_color): 
-                        if b == c_paper: self.canvas.itemconfig(t, fill=c_hover)
-                    def leave(e, t=bg_tag, b=bg_color): 
-                        self.canvas.itemconfig(t, fill=b)
-                    self.canvas.tag_bind(group_tag, "<Enter>", enter)
-                    self.canvas.tag_bind(group_tag, "<Leave>", leave)
+    def draw(self):
+        self.set("bg", image=self.assets.get("game_static" if self.composite else "game_bg", ""))
+        self.set("exit", image=self.assets.get("exit_btn", ""))
+        self.set("hint", text=f"Hint: {self.game.current_hint}")
+        self.sync_word()
+        self.sync_status()
+        self.sync_ai()
+        for char in "ABCDEFGHIJKLMNOPQRSTUVWXYZ": self.sync_key(char)
+        self.update_hangman_ui()
+        self.visible("timer", self.game.game_mode == "Hardest")
+        self.update_timer_text()
+        self.sync_powerups()
+
+    # Engine events re-sync only what changed (see engine.HangmanEngine)
+    def on_event(self, event, data):
+        if self.app.current_state != "GAME": return
+        if event == "letter":
+            self.sync_key(data["char"])
+            self.app.root.update_idletasks()
+        elif event == "keys":
+            for char in data["chars"]: self.sync_key(char)
+        elif event == "word": self.sync_word()
+        elif event in ("lives", "score"): self.update_hangman_ui()
+        elif event == "powerups": self.sync_powerups()
+        elif event == "status": self.sync_status()
+        elif event == "shield_used": self.update_help_text("Shield Used! Wrong guess ignored.", "#e67e22")
+        elif event == "oracle":
+            self.sync_key(data["char"])
+            self.update_help_text(f"ORACLE: Try the letter {data['char']}", "#6c5ce7")
+        elif event in ("time", "freeze"): self.update_timer_text()
+
+    def sync_word(self):
+        display_text = self.game.masked_word()
+        self.set("word", text=display_text, font=self.L.word_font(len(self.game.current_word)))
+
+    # VS COMPUTER: the computer's progress on the same word
+    def sync_ai(self):
+        ai = self.app.ai if self.app.ai_playing else None
+        self.visible("ai", ai is not None)
+        if ai: self.set("ai", text=f"COMPUTER  {6 - ai.engine.wrong_guesses} lives\n{ai.engine.masked_word()}")
+
+    def sync_status(self):
+        if self.game.roulette_step == "waiting_for_guess":
+             self.update_help_text("GAMBLE ACTIVE: Correct = +1 Lifelines | Wrong = -1 Lifelines", "#c0392b")
+        elif self.game.duality_active:
+             self.update_help_text("SHIELD ACTIVE: Next wrong guess ignored!", "#27ae60")
+        elif self.active_tooltip:
+             self.set("status", text=self.active_tooltip, fill="#2980b9", font=("Ubuntu", self.L.fonts["status"], "normal"))
+        else:
+             self.update_help_text("", "#333333")
 
     # ---------------------------------------------------
-    # NEW OPTIMIZED UPDATE FUNCTIONS (FIX FOR LAG)
+    # KEYBOARD
     # ---------------------------------------------------
-    def update_key_visual(self, char):
-        # 1. Determine Color
-        c_correct = "#55efc4"
-        c_wrong = "#ff7675"
-        
-        bg_tag = f"key_bg_{char}"
-        group_tag = f"key_{char}"
-        
-        if char in self.app.current_word:
-            new_bg = c_correct
-        else:
-            new_bg = c_wrong
-            
-        # 2. Update Canvas Items (Instant)
-        self.canvas.itemconfig(bg_tag, fill=new_bg, outline=new_bg)
-        
-        # 3. Find text item inside group and make it white
-        # We rely on tag matching. The text item shares the 'key_char' tag.
-        # But so does the background. However, text has a 'text' attribute, rect doesn't.
-        # Simpler: Just config all items with that tag to have white fill, 
-        # but rectangles ignore text-fill colors usually.
-        # Safest way without complex ID lookups is just re-tagging properly or assuming standard behavior.
-        # Actually, let's just use the group tag to unbind events first.
-        
-        self.canvas.tag_unbind(group_tag, "<Button-1>")
-        self.canvas.tag_unbind(group_tag, "<Enter>")
-        self.canvas.tag_unbind(group_tag, "<Leave>")
-        
-        # Make the text white. We iterate items with the group tag to find the text one.
-        items = self.canvas.find_withtag(group_tag)
-        for item in items:
-            type_ = self.canvas.type(item)
-            if type_ == "text":
-                self.canvas.itemconfig(item, fill="white")
-    
+    C_PAPER = "#f7f1e3"; C_INK = "#2f3542"; C_HOVER = "#ffeaa7"
+    C_CORRECT = "#55efc4"; C_WRONG = "#ff7675"; C_USED = "#dfe6e9"
+    C_OUTLINE = "#a4b0be"; C_SHADOW = "#b2bec3"; C_HINT = "#a29bfe"
+
+    def build_keyboard(self):
+        for char in self.L.key_rects:
+            group_tag = f"key_{char}"
+            bg_tag = f"key_bg_{char}"
+
+            if not self.composite:
+                self.item(f"key_shadow_{char}", "rectangle", tags=(group_tag, "keyboard_layer"), fill=self.C_SHADOW, outline="")
+            self.item(f"key_face_{char}", "rectangle", tags=(group_tag, bg_tag, "keyboard_layer"),
+                      fill=self.C_PAPER, outline=self.C_OUTLINE, width=1, state="hidden" if self.composite else "normal")
+            self.item(f"key_label_{char}", "text", tags=(group_tag, "keyboard_layer"), text=char, fill=self.C_INK)
+
+            # Bound once; the handlers read live state so nothing is rebound per guess
+            if not self.composite:
+                self.canvas.tag_bind(group_tag, "<Button-1>", lambda e, c=char: self.app.handle_guess(c))
+                self.app.bind_hover(group_tag, lambda e, c=char: self.on_key_enter(c), lambda e, c=char: self.sync_key(c))
+
+        # Baked faces have no item to bind to, so hit-test the key rects instead
+        if self.composite:
+            self.canvas.bind("<Motion>", self.on_canvas_motion, add="+")
+            self.canvas.bind("<Button-1>", self.on_canvas_click, add="+")
+
+    def key_at(self, event):
+        if self.app.current_state != "GAME": return None
+        top = self.canvas.find_withtag("current")
+        if not top: return None
+        tags = self.canvas.gettags(top[0])
+        if "game_scene" not in tags or "roulette_fx" in tags: return None
+        return self.L.key_at(event.x, event.y)
+
+    def on_canvas_motion(self, event):
+        if self.app.power_reasons: return
+        char = self.key_at(event)
+        if char == self.hover_key: return
+        prev, self.hover_key = self.hover_key, char
+        if prev: self.sync_key(prev)
+        if char: self.on_key_enter(char)
+
+    def on_canvas_click(self, event):
+        char = self.key_at(event)
+        if char: self.app.handle_guess(char)
+
+    def on_key_enter(self, char):
+        if not self.game.is_guessed(char) and not self.game.is_disabled(char):
+            self.set(f"key_face_{char}", fill=self.C_HOVER, state="normal")
+
+    def sync_key(self, char):
+        bg_color = self.C_PAPER; fg_color = self.C_INK; outline_color = self.C_OUTLINE
+        if self.game.is_guessed(char):
+            bg_color = self.C_CORRECT if self.game.in_word(char) else self.C_WRONG
+            fg_color = "white"; outline_color = bg_color
+        elif self.game.is_disabled(char):
+            bg_color = self.C_USED; fg_color = "#b2bec3"
+        elif char == self.game.hint:
+            bg_color = self.C_HINT; fg_color = "white"; outline_color = "#6c5ce7"
+        plain = self.composite and bg_color == self.C_PAPER and char != self.hover_key
+        self.set(f"key_face_{char}", fill=bg_color, outline=outline_color, state="hidden" if plain else "normal")
+        self.set(f"key_label_{char}", fill=fg_color)
+
     def update_hangman_ui(self):
         # 1. Update Hangman Image
-        hang_key = f"hang_{self.app.wrong_guesses}"
-        if hang_key in self.assets:
-            self.canvas.itemconfig("main_hangman", image=self.assets[hang_key])
-            
+        self.set("hangman", image=self.assets.get(f"hang_{self.game.wrong_guesses}", ""))
+
         # 2. Update Hearts
-        hp = 6 - self.app.wrong_guesses
+        hp = 6 - self.game.wrong_guesses
         for i in range(6):
             key = "heart_filled" if i < hp else "heart_empty"
-            if key in self.assets:
-                self.canvas.itemconfig(f"heart_{i}", image=self.assets[key])
-                
+            if self.composite:
+                self.visible(f"heart_{i}", i < hp)
+                key = "heart_filled"
+            self.set(f"heart_{i}", image=self.assets.get(key, ""))
+
         # 3. Update Score text (in case logic changes score)
-        self.canvas.itemconfig("score_text", text=f"Score: {self.app.score}")
+        self.set("score", text=f"Score: {self.game.score}")
+
+    def timer_style(self):
+        t_color = "#c0392b" if self.game.time_left <= 5 else "black"
+        timer_text = f"Time: {self.game.time_left}s"
+        if self.game.freeze_active:
+             timer_text += " (FROZEN)"
+             t_color = "#2980b9"
+        return timer_text, t_color
+
+    # Timer ticks only touch the timer item, never the whole scene
+    def update_timer_text(self):
+        timer_text, t_color = self.timer_style()
+        self.set("timer", text=timer_text, fill=t_color)
 
     # ---------------------------------------------------
+    # ROULETTE OVERLAY
+    # ---------------------------------------------------
+    # The overlay fades in through the stipple steps Tk already ships (the
+    # popups use the same trick) and lands on the real RGBA image; the caption
+    # grows from 60% to full size. Both run as tweens on app.animator and
+    # `on_done` fires after `hold` seconds unless the effect is cancelled.
+    FADE_STEPS = ("gray12", "gray25", "gray50", "gray75")
+
+    def play_overlay(self, asset, fade_color, text, color, family, size, hold, on_done=None):
+        self.set("overlay_fade", fill=fade_color, stipple=self.FADE_STEPS[0], state="normal")
+        self.set("overlay", image=self.assets.get(asset, ""), state="hidden")
+        self.set("overlay_text", text=text, fill=color, state="normal")
+        self.canvas.tag_raise("roulette_fx")
+
+        def frame(p):
+            if p >= 1.0:
+                self.visible("overlay_fade", False)
+                self.visible("overlay", True)
+            else:
+                self.set("overlay_fade", stipple=self.FADE_STEPS[min(int(p * len(self.FADE_STEPS)), len(self.FADE_STEPS) - 1)])
+            self.set("overlay_text", font=(family, max(1, int(size * self.L.scale * (0.6 + 0.4 * p))), "bold"))
 
-    def show_roulette_intro(self):
-        if "overlay_red" in self.assets:
-            self.canvas.create_image(0, 0, image=self.assets["overlay_red"], anchor="nw", tags="roulette_fx")
-        cx, cy = self.app.screen_width // 2, self.app.screen_height // 2
-        self.canvas.create_text(
-            cx, cy, text="GAMBLE ACTIVATED", fill="#8B0000",
-            font=("Chiller", int(60 * self.scale), "bold"), tags="roulette_fx"
-        )
+        self.app.animator.animate("overlay_fade", 0.25, frame)
+        self.app.animator.wait("overlay_hold", hold, on_done)
 
-    def show_roulette_result(self, won):
-        self.canvas.delete("roulette_fx") 
+    def show_roulette_intro(self, on_done=None):
+        self.play_overlay("overlay_red", "#8B0000", "GAMBLE ACTIVATED", "#8B0000", "Chiller", 60, 2.0, on_done)
+
+    def show_roulette_result(self, won, on_done=None):
         overlay = "overlay_green" if won else "overlay_red"
         text = "ROULETTE WON!" if won else "ROULETTE LOST!"
         color = "#00FF00" if won else "#FF0000"
-        
-        if overlay in self.assets:
-            self.canvas.create_image(0, 0, image=self.assets[overlay], anchor="nw", tags="roulette_res")
-        cx, cy = self.app.screen_width // 2, self.app.screen_height // 2
-        self.canvas.create_text(
-            cx, cy, text=text, fill=color, 
-            font=("Ubuntu", int(50 * self.scale), "bold"), tags="roulette_res"
-        )
+        self.play_overlay(overlay, "#006400" if won else "#8B0000", text, color, "Ubuntu", 50, 1.0, on_done)
 
     def hide_overlays(self):
-        self.canvas.delete("roulette_fx")
-        self.canvas.delete("roulette_res")
+        self.app.animator.cancel("overlay_fade", "overlay_hold")
+        self.visible("overlay_fade", False)
+        self.visible("overlay", False)
+        self.visible("overlay_text", False)
 
-    def draw_powerups_vertical(self, cx, start_y):
-        names = ["roulette", "freeze", "duality", "reveal", "filter"]
-        gap = int(75 * self.scale) 
-        
-        descriptions = {
-            "roulette": "ROULETTE: 50/50 Chance. Win = +1 All Lifelines / Loss = -1 All Lifelines",
-            "freeze": "FREEZE: Stops the timer for 5 seconds.",
-            "duality": "DUALITY: Creates a shield. The next wrong guess is ignored.",
-            "reveal": "REVEAL: Instantly uncovers one random correct letter.",
-            "filter": "FILTER: Removes 3 incorrect letters from the keyboard."
-        }
+    # ---------------------------------------------------
+    # POWERUPS
+    # ---------------------------------------------------
+    POWERUPS = ["roulette", "freeze", "duality", "reveal", "filter", "oracle"]
+    DESCRIPTIONS = {
+        "roulette": "ROULETTE: 50/50 Chance. Win = +1 All Lifelines / Loss = -1 All Lifelines",
+        "freeze": "FREEZE: Stops the timer for 5 seconds.",
+        "duality": "DUALITY: Creates a shield. The next wrong guess is ignored.",
+        "reveal": "REVEAL: Instantly uncovers one random correct letter.",
+        "filter": "FILTER: Removes 3 incorrect letters from the keyboard.",
+        "oracle": "ORACLE: Highlights the letter that narrows the word down the most."
+    }
+
+    def build_powerups(self):
+        for name in self.POWERUPS:
+            btn_tag = f"btn_{name}"
+            self.item(f"pu_{name}", "image", tags=(btn_tag,), image="")
+            self.item(f"pu_{name}_shadow", "oval", fill="#000000", outline="")
+            self.item(f"pu_{name}_badge", "oval", fill="#c0392b", outline="white", width=2)
+            self.item(f"pu_{name}_count", "text", text="", fill="white")
 
-        current_idx = 0
-        for name in names:
-            if name == "freeze" and self.app.game_mode != "Hardest": continue
+            self.canvas.tag_bind(btn_tag, "<Button-1>", lambda e, n=name: self.app.use_powerup(n))
+            self.app.bind_hover(btn_tag, lambda e, n=name: self.on_powerup_enter(n), lambda e, n=name: self.on_powerup_leave(n))
 
-            y = start_y + current_idx * gap
-            current_idx += 1 
-            
-            count = self.app.powerups.get(name, 0)
-            btn_tag = f"btn_{name}"
+    def on_powerup_enter(self, name):
+        if self.game.powerups.get(name, 0) <= 0: return
+        self.set(f"pu_{name}", image=self.assets.get(f"icon_{name}_hover", ""))
+        self.active_tooltip = self.DESCRIPTIONS[name]
+        self.update_help_text(self.active_tooltip, "#2980b9")
 
-            if count > 0:
-                key_default = f"icon_{name}_std"
-                key_hover = f"icon_{name}_hover"
-            else:
-                key_default = f"icon_{name}_grey"
-                key_hover = None
-
-            if key_default in self.assets:
-                img_id = self.canvas.create_image(cx, y, image=self.assets[key_default], tags=btn_tag)
-                
-                if count > 0 and key_hover in self.assets:
-                    if hasattr(self.app, "use_powerup"):
-                          self.canvas.tag_bind(btn_tag, "<Button-1>", lambda e, n=name: self.app.use_powerup(n))
-                    
-                    img_normal_obj = self.assets[key_default]
-                    img_hover_obj = self.assets[key_hover]
-                    
-                    def on_enter(e, _id=img_id, _img=img_hover_obj, _txt=descriptions[name]): 
-                        self.canvas.itemconfig(_id, image=_img)
-                        self.active_tooltip = _txt
-                        self.update_help_text(_txt, "#2980b9")
-
-                    def on_leave(e, _id=img_id, _img=img_normal_obj): 
-                        self.canvas.itemconfig(_id, image=_img)
-                        self.active_tooltip = None
-                        self.update_help_text("", "#333")
-                        if self.app.duality_active: self.update_help_text("SHIELD ACTIVE: Next wrong guess ignored!", "#27ae60")
-                        if self.app.roulette_step == "waiting_for_guess": self.update_help_text("GAMBLE ACTIVE: Correct = +1 Lifelines | Wrong = -1 Lifelines", "#c0392b")
-
-                    self.canvas.tag_bind(btn_tag, "<Enter>", on_enter)
-                    self.canvas.tag_bind(btn_tag, "<Leave>", on_leave)
-
-            if count >= 0:
-                badge_x = cx + 35 * self.scale; badge_y = y - 20 * self.scale; r = 11 * self.scale
-                self.canvas.create_oval(badge_x-r+2, badge_y-r+2, badge_x+r+2, badge_y+r+2, fill="#000000", outline="")
-                self.canvas.create_oval(badge_x-r, badge_y-r, badge_x+r, badge_y+r, fill="#c0392b", outline="white", width=2)
-                self.canvas.create_text(badge_x, badge_y, text=str(count), fill="white", font=("Ubuntu", int(11 * self.scale), "bold"))
+    def on_powerup_leave(self, name):
+        self.active_tooltip = None
+        self.sync_powerups()
+        self.sync_status()
+
+    def sync_powerups(self):
+        L = self.L
+        r = L.badge_r
+        current_idx = 0
+        for name in self.POWERUPS:
+            shown = not (name == "freeze" and self.game.game_mode != "Hardest")
+            for part in ("", "_shadow", "_badge", "_count"):
+                self.visible(f"pu_{name}{part}", shown)
+            if not shown: continue
+
+            y = L.btn_start_y + current_idx * L.powerup_gap
+            current_idx += 1
+            count = self.game.powerups.get(name, 0)
+            key = f"icon_{name}_std" if count > 0 else f"icon_{name}_grey"
+            self.move(f"pu_{name}", L.btn_cx, y)
+            self.set(f"pu_{name}", image=self.assets.get(key, ""))
+
+            badge_x = L.btn_cx + L.badge_offset[0]; badge_y = y + L.badge_offset[1]
+            self.move(f"pu_{name}_shadow", badge_x-r+2, badge_y-r+2, badge_x+r+2, badge_y+r+2)
+            self.move(f"pu_{name}_badge", badge_x-r, badge_y-r, badge_x+r, badge_y+r)
+            self.move(f"pu_{name}_count", badge_x, badge_y)
+            self.set(f"pu_{name}_count", text=str(count))
 
     def update_help_text(self, text, color):
-        self.canvas.delete("status_area")
-        y = int(self.app.screen_height * 0.18) + int(60 * self.scale) + int(60 * self.scale)
-        split_x = int(self.app.screen_width * 0.38)
-        btn_strip_x = int(self.app.screen_width * 0.85)
-        
         font_w = "bold" if text else "normal"
-        self.canvas.create_text(
-            self.paper_cx, y, text=text, fill=color,
-            font=("Ubuntu", int(14 * self.scale), font_w),
-            width=int((btn_strip_x - split_x) * 0.9), justify="center", tags="status_area"
-        )
+        self.set("status", text=text, fill=color, font=("Ubuntu", self.L.fonts["status"], font_w))
+
+# =============================================================================
+# CLASS: LEADERBOARD VIEW (Virtualized, scrollable result list)
+# =============================================================================
+# Only the rows that fit the panel plus OVERSCAN spare rows exist as canvas
+# items. Scrolling changes a pixel offset and re-points the same row slots
+# (coords/itemconfig), so 100k results cost as many items as 10. Entries are
+# read from the LeaderboardStore PAGE_ROWS at a time and the last MAX_PAGES
+# pages are kept; every page fetched leaves its first and last (score, id)
+# in `bounds`, so the page next to it is a keyset read rather than an
+# OFFSET walk. Canvas items can't be clipped, so a row is hidden once its
+# centre leaves the panel. Wheel, drag and arrow/page keys scroll; tabs
+# filter by mode.
+class LeaderboardView:
+    TABS = ("All", "Easiest", "Medium", "Hardest")
+    PAGE_ROWS = 100
+    MAX_PAGES = 8
+    OVERSCAN = 2
+    WHEEL_ROWS = 3
+
+    def __init__(self, app):
+        self.app = app
+        self.canvas = app.canvas
+        self.mode = "All"
+        self.offset = 0
+        self.target = 0
+        self.total = 0
+        self.pages = OrderedDict()
+        self.bounds = {}
+        self.slots = []
+        self.drag_y = None
+        self.dragged = False
+
+        # Bound once; the handlers check that the leaderboard is showing
+        self.canvas.bind("<MouseWheel>", self.on_wheel, add="+")
+        self.canvas.bind("<Button-4>", lambda e: self.scroll_rows(-self.WHEEL_ROWS), add="+")
+        self.canvas.bind("<Button-5>", lambda e: self.scroll_rows(self.WHEEL_ROWS), add="+")
+        self.canvas.bind("<ButtonPress-1>", self.on_press, add="+")
+        self.canvas.bind("<B1-Motion>", self.on_drag, add="+")
+        self.canvas.bind("<ButtonRelease-1>", lambda e: setattr(self, "drag_y", None), add="+")
+        keys = {"<Up>": -1, "<Down>": 1, "<Prior>": "-page", "<Next>": "page", "<Home>": "home", "<End>": "end"}
+        for seq, step in keys.items():
+            self.app.root.bind(seq, lambda e, s=step: self.on_key(s), add="+")
+
+    def active(self): return self.app.current_screen == "leaderboard" and bool(self.slots)
+
+    # ---------------------------------------------------
+    # DATA (pages from the store)
+    # ---------------------------------------------------
+    def reset(self):
+        self.mode = "All"
+        self.offset = 0
+        self.app.animator.cancel("lb_scroll")
+
+    def load(self):
+        store = self.app.leaderboard
+        self.pages.clear()
+        self.bounds.clear()
+        self.total = store.count(mode=self.query_mode()) if store else 0
+
+    def query_mode(self): return None if self.mode == "All" else self.mode
+
+    def entry(self, n):
+        if not 0 <= n < self.total: return None
+        page = n // self.PAGE_ROWS
+        if page in self.pages:
+            self.pages.move_to_end(page)
+        else:
+            self.pages[page] = rows = self.fetch(page)
+            if rows: self.bounds[page] = (self.key(rows[0]), self.key(rows[-1]))
+            if len(self.pages) > self.MAX_PAGES: self.pages.popitem(last=False)
+        rows = self.pages[page]
+        i = n - page * self.PAGE_ROWS
+        return rows[i] if i < len(rows) else None
+
+    def key(self, row): return (row["score"], row["id"])
+
+    def fetch(self, page):
+        store = self.app.leaderboard
+        if not store: return []
+        if page - 1 in self.bounds: return store.top(self.PAGE_ROWS, after=self.bounds[page - 1][1], mode=self.query_mode())
+        if page + 1 in self.bounds: return store.top(self.PAGE_ROWS, before=self.bounds[page + 1][0], mode=self.query_mode())
+        return store.top(self.PAGE_ROWS, offset=page * self.PAGE_ROWS, mode=self.query_mode())
+
+    # ---------------------------------------------------
+    # BUILD (once per visit / resize)
+    # ---------------------------------------------------
+    # `top`/`bottom` bound the row area, `columns` are the four column x's
+    def build(self, left, top, right, bottom, gap, columns, tabs_y):
+        s = self.app.scale
+        self.top, self.bottom, self.gap, self.columns = top, bottom, gap, columns
+        self.visible_rows = max(1, (bottom - top) // gap)
+        self.slots = []
+        self.load()
+
+        tab_w = (right - left) / len(self.TABS)
+        for i, mode in enumerate(self.TABS):
+            tag = f"lb_tab_{mode}"
+            self.canvas.create_text(left + tab_w * (i + 0.5), tabs_y, text=mode.upper(), font=("Ubuntu", int(18*s), "bold"),
+                                    tags=("lb_tab", tag))
+            self.canvas.tag_bind(tag, "<Button-1>", lambda e, m=mode: self.set_mode(m))
+
+        fonts = (("Ubuntu", 18, "bold"), ("Ubuntu", 18), ("Ubuntu", 18), ("Ubuntu", 18, "bold"))
+        colors = ("#ccc", "white", "#aaa", "#FFD700")
+        for k in range(self.visible_rows + 1 + self.OVERSCAN):
+            tag = f"lb_slot_{k}"
+            self.slots.append([self.canvas.create_text(x, top, text="", fill=c, font=f, state="hidden", tags=("lb_row", tag))
+                               for x, c, f in zip(columns, colors, fonts)] + [None])
+            self.canvas.tag_bind(tag, "<ButtonRelease-1>", lambda e, k=k: self.open_stats(k))
+
+        self.empty = self.canvas.create_text((left + right) // 2, (top + bottom) // 2, text="", fill="#888",
+                                             font=("Ubuntu", int(20*s)), tags="lb_row")
+        bar_x = right - int(12*s)
+        self.track = (bar_x, top - gap // 2, bar_x + int(6*s), bottom)
+        self.thumb = self.canvas.create_rectangle(*self.track, fill="#FFD700", outline="", tags="lb_row")
+        self.left, self.right = left, right
+        self.scroll_to(self.offset)
+        self.sync_tabs()
+
+    def sync_tabs(self):
+        for mode in self.TABS:
+            self.canvas.itemconfig(f"lb_tab_{mode}", fill="#FFD700" if mode == self.mode else "#777")
+
+    def set_mode(self, mode):
+        if mode == self.mode: return
+        self.mode = mode
+        self.app.animator.cancel("lb_scroll")
+        self.load()
+        self.sync_tabs()
+        self.scroll_to(0)
 
+    # ---------------------------------------------------
+    # SCROLLING (re-points slots, never creates items)
+    # ---------------------------------------------------
+    def max_offset(self): return max(0, (self.total - self.visible_rows) * self.gap)
+
+    # Row n always lives in slot n % len(slots), so scrolling by a row
+    # rewrites the text of the one slot that wrapped; the rest only move.
+    def scroll_to(self, offset):
+        if not self.slots: return
+        self.offset = min(max(0, int(offset)), self.max_offset())
+        first = max(0, self.offset // self.gap - self.OVERSCAN // 2)
+        margin = self.gap // 4
+        for n in range(first, first + len(self.slots)):
+            slot = self.slots[n % len(self.slots)]
+            y = self.top + n * self.gap - self.offset + self.gap // 2
+            entry = self.entry(n) if self.top + margin <= y <= self.bottom - margin else None
+            if entry is None:
+                if slot[4] is not None:
+                    for iid in slot[:4]: self.canvas.itemconfig(iid, state="hidden")
+                    slot[4] = None
+                continue
+            if slot[4] != n:
+                texts = (f"{n+1}.", entry.get("name", "Unknown"), entry.get("mode", "Easy"), str(entry["score"]))
+                for iid, text in zip(slot[:4], texts): self.canvas.itemconfig(iid, text=text, state="normal")
+                slot[4] = n
+            for iid, x in zip(slot[:4], self.columns): self.canvas.coords(iid, x, y)
+        self.canvas.itemconfig(self.empty, text="" if self.total else "No results yet")
+        self.sync_thumb()
+
+    def sync_thumb(self):
+        x0, y0, x1, y1 = self.track
+        if self.total <= self.visible_rows:
+            self.canvas.itemconfig(self.thumb, state="hidden")
+            return
+        span = y1 - y0
+        size = max(20, span * self.visible_rows / self.total)
+        at = y0 + (span - size) * self.offset / self.max_offset()
+        self.canvas.coords(self.thumb, x0, at, x1, at + size)
+        self.canvas.itemconfig(self.thumb, state="normal")
+
+    # Eased scroll towards a target (wheel, keys)
+    def glide_to(self, target):
+        target = min(max(0, target), self.max_offset())
+        start = self.offset
+        if target == start: return
+        self.target = target
+        self.app.animator.animate("lb_scroll", 0.18, lambda p: self.scroll_to(start + (target - start) * p))
+
+    def scroll_rows(self, rows):
+        if not self.active(): return
+        base = self.target if self.app.animator.is_active("lb_scroll") else self.offset
+        self.glide_to(base + rows * self.gap)
+
+    def on_wheel(self, event):
+        if not event.delta: return
+        # Windows reports multiples of 120 per notch, macOS small steps
+        notches = event.delta / 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll_rows(-round(notches * self.WHEEL_ROWS) or (-1 if event.delta > 0 else 1))
+
+    def on_key(self, step):
+        if not self.active(): return
+        if step == "home": self.glide_to(0)
+        elif step == "end": self.glide_to(self.max_offset())
+        elif step in ("page", "-page"): self.scroll_rows(self.visible_rows * (1 if step == "page" else -1))
+        else: self.scroll_rows(step)
+
+    def on_press(self, event):
+        inside = self.active() and self.left <= event.x <= self.right and self.top - self.gap <= event.y <= self.bottom
+        self.drag_y = event.y if inside else None
+        self.dragged = False
+
+    def on_drag(self, event):
+        if self.drag_y is None or not self.active(): return
+        if abs(event.y - self.drag_y) > 2: self.dragged = True
+        self.app.animator.cancel("lb_scroll")
+        self.scroll_to(self.offset + self.drag_y - event.y)
+        self.drag_y = event.y
+
+    # Clicking a row (not the end of a drag) opens that player's stats
+    def open_stats(self, k):
+        n = self.slots[k][4] if k < len(self.slots) else None
+        entry = self.entry(n) if n is not None and not self.dragged else None
+        if entry: self.app.draw_stats(entry.get("name", ""))
 
 # =============================================================================
 # CLASS: HANGMAN APP
 # =============================================================================
 class HangmanUI:
     def __init__(self, root):
+        self.start_time = time.perf_counter()
+        self.metrics = {}
         self.root = root
         self.root.title("Hangman Game")
         self.base_path = os.path.dirname(os.path.abspath(__file__))
 
-        self.screen_width = root.winfo_screenwidth()
-        self.screen_height = root.winfo_screenheight()
+        self.layout_engine = LayoutEngine()
+        self.apply_size(root.winfo_screenwidth(), root.winfo_screenheight())
         self.root.geometry(f"{self.screen_width}x{self.screen_height}")
         self.root.attributes('-fullscreen', True)
         self.root.bind("<Escape>", lambda event: self.root.attributes("-fullscreen", False))
-
-        ref_width = 900; ref_height = 650
-        self.scale = min(self.screen_width / ref_width, self.screen_height / ref_height)
+        self.root.bind("<F11>", lambda event: self.root.attributes("-fullscreen", True))
 
         self.canvas = tk.Canvas(root, width=self.screen_width, height=self.screen_height, highlightthickness=0, bg="#1a1a1a")
         self.canvas.pack(fill="both", expand=True)
 
         self.assets = {}
+        self.asset_cache = AssetCache(self.get_path(os.path.join("cache", "assets")), (self.screen_width, self.screen_height))
+        self.registry = AssetRegistry(self.asset_cache, ASSET_BUDGET_MB * 1024 * 1024 if ASSET_BUDGET_MB > 0 else None)
+        self.registry.on_evict = lambda name: self.assets.pop(name, None)
+        self.meter = WakeupMeter()
+        self.hover_binds = {}
+        self.power_reasons = set()
+        self.loader = AssetLoader(root, self.registry, self.put_asset, meter=self.meter)
+        self.animator = FrameScheduler(root, meter=self.meter)
+        self.atlas = SpriteAtlas(self.get_path(os.path.join("cache", "atlas")))
         self.words_data = {} 
-        self.leaderboard_data = []
-        self.load_words() 
-        self.load_leaderboard()
+        self.leaderboard = None
+        self.journal = None
+        self.leaderboard_view = None
         self.load_assets() 
 
         # Player Data
         self.player_name = ""
         self.entry_widget = None 
-
-        # Game State
-        self.game_mode = "Easy"
-        self.score = 0
-        self.streak = 0
-        self.streak_counter = 0 
-        self.current_word = ""
-        self.current_hint = ""
-        self.current_meaning = ""
-        self.guessed_letters = []
-        self.disabled_keys = []
-        self.wrong_guesses = 0
-        self.powerups = {"roulette": 1, "freeze": 1, "duality": 1, "reveal": 1, "filter": 1}
-        
-        self.time_left = 30
-        self.timer_id = None
-        self.freeze_active = False
-        self.duality_active = False 
-        self.roulette_step = "idle" 
-
+        self.game_screen = None
+        self.current_state = ""
+        self.current_screen = ""
+        self.popup_mode = None
+        self.end_popup = None
+        self.resize_id = None
+
+        # Game State (rules live in engine.HangmanEngine)
+        self.engine = HangmanEngine()
+        self.engine.subscribe(self.on_engine_event)
+        self.timers = TimerService(root, meter=self.meter)
+        self.stats = PlayerStats(self.get_path(os.path.join("data", "stats")))
+        StatsRecorder(self.engine, self.stats)
+        self.stats_player = ""
+        self.solver = None
+        self.ai = None
+        self.vs_ai = False
+        self.ai_playing = False
+
+        self.canvas.bind("<Expose>", self.on_first_expose)
+        self.canvas.bind("<Configure>", self.on_configure)
+        self.setup_power_saving()
         self.draw_main_menu()
+        self.data_loaded = False
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        atexit.register(self.close_journal)
 
     def get_path(self, filename): return os.path.join(self.base_path, filename)
 
     # --- LEADERBOARD & WORDS ---
+    # Words and leaderboard load once the first frame is up
+    # (record_first_frame); screens that need them call this first in case
+    # the player gets there sooner
+    def load_data(self):
+        if self.data_loaded: return
+        self.data_loaded = True
+        self.load_words()
+        self.load_leaderboard()
+
     def load_words(self):
+        # words.json is compiled to cache/words.bin and read through mmap;
+        # a bank built by importer.py (data/words.bin) takes precedence
+        scheduler = None
+        imported = self.get_path(os.path.join("data", "words.bin"))
         try:
-            with open(self.get_path("words.json"), "r") as f:
-                self.words_data = json.load(f)
+            if os.path.exists(imported): self.words_data = WordStore(imported)
+            else: self.words_data = WordStore.open(self.get_path("words.json"), self.get_path(os.path.join("cache", "words.bin")))
+            if WORD_DIFFICULTY == "scored" and ScoredBank:
+                try: self.words_data = ScoredBank.open(self.words_data, self.get_path(os.path.join("cache", "words.scores.npz")))
+                except ValueError: pass
+            scheduler = WordScheduler(self.get_path("data"), self.words_data)
         except:
-            self.words_data = {"Easy": [{"word": "APPLE", "meaning": "Red fruit", "hint": "Keeps doc away"}]}
+            if not self.words_data:
+                self.words_data = {"Easy": [{"word": "APPLE", "meaning": "Red fruit", "hint": "Keeps doc away"}]}
+        self.engine.load_words(self.words_data, scheduler)
 
-    def load_leaderboard(self):
-        try:
-            with open(self.get_path("leaderboard.json"), "r") as f:
-                self.leaderboard_data = json.load(f)
-        except:
-            self.leaderboard_data = []
-
-    def update_leaderboard(self):
-        if self.score > 0:
-            entry = {"score": self.score, "mode": self.game_mode, "date": datetime.now().strftime("%Y-%m-%d %H:%M"), "name": self.player_name}
-            self.leaderboard_data.append(entry)
-            self.leaderboard_data.sort(key=lambda x: x["score"], reverse=True)
-            self.leaderboard_data = self.leaderboard_data[:10] 
+        # The oracle powerup and the computer opponent share one solver; its
+        # length indexes are built on the loader pool as each round starts
+        if Solver and self.solver is None:
             try:
-                with open(self.get_path("leaderboard.json"), "w") as f:
-                    json.dump(self.leaderboard_data, f)
-            except: pass
-
-    def save_leaderboard(self):
-        # Already handled by update_leaderboard called in game_loss/close
-        self.update_leaderboard()
-
-    def get_word_by_difficulty(self, mode):
-        key_map = {"Easiest": "Easy", "Medium": "Medium", "Hardest": "Hardest"}
-        json_key = key_map.get(mode, "Easy")
-        candidates = self.words_data.get(json_key, [])
-        if not candidates: return ("ERROR", "Missing Data", "No Hint")
-        choice = random.choice(candidates)
-        return (choice["word"].upper(), choice["meaning"], choice.get("hint", "No hint available."))
-
-    def load_assets(self):
-        try:
-            bg = Image.open(self.get_path("background.png")).resize((self.screen_width, self.screen_height), Image.Resampling.LANCZOS)
-            self.assets["bg"] = ImageTk.PhotoImage(bg)
-        except: pass
+                self.solver = Solver(self.words_data)
+                self.engine.solver = SolverSession(self.solver, self.engine, self.loader.pool)
+            except:
+                self.solver = None
+
+    # Results live in data/leaderboard.db; the shipped leaderboard.json is
+    # imported into it the first time the game starts. Writes go through
+    # the write-behind journal so the Tk thread never waits on the disk.
+    # If the database can't be opened, this session's results are kept in
+    # memory only, and the reason is logged.
+    def load_leaderboard(self):
+        db_path = self.get_path(os.path.join("data", "leaderboard.db"))
         try:
-            title = Image.open(self.get_path("hangman_title.png"))
-            tw = int(self.screen_width * 0.69); th = int((title.height * tw) / title.width)
-            self.assets["title"] = ImageTk.PhotoImage(title.resize((tw, th), Image.Resampling.LANCZOS))
-        except: pass
+            self.leaderboard = LeaderboardStore(db_path, self.get_path("leaderboard.json"))
+            self.journal = WriteBehindJournal(db_path)
+        except (sqlite3.Error, OSError) as e:
+            print(f"leaderboard: can't open {db_path} ({e}); results this session won't be saved", file=sys.stderr)
+            self.leaderboard = LeaderboardStore(":memory:")
+
+    def update_leaderboard(self, score=None):
+        if score is None: score = self.engine.score
+        if score > 0 and self.leaderboard:
+            date = datetime.now().strftime(DATE_FORMAT)
+            if self.journal: self.journal.add_result(self.player_name, score, self.engine.game_mode, date)
+            else: self.leaderboard.add(self.player_name, score, self.engine.game_mode, date)
+
+    def close_journal(self):
+        if self.journal: self.journal.close()
+
+    def on_close(self):
+        self.loader.shutdown()
+        self.close_journal()
+        self.root.destroy()
+
+    def save_leaderboard(self, score=None):
+        # Already handled by update_leaderboard called on a lost round/close
+        self.update_leaderboard(score)
+
+    def load_assets(self, background=False):
+        # Main menu assets load inline for the first frame; everything else
+        # (popups, difficulty buttons, the game screen) decodes in the back.
+        # After a resize (background=True) nothing blocks: the old images stay
+        # on screen until the rescaled ones arrive.
+        if not background: self.asset_cache.prune()
+        for spec in self.image_specs():
+            if spec[0] in FIRST_FRAME_ASSETS and not background:
+                try: self.put_asset(spec[0], self.registry.load(*spec))
+                except: pass
+            else:
+                self.loader.submit(*spec)
+        for spec in GameScreen.image_specs(self): self.loader.submit(*spec)
+        for name, factory in GameScreen.overlay_factories(self).items(): self.loader.submit_generated(name, factory)
+
+        # Buttons, hearts and icons all come out of one atlas decode
+        sprite_specs = self.sprite_specs() + GameScreen.sprite_specs(self)
+        size = (self.screen_width, self.screen_height)
+        sprites = None if background else self.atlas.cached(sprite_specs, self.scale, size)
+        if sprites is None:
+            # Cold atlas: the menu buttons decode on their own, the atlas
+            # builds on the pool
+            if not background:
+                for spec in sprite_specs:
+                    if spec[0] in FIRST_FRAME_ASSETS:
+                        try: self.put_asset(spec[0], self.registry.load(*spec))
+                        except: pass
+            self.loader.submit_many([spec[0] for spec in sprite_specs], lambda: self.atlas.load(sprite_specs, self.scale, size))
+            return
+        for name, img in sprites.items():
+            if name in FIRST_FRAME_ASSETS:
+                self.put_asset(name, self.registry.store(name, img))
+            else:
+                self.loader.submit_generated(name, lambda img=img: img, evictable=False)
+
+    def apply_size(self, width, height):
+        self.screen_width = width
+        self.screen_height = height
+        self.layout = self.layout_engine.get(width, height)
+        self.scale = self.layout.scale
+        self.popup_w = self.layout.popup_w; self.popup_h = self.layout.popup_h
+
+    def image_specs(self):
+        specs = [("bg", self.get_path("background.png"), (self.screen_width, self.screen_height))]
+        tw = int(self.screen_width * 0.69)
+        specs.append(("title", self.get_path("hangman_title.png"), lambda s: (tw, int((s[1] * tw) / s[0]))))
 
-        self.popup_w = int(self.screen_width * 0.7); self.popup_h = int(self.screen_height * 0.7)
         details_map = {"Easiest": "easiest_details.png", "Medium": "medium_details.png", "Hardest": "hardest_details.png"}
         for mode, fname in details_map.items():
-            path = self.get_path(fname)
-            if os.path.exists(path):
-                self.assets[f"details_{mode}"] = ImageTk.PhotoImage(Image.open(path).resize((self.popup_w, self.popup_h), Image.Resampling.LANCZOS))
+            specs.append((f"details_{mode}", self.get_path(fname), (self.popup_w, self.popup_h)))
+        return specs
 
+    def sprite_specs(self):
+        specs = []
         for b in ["start", "rank", "info", "Easiest", "Medium", "Hardest", "play_next", "close", "try_again", "quit"]:
-            self.load_btn_asset(b, f"{b.lower()}_btn.png", 0.8 if b in ["start", "rank", "info"] else 0.4 if b in ["Easiest", "Medium", "Hardest"] else 0.6)
+            specs += self.btn_asset_specs(b, f"{b.lower()}_btn.png", 0.8 if b in ["start", "rank", "info"] else 0.4 if b in ["Easiest", "Medium", "Hardest"] else 0.6)
+        return specs
 
-    def load_btn_asset(self, name, filename, scale_fac):
-        try:
-            img = Image.open(self.get_path(filename))
-            s = scale_fac * self.scale
-            w, h = int(img.width * s * 0.5), int(img.height * s * 0.5)
-            self.assets[f"{name}_norm"] = ImageTk.PhotoImage(img.resize((w, h), Image.Resampling.LANCZOS))
-            self.assets[f"{name}_hover"] = ImageTk.PhotoImage(img.resize((int(w*1.05), int(h*1.05)), Image.Resampling.LANCZOS))
-        except: pass
+    def btn_asset_specs(self, name, filename, scale_fac):
+        s = scale_fac * self.scale
+        norm_size = lambda src: (int(src[0] * s * 0.5), int(src[1] * s * 0.5))
+        hover_size = lambda src: (int(int(src[0] * s * 0.5) * 1.05), int(int(src[1] * s * 0.5) * 1.05))
+        path = self.get_path(filename)
+        return [(f"{name}_norm", path, norm_size), (f"{name}_hover", path, hover_size)]
+
+    def put_asset(self, name, photo):
+        if photo: self.assets[name] = photo
+
+    def enter_screen(self, screen):
+        names = SCREEN_ASSETS[screen]
+        self.registry.pin(names)
+        self.loader.require(names)
+
+    def memory_usage(self):
+        stats = self.registry.stats()
+        return {"current_mb": stats["current_bytes"] / 1048576, "peak_mb": stats["peak_bytes"] / 1048576}
+
+    def on_first_expose(self, event):
+        self.canvas.unbind("<Expose>")
+        self.root.after_idle(self.record_first_frame)
+
+    def record_first_frame(self):
+        self.metrics["first_frame_ms"] = (time.perf_counter() - self.start_time) * 1000
+        self.root.after_idle(self.load_data)
+
+    # ---------------------------------------------------------
+    # WINDOW RESIZE
+    # ---------------------------------------------------------
+    # <Configure> fires continuously while a window is dragged; only the
+    # size it settles on is laid out. The game scene moves in place at once,
+    # assets are rescaled in the background and the screen is refreshed with
+    # them when the loader goes idle.
+    def on_configure(self, event):
+        if self.resize_id is not None: self.root.after_cancel(self.resize_id)
+        self.resize_id = None
+        if event.width < 2 or event.height < 2: return
+        if (event.width, event.height) == (self.screen_width, self.screen_height): return
+        self.resize_id = self.root.after(RESIZE_DEBOUNCE_MS, lambda: self.relayout(event.width, event.height))
+
+    def relayout(self, width, height):
+        self.resize_id = None
+        self.apply_size(width, height)
+        self.asset_cache = AssetCache(self.get_path(os.path.join("cache", "assets")), (width, height))
+        self.loader.reset()
+        self.registry.reset(self.asset_cache)
+        self.load_assets(background=True)
+        if self.game_screen: self.game_screen.relayout()
+        self.loader.when_idle(self.refresh_screen)
+
+    # Re-renders whatever is showing at the new size without side effects
+    def refresh_screen(self):
+        if self.current_screen == "game":
+            self.game_screen.draw()
+            if self.end_popup:
+                self.canvas.delete("end_pop")
+                self.show_end_popup(*self.end_popup)
+        elif self.current_screen == "menu":
+            self.render_main_menu()
+        elif self.current_screen == "leaderboard":
+            self.draw_leaderboard(reset=False)
+        elif self.current_screen == "stats":
+            self.draw_stats(self.stats_player)
+        elif self.current_screen == "difficulty":
+            mode = self.popup_mode
+            name = self.entry_widget.get() if self.entry_widget else ""
+            self.draw_difficulty_menu()
+            if mode:
+                self.open_popup(mode)
+                self.entry_widget.insert(0, name)
+
+    # ---------------------------------------------------------
+    # POWER SAVING
+    # ---------------------------------------------------------
+    # Losing focus, being minimised or IDLE_SECONDS without input suspends the
+    # round timer and all animations and unbinds every hover handler; the
+    # first input / focus / map event puts everything back exactly where it
+    # was. The idle check is one `after` aimed at the inactivity deadline, so
+    # input itself only stores a timestamp.
+    def setup_power_saving(self):
+        self.idle_id = None
+        self.last_input = time.monotonic()
+        self.power_since = None
+        for seq in ("<Motion>", "<KeyPress>", "<ButtonPress>", "<MouseWheel>"):
+            self.root.bind_all(seq, self.on_input, add="+")
+        self.root.bind("<FocusOut>", lambda e: self.root.after_idle(self.check_focus), add="+")
+        self.root.bind("<FocusIn>", lambda e: self.leave_power_save("focus"), add="+")
+        self.root.bind("<Unmap>", lambda e: e.widget is self.root and self.enter_power_save("hidden"), add="+")
+        self.root.bind("<Map>", lambda e: e.widget is self.root and self.leave_power_save("hidden"), add="+")
+        self.arm_idle_check(IDLE_SECONDS)
+
+    def arm_idle_check(self, seconds):
+        if IDLE_SECONDS > 0 and self.idle_id is None:
+            self.idle_id = self.root.after(max(1, int(seconds * 1000)), self.check_idle)
+
+    def check_idle(self):
+        self.idle_id = None
+        self.meter.hit("idle")
+        left = self.last_input + IDLE_SECONDS - time.monotonic()
+        if left > 0: self.arm_idle_check(left)
+        else: self.enter_power_save("idle")
+
+    def check_focus(self):
+        try: focused = self.root.focus_get()
+        except: focused = None
+        if focused is None: self.enter_power_save("focus")
+
+    def on_input(self, event):
+        self.last_input = time.monotonic()
+        if "idle" in self.power_reasons: self.leave_power_save("idle")
+
+    def enter_power_save(self, reason):
+        if reason in self.power_reasons: return
+        self.power_reasons.add(reason)
+        if len(self.power_reasons) > 1: return
+        self.power_since = (time.monotonic(), self.meter.total)
+        self.timers.suspend_all()
+        self.animator.suspend()
+        for spec in list(self.hover_binds):
+            try:
+                self.canvas.tag_unbind(spec, "<Enter>")
+                self.canvas.tag_unbind(spec, "<Leave>")
+            except: self.hover_binds.pop(spec)
+
+    def leave_power_save(self, reason):
+        if reason not in self.power_reasons: return
+        self.power_reasons.discard(reason)
+        if reason == "idle": self.arm_idle_check(IDLE_SECONDS)
+        if self.power_reasons: return
+        for spec, (on_enter, on_leave) in list(self.hover_binds.items()):
+            try:
+                self.canvas.tag_bind(spec, "<Enter>", on_enter)
+                self.canvas.tag_bind(spec, "<Leave>", on_leave)
+            except: self.hover_binds.pop(spec)
+        self.timers.resume_all()
+        self.animator.resume()
+        self.report_power_save()
+
+    def report_power_save(self):
+        since, total = self.power_since
+        minutes = max(time.monotonic() - since, 1e-6) / 60
+        self.metrics["power_save_wakeups_per_min"] = (self.meter.total - total) / minutes
+        self.metrics["wakeups_per_min"] = self.meter.per_minute()
+        self.metrics["power_save_seconds"] = minutes * 60
+
+    # Hover bindings go through here so power saving can drop and restore them
+    def bind_hover(self, spec, on_enter, on_leave):
+        self.hover_binds[spec] = (on_enter, on_leave)
+        if self.power_reasons: return
+        self.canvas.tag_bind(spec, "<Enter>", on_enter)
+        self.canvas.tag_bind(spec, "<Leave>", on_leave)
 
     # ---------------------------------------------------------
     # UI NAVIGATION
     # ---------------------------------------------------------
     def clear_screen(self):
-        self.canvas.delete("all")
+        # The game scene is retained across screens: hide it, delete the rest
+        self.canvas.delete("!game_scene")
+        self.canvas.itemconfig("game_scene", state="hidden")
+        self.hover_binds = {spec: b for spec, b in self.hover_binds.items() if self.canvas.find_withtag(spec)}
+        self.current_state = ""
         if self.entry_widget: 
             self.entry_widget.destroy()
             self.entry_widget = None
         if "bg" in self.assets: self.canvas.create_image(0, 0, image=self.assets["bg"], anchor="nw")
 
     def create_btn(self, x, y, name, cmd, tag=None):
+        self.loader.require((f"{name}_norm", f"{name}_hover"))
         if f"{name}_norm" not in self.assets: 
             t = tag if tag else "ui"
             self.canvas.create_text(x, y, text=f"[{name.upper()}]", fill="white", font=("Ubuntu", 20), tags=t)
@@ -585,21 +1128,32 @@ class HangmanUI:
         tag = tag if tag else f"btn_{id(cmd)}"
         bid = self.canvas.create_image(x, y, image=self.assets[f"{name}_norm"], tags=tag)
         self.canvas.tag_bind(bid, "<Button-1>", lambda e: cmd())
-        self.canvas.tag_bind(bid, "<Enter>", lambda e: self.canvas.itemconfig(bid, image=self.assets[f"{name}_hover"]))
-        self.canvas.tag_bind(bid, "<Leave>", lambda e: self.canvas.itemconfig(bid, image=self.assets[f"{name}_norm"]))
+        self.bind_hover(bid, lambda e: self.canvas.itemconfig(bid, image=self.assets[f"{name}_hover"]),
+                        lambda e: self.canvas.itemconfig(bid, image=self.assets[f"{name}_norm"]))
 
     def draw_main_menu(self):
         self.cancel_timer()
+        self.animator.cancel_all()
+        self.end_popup = None
+        self.engine.reset_score()
+        self.render_main_menu()
+
+    def render_main_menu(self):
+        self.enter_screen("menu")
         self.clear_screen()
-        self.score = 0 
+        self.current_screen = "menu"
         if "title" in self.assets:
             self.canvas.create_image(self.screen_width//2, int(self.screen_height*0.05), image=self.assets["title"], anchor="n")
         self.create_btn(self.screen_width//2, int(self.screen_height*0.58), "start", lambda: self.draw_difficulty_menu())
         self.create_btn(self.screen_width//2, int(self.screen_height*0.78), "rank", lambda: self.draw_leaderboard())
         self.create_btn(60*self.scale, self.screen_height-60*self.scale, "info", lambda: print("Info"))
 
-    def draw_leaderboard(self):
+    # reset=False keeps the tab and scroll position (window resize)
+    def draw_leaderboard(self, reset=True):
+        self.load_data()
+        self.enter_screen("leaderboard")
         self.clear_screen()
+        self.current_screen = "leaderboard"
         cx = self.screen_width // 2
         self.canvas.create_text(60*self.scale, 60*self.scale, text="< BACK", fill="white", font=("Ubuntu", int(20*self.scale), "bold"), tags="back")
         self.canvas.tag_bind("back", "<Button-1>", lambda e: self.draw_main_menu())
@@ -631,28 +1185,116 @@ class HangmanUI:
         
         start_y = line_y + int(40*self.scale)
         gap = int(50 * self.scale)
-        
-        for i, entry in enumerate(self.leaderboard_data):
-            y = start_y + (i * gap)
-            if y > panel_top + panel_h - 40: break
-            
-            rank_txt = f"{i+1}."
-            self.canvas.create_text(col1, y, text=rank_txt, fill="#ccc", font=("Ubuntu", 18, "bold"))
-            self.canvas.create_text(col2, y, text=entry.get("name", "Unknown"), fill="white", font=("Ubuntu", 18))
-            self.canvas.create_text(col3, y, text=entry.get("mode", "Easy"), fill="#aaa", font=("Ubuntu", 18))
-            self.canvas.create_text(col4, y, text=str(entry["score"]), fill="#FFD700", font=("Ubuntu", 18, "bold"))
+
+        if self.leaderboard_view is None: self.leaderboard_view = LeaderboardView(self)
+        if reset: self.leaderboard_view.reset()
+        self.leaderboard_view.build(cx - panel_w//2, start_y - gap//2, cx + panel_w//2, panel_top + panel_h - 20, gap,
+                                    (col1, col2, col3, col4), panel_top - int(22*self.scale))
+
+        if self.player_name:
+            self.canvas.create_text(self.screen_width - 60*self.scale, 60*self.scale, text="MY STATS >", fill="white",
+                                    font=("Ubuntu", int(20*self.scale), "bold"), anchor="e", tags="my_stats")
+            self.canvas.tag_bind("my_stats", "<Button-1>", lambda e: self.draw_stats(self.player_name))
+
+    # Everything here is read from the player's running totals
+    # (stats.PlayerStats), so it costs the same after 10 games or 10,000
+    def draw_stats(self, player):
+        self.load_data()
+        self.enter_screen("stats")
+        self.clear_screen()
+        self.current_screen = "stats"
+        self.stats_player = player
+        s = self.scale
+        cx = self.screen_width // 2
+        self.canvas.create_text(60*s, 60*s, text="< BACK", fill="white", font=("Ubuntu", int(20*s), "bold"), tags="back")
+        self.canvas.tag_bind("back", "<Button-1>", lambda e: self.draw_leaderboard(reset=False))
+        self.canvas.create_text(cx, int(self.screen_height*0.1), text=player.upper(), fill="#FFD700", font=("Ubuntu", int(40*s), "bold"))
+
+        panel_w = int(self.screen_width * 0.7)
+        panel_h = int(self.screen_height * 0.7)
+        panel_top = int(self.screen_height * 0.18)
+        left = cx - panel_w//2
+        self.canvas.create_rectangle(left, panel_top, cx + panel_w//2, panel_top + panel_h,
+                                     fill="#1a1a1a", outline="#555", width=3, stipple="gray25")
+        try: st = self.stats.summary(player)
+        except (OSError, ValueError):
+            st = None
+        if not st or not st["games"]:
+            self.canvas.create_text(cx, panel_top + panel_h//2, text="No games recorded yet", fill="#888", font=("Ubuntu", int(20*s)))
+            return
+
+        gap = int(42 * s)
+        rows = [
+            ("GAMES", str(st["games"])),
+            ("WIN RATE", f"{st['win_rate']:.0%}  ({st['wins']} W / {st['losses']} L)"),
+            ("AVG WRONG GUESSES", f"{st['avg_wrong']:.1f}"),
+            ("STREAK", f"{st['streak']}  (best {st['best_streak']})"),
+            ("BEST SCORE", str(st["best_score"])),
+            ("AVG ROUND", f"{st['avg_seconds']:.0f}s"),
+        ]
+        label_x, value_x = left + int(panel_w * 0.08), left + int(panel_w * 0.36)
+        y = panel_top + int(50*s)
+        for label, value in rows:
+            self.canvas.create_text(label_x, y, text=label, fill="#aaa", font=("Ubuntu", 18, "bold"), anchor="w")
+            self.canvas.create_text(value_x, y, text=value, fill="white", font=("Ubuntu", 18), anchor="w")
+            y += gap
+
+        pu_x = left + int(panel_w * 0.68)
+        y = panel_top + int(50*s)
+        self.canvas.create_text(pu_x, y, text="POWERUPS USED", fill="#FFD700", font=("Ubuntu", 18, "bold"), anchor="w")
+        for name in POWERUPS:
+            y += gap
+            self.canvas.create_text(pu_x, y, text=name.upper(), fill="#aaa", font=("Ubuntu", 16, "bold"), anchor="w")
+            self.canvas.create_text(pu_x + int(panel_w * 0.22), y, text=str(st["powerups"][name]), fill="white", font=("Ubuntu", 16), anchor="e")
+
+        # Letter accuracy: share of guesses of each letter that were in the word
+        grid_top = panel_top + int(50*s) + gap * (max(len(rows), len(POWERUPS)) + 1)
+        self.canvas.create_text(label_x, grid_top - gap//2, text="LETTER ACCURACY", fill="#FFD700", font=("Ubuntu", 18, "bold"), anchor="w")
+        cell_w = (panel_w - 2 * (label_x - left)) / 13
+        cell_h = min(int(70*s), (panel_top + panel_h - 20 - grid_top) // 2)
+        for i, ch in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ"):
+            hit, tried = st["letters"][ch]
+            x0 = label_x + (i % 13) * cell_w
+            y0 = grid_top + (i // 13) * cell_h
+            if tried:
+                rate = hit / tried
+                fill = "#%02x%02x%02x" % (int(192 + (39 - 192) * rate), int(57 + (174 - 57) * rate), int(43 + (96 - 43) * rate))
+                value = f"{rate:.0%}"
+            else:
+                fill, value = "#333", "-"
+            self.canvas.create_rectangle(x0 + 3, y0 + 3, x0 + cell_w - 3, y0 + cell_h - 3, fill=fill, outline="")
+            self.canvas.create_text(x0 + cell_w/2, y0 + cell_h*0.35, text=ch, fill="white", font=("Ubuntu", int(16*s), "bold"))
+            self.canvas.create_text(x0 + cell_w/2, y0 + cell_h*0.7, text=value, fill="white", font=("Ubuntu", int(11*s)))
 
     def draw_difficulty_menu(self):
+        self.load_data()
+        self.enter_screen("difficulty")
         self.clear_screen()
+        self.current_screen = "difficulty"
+        self.popup_mode = None
         self.canvas.create_text(60*self.scale, 60*self.scale, text="< BACK", fill="white", font=("Ubuntu", int(20*self.scale), "bold"), tags="back")
         self.canvas.tag_bind("back", "<Button-1>", lambda e: self.draw_main_menu())
         y0 = self.screen_height * 0.35
         for i, m in enumerate(["Easiest", "Medium", "Hardest"]):
             self.create_btn(self.screen_width//2, y0 + i*120*self.scale, m, lambda mode=m: self.open_popup(mode))
+        if self.solver:
+            self.canvas.create_text(self.screen_width//2, y0 + 3*120*self.scale, text="", fill="white",
+                                    font=("Ubuntu", int(20*self.scale), "bold"), tags="vs_ai")
+            self.canvas.tag_bind("vs_ai", "<Button-1>", lambda e: self.toggle_vs_ai())
+            self.sync_vs_ai()
+
+    def toggle_vs_ai(self):
+        self.vs_ai = not self.vs_ai
+        self.sync_vs_ai()
+
+    def sync_vs_ai(self):
+        self.canvas.itemconfig("vs_ai", text=f"VS COMPUTER: {'ON' if self.vs_ai else 'OFF'}", fill="#FFD700" if self.vs_ai else "white")
 
     def open_popup(self, mode):
+        self.popup_mode = mode
         self.canvas.create_rectangle(0,0,self.screen_width,self.screen_height, fill="black", stipple="gray50", tags="pop")
         cx, cy = self.screen_width//2, self.screen_height//2
+        self.loader.require((f"details_{mode}",))
         if f"details_{mode}" in self.assets:
             self.canvas.create_image(cx, cy, image=self.assets[f"details_{mode}"], tags="pop")
         else:
@@ -683,7 +1325,7 @@ class HangmanUI:
                     entry_bg_x + entry_w/2 + 4, entry_bg_y + entry_h/2 + 4,
                     outline="#FF0000", width=3, tags="pop_err"
                 )
-                self.root.after(500, lambda: self.canvas.delete("pop_err"))
+                self.animator.wait("pop_err", 0.5, lambda: self.canvas.delete("pop_err"))
 
         play_btn_y = entry_bg_y + 80 * self.scale
         
@@ -691,6 +1333,7 @@ class HangmanUI:
         self.create_btn(cx, play_btn_y, "play_next", validate_start, tag="pop")
 
     def close_popup_logic(self):
+        self.popup_mode = None
         self.canvas.delete("pop")
         self.canvas.delete("pop_err")
         if self.entry_widget:
@@ -698,84 +1341,52 @@ class HangmanUI:
             self.entry_widget = None
 
     def start_game(self, mode):
+        self.load_data()
+        self.cancel_timer()
+        self.animator.cancel_all()
         self.close_popup_logic()
-        self.game_mode = mode 
-        word_tuple = self.get_word_by_difficulty(mode)
-        self.current_word = word_tuple[0]
-        self.current_meaning = word_tuple[1]
-        self.current_hint = word_tuple[2]
-        self.wrong_guesses = 0
-        self.guessed_letters = []
-        self.disabled_keys = [] 
-        self.freeze_active = False
-        self.duality_active = False
-        self.roulette_step = "idle"
-        self.time_left = 30 if mode == "Hardest" else 0
-        
-        self.game_screen = GameScreen(self)
-        self.game_screen.draw()
-        if mode == "Hardest": self.start_timer()
-
+        self.engine.player = self.player_name
+        self.engine.start_round(mode)
+        self.ai_playing = bool(self.vs_ai and self.solver)
+        if self.ai_playing:
+            if self.ai is None: self.ai = AIOpponent(self.solver)
+            self.ai.start(mode, self.engine.current_word)
+
+        self.enter_screen("game")
+        self.end_popup = None
+        if self.game_screen is None: self.game_screen = GameScreen(self)
+        self.game_screen.enter()
+        self.current_screen = "game"
+        if self.engine.time_left: self.start_timer()
+
+    # VS COMPUTER: the computer answers each of the player's guesses with
+    # one of its own on the same word; solving it first ends the round
     def handle_guess(self, char):
-        if self.roulette_step == "intro": return
-        if char in self.guessed_letters or char in self.disabled_keys: return
-        self.guessed_letters.append(char)
-        is_correct = (char in self.current_word)
-        
-        # --- FIXED: Use light update instead of full redraw ---
-        self.game_screen.update_key_visual(char)
-        self.root.update_idletasks() 
-
-        if self.roulette_step == "waiting_for_guess":
-            self.resolve_roulette_guess(is_correct)
-            self.roulette_step = "idle"
-            self.game_screen.update_help_text("", "#333") 
-
-        if not is_correct:
-            if self.duality_active:
-                self.duality_active = False 
-                # Instead of full draw, just update status text
-                self.game_screen.update_help_text("Shield Used! Wrong guess ignored.", "#e67e22")
+        if self.engine.guess(char) is None or not self.ai_playing or self.engine.over: return
+        self.ai.play_turn()
+        self.game_screen.sync_ai()
+        if self.ai.solved(): self.engine.lose("COMPUTER WINS!")
+
+    # Flow that needs Tk scheduling; item syncs are GameScreen.on_event
+    def on_engine_event(self, event, data):
+        if event == "roulette_started":
+            self.game_screen.show_roulette_intro(self.activate_roulette_selection)
+        elif event == "roulette_resolved":
+            self.game_screen.show_roulette_result(data["won"], self.end_roulette_result)
+        elif event == "freeze":
+            if data["active"]:
+                self.timers.pause("round")
+                self.timers.start("unfreeze", data["seconds"], self.engine.unfreeze)
             else:
-                self.wrong_guesses += 1
-                # --- FIXED: Only update hangman and hearts ---
-                self.game_screen.update_hangman_ui()
-        else:
-            # --- FIX: Added missing arguments for width calculation ---
-            w = self.screen_width
-            split_x = int(w * 0.38)
-            btn_strip_x = int(w * 0.85)
-            container_w = btn_strip_x - split_x
-            self.game_screen.draw_responsive_word(self.game_screen.paper_cx, int(self.screen_height * 0.18), container_w)
-
-        self.check_game_over()
-
-    def check_game_over(self):
-        if all(c in self.guessed_letters for c in self.current_word):
-            self.game_win()
-        elif self.wrong_guesses >= 6:
-            self.game_loss("Ran out of lives!")
-
-    def game_win(self):
-        self.cancel_timer()
-        self.score += 100
-        self.streak += 1
-        self.streak_counter += 1
-        msg = "YOU WON!"
-        if self.streak_counter >= 5:
-            self.streak_counter = 0
-            for k in self.powerups: self.powerups[k] += 1
-        self.show_end_popup(msg, True)
-
-    def game_loss(self, reason):
-        self.cancel_timer()
-        self.save_leaderboard() 
-        self.streak = 0
-        self.streak_counter = 0
-        self.score = 0 
-        self.show_end_popup(reason, False)
+                self.timers.resume("round")
+        elif event == "round_over":
+            self.cancel_timer()
+            if not data["won"]: self.save_leaderboard(data["score"])
+            self.show_end_popup(data["reason"], data["won"])
 
     def show_end_popup(self, title, won):
+        self.end_popup = (title, won)
+        self.loader.require(("try_again_norm", "try_again_hover", "quit_norm", "quit_hover"))
         self.canvas.create_rectangle(0,0,self.screen_width,self.screen_height, fill="black", stipple="gray75", tags="end_pop")
         cx, cy = self.screen_width//2, self.screen_height//2
         w, h = self.popup_w, self.popup_h * 0.8
@@ -783,94 +1394,39 @@ class HangmanUI:
         self.canvas.create_rectangle(cx-w/2, cy-h/2, cx+w/2, cy+h/2, fill="#F7F1E3", outline="#2c3e50", width=5, tags="end_pop")
         color = "#27ae60" if won else "#c0392b"
         self.canvas.create_text(cx, cy - h/2 + 60*self.scale, text=title, fill=color, font=("Ubuntu", int(40*self.scale), "bold"), tags="end_pop")
-        self.canvas.create_text(cx, cy - 20*self.scale, text=f"WORD: {self.current_word}", fill="black", font=("Ubuntu", int(30*self.scale), "bold"), tags="end_pop")
-        self.canvas.create_text(cx, cy + 30*self.scale, text=f"Meaning: {self.current_meaning}", fill="#555", font=("Ubuntu", int(16*self.scale), "italic"), width=w*0.8, justify="center", tags="end_pop")
+        self.canvas.create_text(cx, cy - 20*self.scale, text=f"WORD: {self.engine.current_word}", fill="black", font=("Ubuntu", int(30*self.scale), "bold"), tags="end_pop")
+        self.canvas.create_text(cx, cy + 30*self.scale, text=f"Meaning: {self.engine.current_meaning}", fill="#555", font=("Ubuntu", int(16*self.scale), "italic"), width=w*0.8, justify="center", tags="end_pop")
         
         if won:
-            self.create_btn(cx - 120*self.scale, cy + h/2 - 80*self.scale, "play_next", lambda: [self.canvas.delete("end_pop"), self.start_game(self.game_mode)], tag="end_pop")
+            self.create_btn(cx - 120*self.scale, cy + h/2 - 80*self.scale, "play_next", lambda: [self.canvas.delete("end_pop"), self.start_game(self.engine.game_mode)], tag="end_pop")
             self.create_btn(cx + 120*self.scale, cy + h/2 - 80*self.scale, "close", lambda: [self.save_leaderboard(), self.draw_main_menu()], tag="end_pop")
         else:
             btn_name = "try_again" if "try_again_norm" in self.assets else "play_next"
-            self.create_btn(cx - 120*self.scale, cy + h/2 - 80*self.scale, btn_name, lambda: [self.canvas.delete("end_pop"), self.start_game(self.game_mode)], tag="end_pop")
+            self.create_btn(cx - 120*self.scale, cy + h/2 - 80*self.scale, btn_name, lambda: [self.canvas.delete("end_pop"), self.start_game(self.engine.game_mode)], tag="end_pop")
             
             quit_name = "quit" if "quit_norm" in self.assets else "close"
             self.create_btn(cx + 120*self.scale, cy + h/2 - 80*self.scale, quit_name, lambda: self.draw_main_menu(), tag="end_pop")
 
     def use_powerup(self, name):
-        if self.powerups.get(name, 0) <= 0: return
-        if self.roulette_step != "idle": return
-
-        if name == "roulette":
-            self.powerups[name] -= 1
-            self.roulette_step = "intro"
-            self.game_screen.draw_powerups_vertical(self.screen_width * 0.85 + (self.screen_width * 0.15) // 2, int(self.screen_height * 0.35))
-            self.game_screen.show_roulette_intro()
-            self.root.after(2000, self.activate_roulette_selection)
-            return
-
-        used = False
-        if name == "freeze":
-            if self.game_mode == "Hardest" and not self.freeze_active:
-                self.freeze_active = True
-                self.root.after(5000, self.unfreeze)
-                used = True
-        elif name == "duality":
-            if not self.duality_active:
-                self.duality_active = True
-                used = True
-        elif name == "reveal":
-            unguessed_correct = [c for c in self.current_word if c not in self.guessed_letters]
-            if unguessed_correct:
-                char = random.choice(unguessed_correct)
-                self.guessed_letters.append(char)
-                used = True
-                self.check_game_over()
-        elif name == "filter":
-            all_letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-            candidates = [c for c in all_letters if c not in self.current_word and c not in self.guessed_letters and c not in self.disabled_keys]
-            if candidates:
-                to_disable = random.sample(candidates, k=min(3, len(candidates)))
-                self.disabled_keys.extend(to_disable)
-                used = True
-
-        if used:
-            self.powerups[name] -= 1
-            self.game_screen.draw() 
+        self.engine.use_powerup(name)
 
     def activate_roulette_selection(self):
         self.game_screen.hide_overlays() 
-        self.roulette_step = "waiting_for_guess"
-        self.game_screen.draw()
+        self.engine.arm_roulette()
 
-    def resolve_roulette_guess(self, won):
-        if won:
-            for k in self.powerups: self.powerups[k] += 1
-            self.game_screen.show_roulette_result(True)
-        else:
-            for k in self.powerups: self.powerups[k] = max(0, self.powerups[k] - 1)
-            self.game_screen.show_roulette_result(False)
-        self.root.after(1000, lambda: [self.game_screen.hide_overlays(), self.game_screen.draw()])
-
-    def unfreeze(self): self.freeze_active = False
+    def end_roulette_result(self):
+        self.game_screen.hide_overlays()
 
+    # ---------------------------------------------------------
+    # HARDEST-MODE TIMER (deadline based, see scheduler.TimerService)
+    # ---------------------------------------------------------
     def start_timer(self):
         self.cancel_timer()
-        self.update_timer()
-
-    def update_timer(self):
-        if self.game_mode == "Hardest":
-            if not self.freeze_active:
-                self.time_left -= 1
-                if self.time_left <= 0:
-                    self.game_loss("Time's Up!")
-                    return
-            if self.current_word: self.game_screen.draw() 
-            self.timer_id = self.root.after(1000, self.update_timer)
+        self.timers.countdown("round", self.engine.time_left, self.engine.tick, self.engine.time_up)
 
+    # Tears down the round countdown and every pending named timer (unfreeze)
     def cancel_timer(self):
-        if self.timer_id:
-            self.root.after_cancel(self.timer_id)
-            self.timer_id = None
+        self.timers.cancel_all()
 
 if __name__ == "__main__":
     root = tk.Tk()
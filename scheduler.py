@@ -0,0 +1,278 @@
+import math
+import time
+from collections import deque
+
+
+def ease_out_cubic(p): return 1 - (1 - p) ** 3
+def linear(p): return p
+
+
+# =============================================================================
+# CLASS: WAKEUP METER (How often the app leaves the event loop on its own)
+# =============================================================================
+# Every self-scheduled callback (frame ticks, timers, asset polls, idle
+# checks) records a hit. per_minute() covers the last 60 seconds; `total`
+# lets callers measure any other window, e.g. a power-save stretch.
+class WakeupMeter:
+    WINDOW = 60.0
+
+    def __init__(self):
+        self.recent = deque()
+        self.total = 0
+        self.by_source = {}
+
+    def hit(self, source):
+        now = time.monotonic()
+        self.total += 1
+        self.by_source[source] = self.by_source.get(source, 0) + 1
+        self.recent.append(now)
+        while self.recent and self.recent[0] < now - self.WINDOW: self.recent.popleft()
+
+    def per_minute(self):
+        now = time.monotonic()
+        while self.recent and self.recent[0] < now - self.WINDOW: self.recent.popleft()
+        return len(self.recent) * 60.0 / self.WINDOW
+
+
+# =============================================================================
+# CLASS: TWEEN
+# =============================================================================
+class Tween:
+    def __init__(self, start, duration, on_frame=None, on_done=None, easing=ease_out_cubic):
+        self.start = start
+        self.duration = duration
+        self.on_frame = on_frame
+        self.on_done = on_done
+        self.easing = easing
+
+    def progress(self, now):
+        if self.duration <= 0: return 1.0
+        return min(1.0, max(0.0, (now - self.start) / self.duration))
+
+
+# =============================================================================
+# CLASS: FRAME SCHEDULER (One `after` loop for every animation)
+# =============================================================================
+# All effects register named tweens here instead of chaining root.after().
+# A single tick runs at the target FPS while anything is active and stops
+# when nothing is. Progress is time based, so a late tick simply jumps ahead
+# (the missed frames are counted in `skipped`), and once a tick has used its
+# budget the remaining tweens skip drawing for that frame. cancel()/cancel_all()
+# drop tweens before their callbacks fire, e.g. when the player leaves mid-effect.
+# suspend()/resume() freeze every tween in place (power saving).
+class FrameScheduler:
+    def __init__(self, root, fps=60, budget=0.5, meter=None):
+        self.root = root
+        self.meter = meter
+        self.suspended_at = None
+        self.interval = 1.0 / fps
+        self.budget = self.interval * budget
+        self.tweens = {}
+        self.after_id = None
+        self.last_tick = None
+        self.frames = 0
+        self.skipped = 0
+
+    def clock(self):
+        return self.suspended_at if self.suspended_at is not None else time.monotonic()
+
+    def animate(self, name, duration, on_frame=None, on_done=None, delay=0.0, easing=ease_out_cubic):
+        self.tweens[name] = Tween(self.clock() + delay, duration, on_frame, on_done, easing)
+        self.wake()
+
+    def wait(self, name, seconds, callback):
+        self.animate(name, seconds, on_done=callback, easing=linear)
+
+    def is_active(self, name): return name in self.tweens
+
+    def cancel(self, *names):
+        for name in names: self.tweens.pop(name, None)
+        if not self.tweens: self.sleep()
+
+    def cancel_all(self):
+        self.tweens.clear()
+        self.sleep()
+
+    def suspend(self):
+        if self.suspended_at is None:
+            self.suspended_at = time.monotonic()
+            self.sleep()
+
+    def resume(self):
+        if self.suspended_at is None: return
+        paused = time.monotonic() - self.suspended_at
+        self.suspended_at = None
+        for tw in self.tweens.values(): tw.start += paused
+        if self.tweens: self.wake()
+
+    def wake(self):
+        if self.after_id is None and self.suspended_at is None:
+            self.last_tick = None
+            self.after_id = self.root.after(0, self.tick)
+
+    def sleep(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def tick(self):
+        self.after_id = None
+        if self.meter: self.meter.hit("frames")
+        start = time.monotonic()
+        if self.last_tick is not None:
+            behind = int((start - self.last_tick) / self.interval) - 1
+            if behind > 0: self.skipped += behind
+        self.last_tick = start
+        self.frames += 1
+
+        for name, tw in list(self.tweens.items()):
+            if self.tweens.get(name) is not tw: continue  # cancelled by an earlier callback
+            if start < tw.start: continue
+            p = tw.progress(start)
+            over_budget = time.monotonic() - start > self.budget
+            if tw.on_frame and (p >= 1.0 or not over_budget):
+                tw.on_frame(tw.easing(p))
+            if p >= 1.0:
+                if self.tweens.get(name) is tw: del self.tweens[name]
+                if tw.on_done: tw.on_done()
+
+        if self.tweens and self.after_id is None and self.suspended_at is None:
+            spent = time.monotonic() - start
+            self.after_id = self.root.after(max(1, int((self.interval - spent) * 1000)), self.tick)
+
+    def stats(self):
+        return {"frames": self.frames, "skipped": self.skipped, "active": len(self.tweens)}
+
+
+# =============================================================================
+# CLASS: TIMER SERVICE (Monotonic deadlines, one `after` at a time)
+# =============================================================================
+# Named one-shot timers and pausable countdowns share a single pending
+# `after`, always aimed at the next thing that has to happen: a timer's
+# deadline or the moment a countdown's displayed whole second changes.
+# Everything is measured against time.monotonic(), so a slow redraw delays a
+# tick but never stretches the round. suspend_all()/resume_all() stop the clock for
+# everything at once and shift the deadlines on the way back.
+class Countdown:
+    def __init__(self, seconds, on_tick, on_expire, now):
+        self.deadline = now + seconds
+        self.paused_left = None
+        self.on_tick = on_tick
+        self.on_expire = on_expire
+        self.shown = math.ceil(seconds)
+
+    def left(self, now):
+        if self.paused_left is not None: return self.paused_left
+        return self.deadline - now
+
+
+class TimerService:
+    EPSILON = 0.002
+
+    def __init__(self, root, meter=None):
+        self.root = root
+        self.meter = meter
+        self.timers = {}
+        self.countdowns = {}
+        self.after_id = None
+        self.suspended_at = None
+
+    def clock(self):
+        return self.suspended_at if self.suspended_at is not None else time.monotonic()
+
+    # ---------------------------------------------------
+    # TIMERS / COUNTDOWNS
+    # ---------------------------------------------------
+    def start(self, name, seconds, callback):
+        self.timers[name] = (self.clock() + seconds, callback)
+        self.reschedule()
+
+    def countdown(self, name, seconds, on_tick, on_expire):
+        self.countdowns[name] = Countdown(seconds, on_tick, on_expire, self.clock())
+        self.reschedule()
+
+    def pause(self, name):
+        cd = self.countdowns.get(name)
+        if cd and cd.paused_left is None:
+            cd.paused_left = cd.deadline - self.clock()
+            self.reschedule()
+
+    def resume(self, name):
+        cd = self.countdowns.get(name)
+        if cd and cd.paused_left is not None:
+            cd.deadline = self.clock() + cd.paused_left
+            cd.paused_left = None
+            self.reschedule()
+
+    def remaining(self, name):
+        cd = self.countdowns.get(name)
+        if cd: return max(0.0, cd.left(self.clock()))
+        if name in self.timers: return max(0.0, self.timers[name][0] - self.clock())
+        return 0.0
+
+    def is_active(self, name): return name in self.timers or name in self.countdowns
+
+    def cancel(self, name):
+        self.timers.pop(name, None)
+        self.countdowns.pop(name, None)
+        self.reschedule()
+
+    def cancel_all(self):
+        self.timers.clear()
+        self.countdowns.clear()
+        self.reschedule()
+
+    def suspend_all(self):
+        if self.suspended_at is None:
+            self.suspended_at = time.monotonic()
+            self.reschedule()
+
+    def resume_all(self):
+        if self.suspended_at is None: return
+        paused = time.monotonic() - self.suspended_at
+        self.suspended_at = None
+        for name, (deadline, callback) in list(self.timers.items()):
+            self.timers[name] = (deadline + paused, callback)
+        for cd in self.countdowns.values(): cd.deadline += paused
+        self.reschedule()
+
+    # ---------------------------------------------------
+    # SCHEDULING
+    # ---------------------------------------------------
+    def next_event(self, now):
+        times = [deadline for deadline, _ in self.timers.values()]
+        for cd in self.countdowns.values():
+            if cd.paused_left is not None: continue
+            left = cd.deadline - now
+            times.append(now + left - (math.ceil(left - self.EPSILON) - 1))
+        return min(times) if times else None
+
+    def reschedule(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        if self.suspended_at is not None: return
+        now = time.monotonic()
+        when = self.next_event(now)
+        if when is not None:
+            self.after_id = self.root.after(max(0, int(math.ceil((when - now) * 1000))), self.fire)
+
+    def fire(self):
+        self.after_id = None
+        if self.meter: self.meter.hit("timers")
+        now = time.monotonic() + self.EPSILON
+        for name, (deadline, callback) in list(self.timers.items()):
+            if deadline <= now and self.timers.get(name) == (deadline, callback):
+                del self.timers[name]
+                callback()
+        for name, cd in list(self.countdowns.items()):
+            if self.countdowns.get(name) is not cd or cd.paused_left is not None: continue
+            left = cd.deadline - now
+            shown = max(0, math.ceil(left))
+            if left <= 0:
+                del self.countdowns[name]
+                cd.on_expire()
+            elif shown != cd.shown:
+                cd.shown = shown
+                cd.on_tick(shown)
+        if self.after_id is None: self.reschedule()
@@ -0,0 +1,346 @@
+import os
+import sys
+import time
+import json
+import random
+import argparse
+import multiprocessing
+from collections import Counter
+from engine import HangmanEngine, DIFFICULTY_KEYS, POWERUP_NAMES, TIME_LIMITS, REFILL_STREAK, ROULETTE_STAKE, ALPHABET, letter_bit
+from wordstore import WordStore
+try:
+    from solver import Solver, SolverSession
+except ImportError:
+    Solver = None
+
+MODES = ("Easiest", "Medium", "Hardest")
+CHUNK_GAMES = 2000
+MAX_ROUNDS = 50
+
+
+# ---------------------------------------------------
+# WORD BANK (the same bank the game would load)
+# ---------------------------------------------------
+def open_bank(base, scored=True):
+    imported = os.path.join(base, "data", "words.bin")
+    if os.path.exists(imported): store = WordStore(imported)
+    else: store = WordStore.open(os.path.join(base, "words.json"), os.path.join(base, "cache", "words.bin"))
+    if scored:
+        try:
+            from analyzer import ScoredBank
+            return ScoredBank.open(store, os.path.join(base, "cache", "words.scores.npz"))
+        except (ImportError, ValueError):
+            pass
+    return store
+
+# Letters by how many words of the bank contain them, most common first
+def frequency_order(bank):
+    counts = Counter()
+    for key in bank.keys():
+        for i in range(bank.count(key)):
+            mask = bank.mask(key, i)
+            while mask:
+                low = mask & -mask
+                counts[low.bit_length() - 1] += 1
+                mask ^= low
+    return "".join(ALPHABET[b] for b, _ in sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))) + \
+        "".join(c for c in ALPHABET if letter_bit(c).bit_length() - 1 not in counts)
+
+
+# =============================================================================
+# CLASS: BOT (Letter strategy + powerup policy)
+# =============================================================================
+# Strategies pick the next letter among those still open (not guessed, not
+# disabled by the filter powerup):
+#   random     uniformly at random
+#   frequency  most common letter in the bank first
+#   solver     the oracle's pick every time (solver.py, needs numpy;
+#              frequency without it)
+# With powerups on, the policy is a fixed set of simple rules:
+#   filter   before the first guess of a round
+#   roulette on the first guess (the likeliest hit)
+#   duality  once 3 lives are gone
+#   oracle   once 2 lives are gone; the hinted letter is guessed next
+#   reveal   with one life left
+#   freeze   in Hardest when under 10 seconds are left
+class Bot:
+    def __init__(self, strategy, powerups, rng, order):
+        self.strategy = strategy
+        self.allowed = set(powerups)
+        self.rng = rng
+        self.order = [(c, letter_bit(c)) for c in order]
+
+    def next_letter(self, engine):
+        closed = engine.guessed_mask | engine.disabled_mask
+        if engine.hint and not closed & letter_bit(engine.hint): return engine.hint
+        if self.strategy == "solver" and engine.solver: return engine.solver.best_letter()
+        if self.strategy == "random":
+            letters = [c for c, bit in self.order if not closed & bit]
+            return self.rng.choice(letters) if letters else None
+        for c, bit in self.order:
+            if not closed & bit: return c
+        return None
+
+    def use_powerups(self, engine, first_guess, seconds_left):
+        def use(name):
+            return name in self.allowed and engine.powerups.get(name, 0) > 0 and engine.use_powerup(name)
+        if first_guess:
+            use("filter")
+            if use("roulette"): engine.arm_roulette()
+        lives = 6 - engine.wrong_guesses
+        if lives <= 3 and not engine.duality_active: use("duality")
+        if lives <= 4 and not engine.hint: use("oracle")
+        if lives <= 1: use("reveal")
+        if seconds_left is not None and seconds_left < 10 and not engine.freeze_active: use("freeze")
+
+
+# =============================================================================
+# CLASS: TALLY (Aggregates one variant x mode; workers merge these)
+# =============================================================================
+class Tally:
+    FIELDS = ("runs", "rounds", "wins", "guesses", "wrong", "time_ups", "seconds")
+
+    def __init__(self):
+        self.n = dict.fromkeys(self.FIELDS, 0)
+        self.used = Counter()
+        self.scores = Counter()
+        self.words = {}
+
+    def merge(self, other):
+        for k, v in other.n.items(): self.n[k] += v
+        self.used.update(other.used)
+        self.scores.update(other.scores)
+        for word, (rounds, wins) in other.words.items():
+            cur = self.words.setdefault(word, [0, 0])
+            cur[0] += rounds
+            cur[1] += wins
+        return self
+
+    def percentile(self, q):
+        total = sum(self.scores.values())
+        seen = 0
+        for score in sorted(self.scores):
+            seen += self.scores[score]
+            if seen >= q * total: return score
+        return 0
+
+
+# =============================================================================
+# CLASS: SIMULATOR (One headless engine per worker chunk)
+# =============================================================================
+# A run is rounds until the first loss (or max_rounds), like a player's
+# session: score, streak and powerup refills carry over between rounds.
+# The Hardest countdown runs on simulated time: each guess takes an
+# exponential `think` seconds and frozen seconds don't count.
+class Simulator:
+    def __init__(self, bank, cfg, solver=None):
+        self.bank = bank
+        self.cfg = cfg
+        self.now = 0.0
+        self.engine = HangmanEngine(bank, clock=lambda: self.now)
+        if solver: self.engine.solver = SolverSession(solver, self.engine)
+        self.engine.time_limits = {"Hardest": cfg["time_limit"]} if cfg["time_limit"] else {}
+        self.engine.refill_streak = cfg["refill"]
+        self.engine.roulette_stake = cfg["stake"]
+        self.engine.subscribe(self.on_event)
+        self.used = Counter()
+        self.frozen = 0.0
+        self.result = None
+
+    def on_event(self, event, data):
+        if event == "powerup_used": self.used[data["name"]] += 1
+        elif event == "freeze" and data["active"]: self.frozen = float(data["seconds"])
+        elif event == "round_over": self.result = data
+
+    def play_round(self, mode, key, i, bot, tally):
+        engine, cfg = self.engine, self.cfg
+        engine.start_round(mode, (self.bank.word(key, i), "", ""))
+        timed = bool(engine.time_left)
+        left = float(engine.time_left)
+        self.frozen = 0.0
+        self.result = None
+        first = True
+        while not engine.over:
+            if cfg["powerups"]:
+                bot.use_powerups(engine, first, left if timed else None)
+                if engine.over: break
+            char = bot.next_letter(engine)
+            if char is None:
+                engine.lose("No letters left")
+                break
+            dt = bot.rng.expovariate(1 / cfg["think"]) if timed else cfg["think"]
+            self.now += dt
+            if timed:
+                thaw = min(dt, self.frozen)
+                self.frozen -= thaw
+                left -= dt - thaw
+                if self.frozen <= 0 and engine.freeze_active: engine.unfreeze()
+                if left <= 0:
+                    tally.n["time_ups"] += 1
+                    engine.time_up()
+                    break
+            tally.n["guesses"] += 1
+            if not engine.guess(char): tally.n["wrong"] += 1
+            first = False
+        return self.result
+
+    def play_run(self, mode, word_rng, bot, tally):
+        engine = self.engine
+        key = DIFFICULTY_KEYS[mode]
+        n = self.bank.count(key)
+        engine.powerups = {name: self.cfg["start_powerups"] for name in POWERUP_NAMES}
+        engine.score = engine.streak = engine.streak_counter = 0
+        self.used = Counter()
+        score = 0
+        for _ in range(self.cfg["max_rounds"]):
+            word_i = word_rng.randrange(n)
+            result = self.play_round(mode, key, word_i, bot, tally)
+            won = bool(result and result["won"])
+            score = result["score"] if result else engine.score
+            tally.n["rounds"] += 1
+            tally.n["wins"] += won
+            tally.n["seconds"] += result["duration"] if result else 0
+            plays = tally.words.setdefault(engine.current_word, [0, 0])
+            plays[0] += 1
+            plays[1] += won
+            if not won: break
+        tally.n["runs"] += 1
+        tally.scores[score] += 1
+        tally.used.update(self.used)
+
+
+# ---------------------------------------------------
+# WORKERS
+# ---------------------------------------------------
+WORKER = {}
+
+def init_worker(base, scored):
+    WORKER["bank"] = open_bank(base, scored)
+    WORKER["solver"] = Solver(WORKER["bank"]) if Solver else None
+
+# Every game gets its own generators seeded from (seed, mode, game index),
+# so results don't depend on worker count or chunking, and variants of an
+# ablation play exactly the same words with the same bot luck.
+def simulate_chunk(task):
+    variant, cfg, mode, start, count = task
+    tally = Tally()
+    sim = Simulator(WORKER["bank"], cfg, WORKER["solver"])
+    for g in range(start, start + count):
+        tag = f"{cfg['seed']}:{mode}:{g}"
+        sim.engine.rng = random.Random(tag + ":engine")
+        bot = Bot(cfg["strategy"], cfg["powerups"], random.Random(tag + ":bot"), cfg["order"])
+        sim.play_run(mode, random.Random(tag + ":words"), bot, tally)
+    return variant, mode, tally
+
+
+# ---------------------------------------------------
+# REPORT
+# ---------------------------------------------------
+def report(results, variants, top_words, min_plays):
+    out = []
+    for variant in variants:
+        out.append(f"\n== {variant} ==")
+        out.append(f"{'mode':<9} {'runs':>9} {'round win':>9} {'wrong/rd':>8} {'rounds/run':>10} "
+                   f"{'score mean':>10} {'p50':>6} {'p90':>6} {'p99':>6} {'max':>6} {'time-ups':>8}  powerups/run")
+        for mode in MODES:
+            t = results.get((variant, mode))
+            if not t or not t.n["runs"]: continue
+            n = t.n
+            mean = sum(s * c for s, c in t.scores.items()) / n["runs"]
+            used = " ".join(f"{name}={t.used[name] / n['runs']:.2f}" for name in POWERUP_NAMES if t.used[name])
+            out.append(f"{mode:<9} {n['runs']:>9} {n['wins'] / n['rounds']:>9.1%} {n['wrong'] / n['rounds']:>8.2f} "
+                       f"{n['rounds'] / n['runs']:>10.2f} {mean:>10.1f} {t.percentile(0.5):>6} {t.percentile(0.9):>6} "
+                       f"{t.percentile(0.99):>6} {max(t.scores):>6} {n['time_ups'] / n['rounds']:>8.1%}  {used or '-'}")
+
+    if "none" in variants and len(variants) > 1:
+        out.append("\n== powerup effect (round win rate vs no powerups, same seeds) ==")
+        for variant in variants:
+            if variant == "none": continue
+            cells = []
+            for mode in MODES:
+                a, b = results.get(("none", mode)), results.get((variant, mode))
+                if a and b and a.n["rounds"] and b.n["rounds"]:
+                    cells.append(f"{mode} {b.n['wins'] / b.n['rounds'] - a.n['wins'] / a.n['rounds']:+.1%}")
+            out.append(f"{variant:<12} " + "  ".join(cells))
+
+    if top_words:
+        variant = variants[0]
+        out.append(f"\n== hardest words ({variant}, at least {min_plays} plays) ==")
+        for mode in MODES:
+            t = results.get((variant, mode))
+            if not t: continue
+            words = [(wins / rounds, rounds, w) for w, (rounds, wins) in t.words.items() if rounds >= min_plays]
+            words.sort()
+            out.append(f"{mode}: " + ", ".join(f"{w} {rate:.0%}" for rate, _, w in words[:top_words]))
+    return "\n".join(out)
+
+
+def main(argv=None):
+    base = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Simulate many seeded Hangman runs with bots to balance modes and powerups.")
+    parser.add_argument("-n", "--games", type=int, default=20000, help="runs per mode and variant")
+    parser.add_argument("-m", "--modes", default=",".join(MODES), help="comma separated modes")
+    parser.add_argument("-s", "--strategy", choices=("random", "frequency", "solver"), default="frequency")
+    parser.add_argument("-p", "--powerups", default="all", help="'all', 'none' or a comma separated list")
+    parser.add_argument("--ablate", action="store_true", help="compare no powerups, all powerups and each one alone")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (at most one per CPU core)")
+    parser.add_argument("--start-powerups", type=int, default=1, help="powerups of each kind at the start of a run")
+    parser.add_argument("--refill", type=int, default=REFILL_STREAK, help="wins in a row that refill powerups")
+    parser.add_argument("--stake", type=int, default=ROULETTE_STAKE, help="powerups won/lost by roulette")
+    parser.add_argument("--time-limit", type=float, default=TIME_LIMITS["Hardest"], help="Hardest seconds per word (0 = untimed)")
+    parser.add_argument("--think", type=float, default=2.0, help="mean seconds per guess")
+    parser.add_argument("--max-rounds", type=int, default=MAX_ROUNDS, help="cap on rounds per run")
+    parser.add_argument("--bank", choices=("scored", "curated"), default="scored")
+    parser.add_argument("--words", type=int, default=10, help="hardest words to list per mode (0 = none)")
+    parser.add_argument("--min-plays", type=int, default=20)
+    parser.add_argument("--json", help="also write the raw tallies here")
+    args = parser.parse_args(argv)
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip() in MODES]
+    if args.ablate:
+        variants = {"none": (), "all": POWERUP_NAMES}
+        variants.update({name: (name,) for name in POWERUP_NAMES})
+    elif args.powerups == "all": variants = {"all": POWERUP_NAMES}
+    elif args.powerups == "none": variants = {"none": ()}
+    else: variants = {args.powerups: tuple(p.strip() for p in args.powerups.split(",") if p.strip() in POWERUP_NAMES)}
+
+    scored = args.bank == "scored"
+    init_worker(base, scored)
+    cfg = {"seed": args.seed, "strategy": args.strategy, "start_powerups": args.start_powerups, "refill": args.refill,
+           "stake": args.stake, "time_limit": args.time_limit, "think": args.think, "max_rounds": args.max_rounds,
+           "order": frequency_order(WORKER["bank"])}
+    tasks = [(name, dict(cfg, powerups=pu), mode, start, min(CHUNK_GAMES, args.games - start))
+             for name, pu in variants.items() for mode in modes for start in range(0, args.games, CHUNK_GAMES)]
+
+    # More processes than cores only adds start-up and scheduling cost
+    workers = max(1, min(args.workers, os.cpu_count() or 1, len(tasks)))
+    started = time.perf_counter()
+    results = {}
+    if workers > 1:
+        with multiprocessing.Pool(workers, init_worker, (base, scored)) as pool:
+            done = pool.imap(simulate_chunk, tasks)
+            for variant, mode, tally in done: results.setdefault((variant, mode), Tally()).merge(tally)
+    else:
+        for task in tasks:
+            variant, mode, tally = simulate_chunk(task)
+            results.setdefault((variant, mode), Tally()).merge(tally)
+    elapsed = time.perf_counter() - started
+
+    # Tallies first: a closed stdout (`| head`) must not lose them
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({f"{v}/{m}": {"counts": t.n, "powerups": dict(t.used), "scores": {str(s): c for s, c in sorted(t.scores.items())}}
+                       for (v, m), t in results.items()}, f, indent=1)
+
+    runs = sum(t.n["runs"] for t in results.values())
+    rounds = sum(t.n["rounds"] for t in results.values())
+    print(f"{runs} runs / {rounds} rounds in {elapsed:.1f}s on {workers} worker(s) "
+          f"({rounds / max(elapsed, 1e-9):.0f} rounds/s), strategy={args.strategy}, seed={args.seed}")
+    print(report(results, list(variants), args.words, args.min_plays))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
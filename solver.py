@@ -0,0 +1,277 @@
+import os
+import sys
+import time
+import random
+import threading
+import numpy as np
+from collections import OrderedDict
+from analyzer import word_columns
+from engine import HangmanEngine, ALPHABET, letter_bit
+
+MAX_INDEXES = 8       # length indexes kept in memory
+MAX_WORD_LEN = 31     # positions are bits of a uint32
+SAMPLE_ROWS = 2048    # candidates scored per hint; larger sets are sampled
+BOOK_SIZE = 4096      # remembered answers per length index
+# Share of the computer's guesses that are the solver's pick; the rest
+# are the most common open letter
+AI_SKILL = {"Easiest": 0.4, "Medium": 0.7, "Hardest": 1.0}
+
+
+def position_mask(word, char):
+    mask = 0
+    for p, c in enumerate(word):
+        if c == char: mask |= 1 << p
+    return mask
+
+
+# =============================================================================
+# CLASS: LENGTH INDEX (Every bank word of one length, by letter position)
+# =============================================================================
+# codes[c][i] has bit p set when word i has letter c at position p, so
+# "the player revealed E at positions 1 and 4" is codes[E] == 0b10010 and a
+# wrong E is codes[E] == 0. ids[i][c] renumbers those patterns densely per
+# letter (offset per letter), so one bincount over the candidates' rows
+# counts how every letter would split them.
+# The best letter for each large candidate set is kept in `book`, keyed by
+# what was revealed: the opening guess and the first few after it come
+# from there instead of being scored again.
+class LengthIndex:
+    def __init__(self, letters, masks):
+        n, length = letters.shape
+        self.n = n
+        self.masks = masks
+        # Smallest dtype that holds a bit per position halves or quarters
+        # the bytes each narrowing step reads
+        dtype = np.uint8 if length <= 8 else np.uint16 if length <= 16 else np.uint32
+        codes = np.zeros((26, n), dtype=dtype)
+        rows = np.arange(n)
+        for p in range(length):
+            codes[letters[:, p], rows] |= dtype(1 << p)
+        self.codes = codes
+
+        ids = np.empty((26, n), dtype=np.int64)
+        self.offsets = np.zeros(26, dtype=np.int64)
+        self.has_absent = np.zeros(26, dtype=bool)
+        bins = 0
+        for c in range(26):
+            patterns, inverse = np.unique(codes[c], return_inverse=True)
+            ids[c] = inverse.ravel() + bins
+            self.offsets[c] = bins
+            self.has_absent[c] = patterns[0] == 0
+            bins += len(patterns)
+        self.ids = np.ascontiguousarray(ids.T, dtype=np.uint16 if bins <= 1 << 16 else np.int32)
+        self.bins = bins
+        self.book = {}
+
+    # Candidates are None (every word), a boolean mask over the rows while
+    # there are many of them (one contiguous compare per letter), then an
+    # index array once few enough are left that gathering them is cheaper
+    def narrow(self, cand, c, mask):
+        if cand is not None and cand.dtype != bool: return cand[self.codes[c][cand] == mask]
+        hit = self.codes[c] == mask
+        if cand is not None: hit &= cand
+        return np.flatnonzero(hit) if np.count_nonzero(hit) <= 8 * SAMPLE_ROWS else hit
+
+    def count(self, cand):
+        if cand is None: return self.n
+        return int(np.count_nonzero(cand)) if cand.dtype == bool else len(cand)
+
+    # Expected information (bits) of guessing each letter: the entropy of
+    # how the candidates split by where that letter shows up. Presence
+    # probability breaks ties, so a sure hit beats a sure miss. Past
+    # SAMPLE_ROWS candidates the split is estimated from an even stride.
+    def scores(self, cand):
+        if cand is None: cand = np.arange(0, self.n, -(-self.n // SAMPLE_ROWS))
+        elif cand.dtype == bool: cand = np.flatnonzero(cand)
+        if len(cand) > SAMPLE_ROWS: cand = cand[::-(-len(cand) // SAMPLE_ROWS)]
+        n = len(cand)
+        counts = np.bincount(self.ids[cand].ravel(), minlength=self.bins).astype(np.float64)
+        nz = counts > 0
+        plogp = np.zeros_like(counts)
+        plogp[nz] = counts[nz] * np.log2(counts[nz])
+        info = np.log2(n) - np.add.reduceat(plogp, self.offsets) / n
+        absent = np.where(self.has_absent, counts[self.offsets], 0)
+        return info + 1e-3 * (1 - absent / n)
+
+
+# =============================================================================
+# CLASS: SOLVER (Length indexes over a word bank)
+# =============================================================================
+# Reads the bank's columns straight from the compiled store (a ScoredBank
+# is solved over its underlying store: candidates are every bank word, not
+# one tier). A length's index is built the first time a word of that length
+# is played and the last MAX_INDEXES are kept; `lock` lets a worker thread
+# build one while the UI asks for another (or waits for the same one).
+class Solver:
+    def __init__(self, bank):
+        store = getattr(bank, "store", bank)
+        offsets, blobs, masks = [], [], []
+        base = 0
+        for key in store.keys():
+            o, b, m = word_columns(store, key)
+            offsets.append(o[:-1] + base)
+            blobs.append(b)
+            masks.append(m)
+            base += len(b)
+        self.starts = np.concatenate(offsets) if offsets else np.zeros(0, np.int64)
+        self.blob = np.concatenate(blobs) if blobs else np.zeros(0, np.uint8)
+        self.masks = np.concatenate(masks) if masks else np.zeros(0, np.uint32)
+        ends = np.append(self.starts[1:], len(self.blob)) if len(self.starts) else self.starts
+        self.lengths = ends - self.starts
+        self.indexes = OrderedDict()
+        self.lock = threading.Lock()
+
+        counts = np.array([np.count_nonzero(self.masks & np.uint32(1 << c)) for c in range(26)])
+        self.order = [int(c) for c in np.argsort(-counts, kind="stable")]
+
+    def index(self, length):
+        if not 0 < length <= MAX_WORD_LEN: return None
+        with self.lock:
+            if length in self.indexes:
+                self.indexes.move_to_end(length)
+                return self.indexes[length]
+            rows = np.flatnonzero(self.lengths == length)
+            letters = self.blob[self.starts[rows, None] + np.arange(length)].astype(np.int64) - 65
+            ok = ((letters >= 0) & (letters < 26)).all(axis=1)
+            index = LengthIndex(letters[ok], self.masks[rows[ok]]) if ok.any() else None
+            self.indexes[length] = index
+            if len(self.indexes) > MAX_INDEXES: self.indexes.popitem(last=False)
+            return index
+
+
+# =============================================================================
+# CLASS: SOLVER SESSION (Follows one HangmanEngine's round)
+# =============================================================================
+# Narrows the candidates as letters are revealed, using only what the
+# player can see: where a guessed letter appears (or that it doesn't), and
+# letters struck out by the filter powerup. Each event adds a (letter,
+# positions) constraint; the candidates are only narrowed by the new
+# ones when a hint actually needs it. HangmanEngine calls best_letter()
+# for the oracle powerup. With a `pool` (an executor), the index for the
+# new word's length is built on it as the round starts, so the first hint
+# doesn't pay for it.
+class SolverSession:
+    def __init__(self, solver, engine, pool=None):
+        self.solver = solver
+        self.engine = engine
+        self.pool = pool
+        self.reset()
+        engine.subscribe(self.on_event)
+
+    def reset(self):
+        self.word = None
+        self.index = None
+        self.cand = None
+        self.known = []
+        self.applied = 0
+
+    def on_event(self, event, data):
+        if event == "round_started":
+            self.reset()
+            if self.pool: self.pool.submit(self.solver.index, len(self.engine.current_word))
+        elif self.word is None: return
+        elif event == "letter": self.learn(data["char"])
+        elif event == "keys":
+            for char in data["chars"]: self.learn(char)
+
+    def learn(self, char): self.known.append((ord(char) - 65, position_mask(self.word, char)))
+
+    def sync(self):
+        if self.word != self.engine.current_word:
+            self.reset()
+            self.word = self.engine.current_word
+            self.index = self.solver.index(len(self.word))
+            for char in ALPHABET:
+                if (self.engine.guessed_mask | self.engine.disabled_mask) & letter_bit(char): self.learn(char)
+
+    def narrowed(self):
+        for c, mask in self.known[self.applied:]:
+            self.cand = self.index.narrow(self.cand, c, mask)
+        self.applied = len(self.known)
+        return self.cand
+
+    def candidates(self):
+        self.sync()
+        if self.index is None: return 0
+        return self.index.count(self.narrowed())
+
+    def best_letter(self):
+        self.sync()
+        closed = self.engine.guessed_mask | self.engine.disabled_mask
+        open_letters = [c for c in self.solver.order if not closed & (1 << c)]
+        if not open_letters: return None
+        index = self.index
+        if index is None: return ALPHABET[open_letters[0]]
+        state = frozenset(self.known)
+        if state in index.book: return index.book[state]
+        cand = self.narrowed()
+        size = index.count(cand)
+        if not size:
+            # The word isn't in the bank: fall back to letter frequency
+            return ALPHABET[open_letters[0]]
+        scores = index.scores(cand)
+        best = ALPHABET[max(open_letters, key=lambda c: scores[c])]
+        if size > SAMPLE_ROWS and len(index.book) < BOOK_SIZE: index.book[state] = best
+        return best
+
+
+# =============================================================================
+# CLASS: AI OPPONENT (Plays the same word on its own engine)
+# =============================================================================
+# The computer gets a shadow HangmanEngine with the player's word and
+# makes one guess per player guess: the solver's pick with the mode's
+# AI_SKILL chance, otherwise the bank's most common open letter. It never
+# uses powerups or the clock; the UI decides what happens when it
+# finishes first.
+class AIOpponent:
+    def __init__(self, solver, rng=None):
+        self.solver = solver
+        self.rng = rng or random.Random()
+        self.engine = HangmanEngine()
+        self.engine.time_limits = {}
+        self.session = SolverSession(solver, self.engine)
+        self.skill = 1.0
+
+    def start(self, mode, word):
+        self.skill = AI_SKILL.get(mode, 1.0)
+        self.engine.start_round(mode, (word, "", ""))
+
+    def play_turn(self):
+        if self.engine.over: return None
+        if self.rng.random() < self.skill: char = self.session.best_letter()
+        else:
+            closed = self.engine.guessed_mask | self.engine.disabled_mask
+            char = next((ALPHABET[c] for c in self.solver.order if not closed & (1 << c)), None)
+        if char: self.engine.guess(char)
+        return char
+
+    def solved(self): return self.engine.is_solved()
+    def out(self): return self.engine.over and not self.engine.is_solved()
+
+
+if __name__ == "__main__":
+    # python solver.py [words.bin]: time hints over a compiled bank
+    from wordstore import WordStore
+    base = os.path.dirname(os.path.abspath(__file__))
+    path = sys.argv[1] if len(sys.argv) > 1 else None
+    store = WordStore(path) if path else WordStore.open(os.path.join(base, "words.json"), os.path.join(base, "cache", "words.bin"))
+    solver = Solver(store)
+    engine = HangmanEngine(store)
+    session = SolverSession(solver, engine)
+    rng = np.random.default_rng(1)
+    timings, rounds, wins = [], 0, 0
+    for key in store.keys():
+        for i in rng.choice(store.count(key), size=min(50, store.count(key)), replace=False):
+            engine.start_round(key, (store.word(key, int(i)), "", ""))
+            session.best_letter()  # builds the length index outside the timing
+            while not engine.over:
+                start = time.perf_counter()
+                char = session.best_letter()
+                timings.append(time.perf_counter() - start)
+                engine.guess(char)
+            rounds += 1
+            wins += engine.is_solved()
+    timings.sort()
+    print(f"{len(solver.masks)} words, {rounds} rounds solved {wins / rounds:.0%}; hint time "
+          f"median {timings[len(timings) // 2] * 1000:.3f} ms, p99 {timings[int(len(timings) * 0.99)] * 1000:.3f} ms, "
+          f"max {timings[-1] * 1000:.3f} ms")
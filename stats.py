@@ -0,0 +1,146 @@
+import os
+import json
+import struct
+import hashlib
+from wordbag import map_file
+
+STATS_VERSION = 1
+STATS_MAGIC = b"HGST"
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+POWERUPS = ("roulette", "freeze", "duality", "reveal", "filter", "oracle")
+
+# One uint32 per counter, in this order. Counters are only ever appended,
+# so a file written before one was added is a prefix of the new layout
+COUNTERS = ("games", "wins", "losses", "guesses", "wrong", "streak", "best_streak", "best_score", "seconds") + \
+    tuple(f"used_{name}" for name in POWERUPS[:5]) + \
+    tuple(f"tried_{c}" for c in ALPHABET) + tuple(f"hit_{c}" for c in ALPHABET) + \
+    ("used_oracle",)
+SLOT = {name: 4 * i for i, name in enumerate(COUNTERS)}
+U32_MAX = (1 << 32) - 1
+
+
+# =============================================================================
+# CLASS: PLAYER STATS (Running totals per player)
+# =============================================================================
+# Every statistic is a running aggregate, so an event updates a few uint32
+# counters in place and nothing is ever recomputed from history. Each player
+# has one fixed-size file (COUNTERS * 4 bytes) in data/stats, mapped the
+# same way as wordbag.PlayerHistory, so reading a player's stats is one
+# unpack of a few hundred bytes however many games they have played.
+class PlayerStats:
+    MAX_OPEN = 8
+
+    def __init__(self, root_dir):
+        self.root = root_dir
+        self.open_files = {}
+
+    def key_for(self, player):
+        return hashlib.sha1(player.strip().casefold().encode("utf-8")).hexdigest()[:16]
+
+    def path_for(self, player): return os.path.join(self.root, self.key_for(player) + ".stats")
+
+    def mapping(self, player):
+        pid = self.key_for(player)
+        if pid not in self.open_files:
+            if len(self.open_files) >= self.MAX_OPEN:
+                self.open_files.pop(next(iter(self.open_files)))[0].close()
+            path = self.path_for(player)
+            header = {"version": STATS_VERSION, "counters": len(COUNTERS)}
+            self.open_files[pid] = map_file(path, STATS_MAGIC, header, 4 * len(COUNTERS), lambda: self.carry_over(path))
+        return self.open_files[pid]
+
+    # Payload for a rewritten file: the counters of an older layout kept,
+    # the ones added since zeroed
+    def carry_over(self, path):
+        size = 4 * len(COUNTERS)
+        try:
+            with open(path, "rb") as f: data = f.read()
+            n = int.from_bytes(data[4:8], "little")
+            header = json.loads(data[8:8 + n])
+            if data[:4] == STATS_MAGIC and header.get("version") == STATS_VERSION:
+                old = data[8 + n:8 + n + 4 * int(header["counters"])][:size]
+                return old + b"\0" * (size - len(old))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return b"\0" * size
+
+    def get(self, player, name):
+        mm, base = self.mapping(player)
+        return struct.unpack_from("<I", mm, base + SLOT[name])[0]
+
+    def put(self, player, name, value):
+        mm, base = self.mapping(player)
+        struct.pack_into("<I", mm, base + SLOT[name], min(max(0, int(value)), U32_MAX))
+
+    def add(self, player, name, n=1): self.put(player, name, self.get(player, name) + n)
+
+    # ---------------------------------------------------
+    # EVENTS
+    # ---------------------------------------------------
+    def guess(self, player, char, correct):
+        self.add(player, "guesses")
+        self.add(player, f"tried_{char}")
+        if correct: self.add(player, f"hit_{char}")
+        else: self.add(player, "wrong")
+
+    def powerup(self, player, name):
+        if name in POWERUPS: self.add(player, f"used_{name}")
+
+    def round_over(self, player, won, score, seconds):
+        self.add(player, "games")
+        self.add(player, "seconds", round(seconds))
+        self.put(player, "best_score", max(self.get(player, "best_score"), score))
+        if won:
+            self.add(player, "wins")
+            streak = self.get(player, "streak") + 1
+            self.put(player, "streak", streak)
+            self.put(player, "best_streak", max(self.get(player, "best_streak"), streak))
+        else:
+            self.add(player, "losses")
+            self.put(player, "streak", 0)
+
+    # ---------------------------------------------------
+    # SUMMARY (what the stats screen shows)
+    # ---------------------------------------------------
+    # None for a player with no games on record
+    def summary(self, player):
+        if self.key_for(player) not in self.open_files and not os.path.exists(self.path_for(player)): return None
+        mm, base = self.mapping(player)
+        c = dict(zip(COUNTERS, struct.unpack_from(f"<{len(COUNTERS)}I", mm, base)))
+        games = c["games"]
+        return {
+            "games": games, "wins": c["wins"], "losses": c["losses"],
+            "win_rate": c["wins"] / games if games else 0.0,
+            "avg_wrong": c["wrong"] / games if games else 0.0,
+            "avg_seconds": c["seconds"] / games if games else 0.0,
+            "streak": c["streak"], "best_streak": c["best_streak"], "best_score": c["best_score"],
+            "powerups": {name: c[f"used_{name}"] for name in POWERUPS},
+            "letters": {ch: (c[f"hit_{ch}"], c[f"tried_{ch}"]) for ch in ALPHABET},
+        }
+
+    def close(self):
+        for mm, _ in self.open_files.values(): mm.close()
+        self.open_files = {}
+
+
+# =============================================================================
+# CLASS: STATS RECORDER (Feeds PlayerStats from HangmanEngine events)
+# =============================================================================
+# Guesses come from "letter" events (letters shown by the reveal powerup are
+# flagged and skipped), powerups from "powerup_used" and results from
+# "round_over". Rounds without a player name aren't recorded.
+class StatsRecorder:
+    def __init__(self, engine, stats):
+        self.engine = engine
+        self.stats = stats
+        engine.subscribe(self.on_event)
+
+    def on_event(self, event, data):
+        player = self.engine.player
+        if not player.strip(): return
+        try:
+            if event == "letter" and not data.get("revealed"): self.stats.guess(player, data["char"], data["correct"])
+            elif event == "powerup_used": self.stats.powerup(player, data["name"])
+            elif event == "round_over": self.stats.round_over(player, data["won"], data["score"], data["duration"])
+        except (OSError, ValueError):
+            pass
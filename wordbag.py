@@ -0,0 +1,153 @@
+import os
+import json
+import mmap
+import struct
+import hashlib
+
+BAG_VERSION = 1
+BAG_MAGIC = b"HGBG"
+HISTORY_MAGIC = b"HGPH"
+
+
+# Maps `path` read/write, (re)creating it when the header doesn't match.
+# Layout: magic + uint32 header length + JSON header, then `size` data bytes
+# starting at the returned base offset (4-byte aligned).
+def map_file(path, magic, header, size, init=None):
+    head = json.dumps(header).encode("utf-8")
+    head += b" " * (-(8 + len(head)) % 4)
+    base = 8 + len(head)
+    expected = magic + len(head).to_bytes(4, "little") + head
+    try:
+        with open(path, "r+b") as f:
+            mm = mmap.mmap(f.fileno(), 0)
+        if len(mm) == base + size and mm[:base] == expected: return mm, base
+        mm.close()
+    except (OSError, ValueError):
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(expected)
+        f.write(init() if init else b"\0" * size)
+    os.replace(tmp, path)
+    with open(path, "r+b") as f:
+        return mmap.mmap(f.fileno(), 0), base
+
+
+# =============================================================================
+# CLASS: SHUFFLE BAGS (One non-repeating bag per difficulty)
+# =============================================================================
+# Each bag is a permutation of word indices plus a cursor, drawn with an
+# incremental Fisher-Yates step: pick j in [pos, n), swap it to pos, advance.
+# A draw is O(1) and touches three uint32s in the mmapped file, so the state
+# survives restarts without ever rewriting the file. Every word comes out
+# once before any repeats; the next cycle keeps shuffling the same array.
+class ShuffleBags:
+    def __init__(self, path, counts, source):
+        self.offsets = {}
+        size = 0
+        for key, n in counts.items():
+            self.offsets[key] = (size, n)
+            size += 4 * (n + 1)
+        init = lambda: b"".join(struct.pack(f"<{n + 1}I", 0, *range(n)) for n in counts.values())
+        header = {"version": BAG_VERSION, "source": source, "counts": counts}
+        self.mm, self.base = map_file(path, BAG_MAGIC, header, size, init)
+
+    def remaining(self, key):
+        at, n = self.offsets[key]
+        return n - struct.unpack_from("<I", self.mm, self.base + at)[0]
+
+    def draw(self, key, rng):
+        at, n = self.offsets.get(key, (0, 0))
+        if not n: return None
+        at += self.base
+        pos = struct.unpack_from("<I", self.mm, at)[0]
+        if pos >= n: pos = 0
+        j = rng.randrange(pos, n)
+        slot_pos, slot_j = at + 4 * (pos + 1), at + 4 * (j + 1)
+        a = struct.unpack_from("<I", self.mm, slot_pos)[0]
+        b = struct.unpack_from("<I", self.mm, slot_j)[0]
+        struct.pack_into("<I", self.mm, slot_j, a)
+        struct.pack_into("<I", self.mm, slot_pos, b)
+        struct.pack_into("<I", self.mm, at, pos + 1)
+        return b
+
+    def close(self):
+        try: self.mm.close()
+        except: pass
+
+
+# =============================================================================
+# CLASS: PLAYER HISTORY (Solved words per player name)
+# =============================================================================
+# One small bitset file per player (bit i of a difficulty = word i solved).
+# Marking a word flips one byte in place. Files are keyed by a hash of the
+# case-folded name and reset whenever the word bank is recompiled.
+class PlayerHistory:
+    MAX_OPEN = 8
+
+    def __init__(self, root_dir, counts, source):
+        self.root = root_dir
+        self.counts = counts
+        self.source = source
+        self.open_files = {}
+        self.offsets = {}
+        size = 0
+        for key, n in counts.items():
+            self.offsets[key] = size
+            size += (n + 7) // 8
+        self.size = size
+
+    def key_for(self, player):
+        return hashlib.sha1(player.strip().casefold().encode("utf-8")).hexdigest()[:16]
+
+    def mapping(self, player):
+        pid = self.key_for(player)
+        if pid not in self.open_files:
+            if len(self.open_files) >= self.MAX_OPEN:
+                self.open_files.pop(next(iter(self.open_files)))[0].close()
+            header = {"version": BAG_VERSION, "source": self.source, "counts": self.counts}
+            self.open_files[pid] = map_file(os.path.join(self.root, pid + ".bits"), HISTORY_MAGIC, header, self.size)
+        return self.open_files[pid]
+
+    def is_solved(self, player, key, i):
+        mm, base = self.mapping(player)
+        return bool(mm[base + self.offsets[key] + i // 8] & (1 << (i % 8)))
+
+    def mark_solved(self, player, key, i):
+        mm, base = self.mapping(player)
+        at = base + self.offsets[key] + i // 8
+        mm[at] = mm[at] | (1 << (i % 8))
+
+    def close(self):
+        for mm, _ in self.open_files.values(): mm.close()
+        self.open_files = {}
+
+
+# =============================================================================
+# CLASS: WORD SCHEDULER (Bags + history, used by HangmanEngine.pick_word)
+# =============================================================================
+# Draws from the difficulty's bag and passes over words the current player
+# has already solved. If everything left is solved the last draw is used
+# rather than stalling the round.
+class WordScheduler:
+    def __init__(self, data_dir, store):
+        counts = {key: store.count(key) for key in store.keys()}
+        source = store.source
+        self.bags = ShuffleBags(os.path.join(data_dir, "bags.bin"), counts, source)
+        self.history = PlayerHistory(os.path.join(data_dir, "players"), counts, source)
+
+    def draw(self, key, rng, player=""):
+        if key not in self.bags.offsets: return None
+        i = None
+        for _ in range(self.bags.offsets[key][1]):
+            i = self.bags.draw(key, rng)
+            if not player or not self.history.is_solved(player, key, i): break
+        return i
+
+    def solved(self, player, key, i):
+        if player and key in self.bags.offsets: self.history.mark_solved(player, key, i)
+
+    def close(self):
+        self.bags.close()
+        self.history.close()
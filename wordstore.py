@@ -0,0 +1,247 @@
+import os
+import json
+import mmap
+import struct
+import shutil
+import tempfile
+
+STORE_VERSION = 1
+STORE_MAGIC = b"HGWS"
+
+
+def word_mask(word):
+    mask = 0
+    for c in word:
+        if "A" <= c <= "Z": mask |= 1 << (ord(c) - 65)
+    return mask
+
+def pack_u32(values): return struct.pack(f"<{len(values)}I", *values)
+
+
+# =============================================================================
+# CLASS: WORD STORE (Compiled, memory-mapped word bank)
+# =============================================================================
+# words.json stays the editable source. It is compiled once into a single
+# file of packed columns per difficulty:
+#
+#   words:    uint32 offsets[count + 1] + UTF-8 blob (upper-cased)
+#   masks:    uint32 letter mask per word (bit i = letter A+i)
+#   meanings: uint32 offsets[count + 1] + UTF-8 blob
+#   hints:    uint32 offsets[count + 1] + UTF-8 blob
+#
+# The file is mmapped and records are sliced out by index on demand, so
+# picking a word never materialises the bank and a meaning is only decoded
+# when the end-of-round popup asks for it. The header carries the source's
+# mtime/size; editing words.json rebuilds the store on the next start.
+class Column:
+    def __init__(self, mm, offsets_at, blob_at):
+        self.mm = mm
+        self.offsets_at = offsets_at
+        self.blob_at = blob_at
+
+    def get(self, i):
+        start, end = struct.unpack_from("<2I", self.mm, self.offsets_at + 4 * i)
+        return self.mm[self.blob_at + start:self.blob_at + end].decode("utf-8")
+
+
+class WordStore:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            mm = self.mm
+            if mm[:4] != STORE_MAGIC: raise ValueError("not a word store")
+            header_len = int.from_bytes(mm[4:8], "little")
+            self.header = json.loads(mm[8:8 + header_len].decode("utf-8"))
+            if self.header.get("version") != STORE_VERSION: raise ValueError("old word store")
+            self.source = self.header["source"]
+            self.banks = {}
+            for key, info in self.header["banks"].items():
+                self.banks[key] = {
+                    "count": info["count"],
+                    "words": Column(mm, *info["words"]),
+                    "masks": info["masks"],
+                    "meanings": Column(mm, *info["meanings"]),
+                    "hints": Column(mm, *info["hints"]),
+                }
+        except:
+            self.close()
+            raise
+
+    @staticmethod
+    def signature(source_path):
+        st = os.stat(source_path)
+        return [st.st_mtime_ns, st.st_size]
+
+    # Opens the compiled store, rebuilding it first if words.json changed
+    @classmethod
+    def open(cls, source_path, path):
+        sig = cls.signature(source_path)
+        try:
+            store = cls(path)
+            if store.header.get("source") == sig: return store
+            store.close()
+        except (OSError, ValueError, KeyError):
+            pass
+        cls.build(source_path, path, sig)
+        return cls(path)
+
+    @staticmethod
+    def build(source_path, path, sig=None):
+        with open(source_path, "r") as f:
+            data = json.load(f)
+        writer = WordStoreWriter(path, sig or WordStore.signature(source_path))
+        try:
+            for key, entries in data.items():
+                writer.add_key(key)
+                for e in entries:
+                    writer.add(key, e["word"].upper(), e.get("meaning", ""), e.get("hint", "No hint available."))
+            writer.finish()
+        except:
+            writer.abort()
+            raise
+
+    # ---------------------------------------------------
+    # RECORDS
+    # ---------------------------------------------------
+    def keys(self): return list(self.banks)
+    def count(self, key): return self.banks[key]["count"] if key in self.banks else 0
+    def word(self, key, i): return self.banks[key]["words"].get(i)
+    def mask(self, key, i): return struct.unpack_from("<I", self.mm, self.banks[key]["masks"] + 4 * i)[0]
+    def meaning(self, key, i): return self.banks[key]["meanings"].get(i)
+    def hint(self, key, i): return self.banks[key]["hints"].get(i)
+
+    def close(self):
+        self.banks = {}
+        try: self.mm.close()
+        except: pass
+
+
+# =============================================================================
+# CLASS: WORD STORE WRITER (Streams records into the store format)
+# =============================================================================
+# Each column of each difficulty is spooled to its own temp file as records
+# arrive (blob bytes plus a running uint32 offset), so memory stays flat no
+# matter how many words go in. finish() writes the header and copies the
+# spools into the final file in chunks, then swaps it into place atomically.
+SPOOL_COLUMNS = ("words", "meanings", "hints")
+COPY_CHUNK = 1 << 20
+
+
+class WordStoreWriter:
+    def __init__(self, path, source):
+        self.path = path
+        self.source = source
+        folder = os.path.dirname(path) or "."
+        os.makedirs(folder, exist_ok=True)
+        self.spool_dir = tempfile.mkdtemp(prefix=".wordstore-", dir=folder)
+        self.banks = {}
+
+    def add_key(self, key):
+        if key in self.banks: return self.banks[key]
+        bank = {"count": 0, "masks": self.spool(key, "masks")}
+        for col in SPOOL_COLUMNS:
+            bank[col] = [self.spool(key, col + ".off"), self.spool(key, col), 0]
+            bank[col][0].write(pack_u32([0]))
+        self.banks[key] = bank
+        return bank
+
+    def spool(self, key, name):
+        return open(os.path.join(self.spool_dir, f"{len(self.banks)}.{name}"), "w+b")
+
+    def add(self, key, word, meaning, hint):
+        bank = self.add_key(key)
+        bank["count"] += 1
+        bank["masks"].write(pack_u32([word_mask(word)]))
+        for col, value in zip(SPOOL_COLUMNS, (word, meaning, hint)):
+            offsets, blob, end = bank[col]
+            data = value.encode("utf-8")
+            blob.write(data)
+            bank[col][2] = end + len(data)
+            offsets.write(pack_u32([bank[col][2]]))
+
+    def count(self): return sum(bank["count"] for bank in self.banks.values())
+
+    def finish(self):
+        # Lay out every spool (4-byte aligned) relative to the data start
+        order = []
+        layout = {}
+        size = 0
+        for key, bank in self.banks.items():
+            entry = {"count": bank["count"]}
+            for name in ("words", "masks", "meanings", "hints"):
+                files = [bank["masks"]] if name == "masks" else bank[name][:2]
+                spots = []
+                for f in files:
+                    f.flush()
+                    spots.append(size)
+                    order.append(f)
+                    length = f.seek(0, os.SEEK_END)
+                    size += length + (-length % 4)
+                entry[name] = spots[0] if name == "masks" else spots
+            layout[key] = entry
+
+        base = 0
+        while True:
+            shifted = {}
+            for key, entry in layout.items():
+                shifted[key] = {"count": entry["count"], "masks": entry["masks"] + base}
+                for col in SPOOL_COLUMNS: shifted[key][col] = [entry[col][0] + base, entry[col][1] + base]
+            header = json.dumps({"version": STORE_VERSION, "source": self.source, "banks": shifted}).encode("utf-8")
+            start = 8 + len(header)
+            start += -start % 4
+            if start == base: break
+            base = start
+        header += b" " * (base - 8 - len(header))
+
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as out:
+            out.write(STORE_MAGIC + len(header).to_bytes(4, "little") + header)
+            for f in order:
+                f.seek(0)
+                length = 0
+                while True:
+                    chunk = f.read(COPY_CHUNK)
+                    if not chunk: break
+                    out.write(chunk)
+                    length += len(chunk)
+                out.write(b"\0" * (-length % 4))
+        os.replace(tmp, self.path)
+        self.abort()
+
+    # Drops the spools (also the cleanup step after finish)
+    def abort(self):
+        for bank in self.banks.values():
+            bank["masks"].close()
+            for col in SPOOL_COLUMNS:
+                bank[col][0].close()
+                bank[col][1].close()
+        self.banks = {}
+        shutil.rmtree(self.spool_dir, ignore_errors=True)
+
+
+# =============================================================================
+# CLASS: WORD BANK (Same interface over an in-memory dict)
+# =============================================================================
+# For tools and tests that build word lists on the fly; the game itself
+# reads the compiled WordStore.
+class WordBank:
+    def __init__(self, words_data):
+        self.banks = {}
+        for key, entries in words_data.items():
+            words = [e["word"].upper() for e in entries]
+            self.banks[key] = {
+                "count": len(words),
+                "words": words,
+                "masks": [word_mask(w) for w in words],
+                "meanings": [e.get("meaning", "") for e in entries],
+                "hints": [e.get("hint", "No hint available.") for e in entries],
+            }
+
+    def keys(self): return list(self.banks)
+    def count(self, key): return self.banks[key]["count"] if key in self.banks else 0
+    def word(self, key, i): return self.banks[key]["words"][i]
+    def mask(self, key, i): return self.banks[key]["masks"][i]
+    def meaning(self, key, i): return self.banks[key]["meanings"][i]
+    def hint(self, key, i): return self.banks[key]["hints"][i]